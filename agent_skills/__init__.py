@@ -2,44 +2,57 @@
 
 This library provides a security-focused system for managing and executing Agent Skills
 with support for LangChain and ADK frameworks, including autonomous agent capabilities.
-"""
 
-from agent_skills.exceptions import (
-    AgentSkillsError,
-    SkillNotFoundError,
-    SkillParseError,
-    PolicyViolationError,
-    PathTraversalError,
-    ResourceTooLargeError,
-    ScriptExecutionDisabledError,
-    ScriptTimeoutError,
-    ScriptFailedError,
-)
+Public names are resolved lazily on first attribute access (PEP 562), so
+``import agent_skills`` does not import the runtime, agent, or adapter modules
+until one of their exports is used. Set ``AGENT_SKILLS_EAGER_IMPORT=1`` to
+resolve every export at import time (useful in CI to surface import errors).
+"""
 
-from agent_skills.models import (
-    SkillDescriptor,
-    SkillState,
-    ExecutionResult,
-    AuditEvent,
-    SkillSession,
-    ToolResponse,
-    ResourcePolicy,
-    ExecutionPolicy,
-)
+import importlib
+import os
+from typing import TYPE_CHECKING, Any
 
-from agent_skills.observability import AuditSink, JSONLAuditSink, StdoutAuditSink
-from agent_skills.runtime import SkillSessionManager, SkillsRepository
-from agent_skills.agent import AutonomousAgent, ApprovalRequest, ApprovalResponse
-from agent_skills.adapters import (
-    build_asset_response,
-    build_error_response,
-    build_execution_response,
-    build_instructions_response,
-    build_metadata_response,
-    build_reference_response,
-    build_search_response,
-    safe_tool_call,
-)
+if TYPE_CHECKING:
+    from agent_skills.adapters import (
+        build_asset_response,
+        build_error_response,
+        build_execution_response,
+        build_instructions_response,
+        build_metadata_response,
+        build_reference_response,
+        build_search_response,
+        safe_tool_call,
+        safe_tool_call_async,
+        serialize_error_response,
+        serialize_response,
+    )
+    from agent_skills.agent import ApprovalRequest, ApprovalResponse, AutonomousAgent
+    from agent_skills.exceptions import (
+        AgentSkillsError,
+        PathTraversalError,
+        PolicyViolationError,
+        ResourceTooLargeError,
+        ScriptExecutionDisabledError,
+        ScriptFailedError,
+        ScriptTimeoutError,
+        SessionCancelledError,
+        SkillNotFoundError,
+        SkillParseError,
+    )
+    from agent_skills.models import (
+        AuditEvent,
+        ExecutionPolicy,
+        ExecutionResult,
+        ResourceContent,
+        ResourcePolicy,
+        SkillDescriptor,
+        SkillSession,
+        SkillState,
+        ToolResponse,
+    )
+    from agent_skills.observability import AuditSink, JSONLAuditSink, StdoutAuditSink
+    from agent_skills.runtime import SkillSessionManager, SkillsRepository
 
 __version__ = "0.1.0"
 
@@ -54,6 +67,7 @@ __all__ = [
     "ScriptExecutionDisabledError",
     "ScriptTimeoutError",
     "ScriptFailedError",
+    "SessionCancelledError",
     # Models
     "SkillDescriptor",
     "SkillState",
@@ -61,6 +75,7 @@ __all__ = [
     "AuditEvent",
     "SkillSession",
     "ToolResponse",
+    "ResourceContent",
     "ResourcePolicy",
     "ExecutionPolicy",
     # Runtime
@@ -83,4 +98,78 @@ __all__ = [
     "build_reference_response",
     "build_search_response",
     "safe_tool_call",
+    "safe_tool_call_async",
+    "serialize_error_response",
+    "serialize_response",
 ]
+
+# Maps each exported name to the module that defines it
+_LAZY: dict[str, str] = {
+    # Exceptions
+    "AgentSkillsError": "agent_skills.exceptions",
+    "SkillNotFoundError": "agent_skills.exceptions",
+    "SkillParseError": "agent_skills.exceptions",
+    "PolicyViolationError": "agent_skills.exceptions",
+    "PathTraversalError": "agent_skills.exceptions",
+    "ResourceTooLargeError": "agent_skills.exceptions",
+    "ScriptExecutionDisabledError": "agent_skills.exceptions",
+    "ScriptTimeoutError": "agent_skills.exceptions",
+    "ScriptFailedError": "agent_skills.exceptions",
+    "SessionCancelledError": "agent_skills.exceptions",
+    # Models
+    "SkillDescriptor": "agent_skills.models",
+    "SkillState": "agent_skills.models",
+    "ExecutionResult": "agent_skills.models",
+    "AuditEvent": "agent_skills.models",
+    "SkillSession": "agent_skills.models",
+    "ToolResponse": "agent_skills.models",
+    "ResourceContent": "agent_skills.models",
+    "ResourcePolicy": "agent_skills.models",
+    "ExecutionPolicy": "agent_skills.models",
+    # Runtime
+    "SkillSessionManager": "agent_skills.runtime",
+    "SkillsRepository": "agent_skills.runtime",
+    # Autonomous Agent
+    "AutonomousAgent": "agent_skills.agent",
+    "ApprovalRequest": "agent_skills.agent",
+    "ApprovalResponse": "agent_skills.agent",
+    # Observability
+    "AuditSink": "agent_skills.observability",
+    "JSONLAuditSink": "agent_skills.observability",
+    "StdoutAuditSink": "agent_skills.observability",
+    # Tool Response Helpers
+    "build_asset_response": "agent_skills.adapters",
+    "build_error_response": "agent_skills.adapters",
+    "build_execution_response": "agent_skills.adapters",
+    "build_instructions_response": "agent_skills.adapters",
+    "build_metadata_response": "agent_skills.adapters",
+    "build_reference_response": "agent_skills.adapters",
+    "build_search_response": "agent_skills.adapters",
+    "safe_tool_call": "agent_skills.adapters",
+    "safe_tool_call_async": "agent_skills.adapters",
+    "serialize_error_response": "agent_skills.adapters",
+    "serialize_response": "agent_skills.adapters",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve an exported name on first access and cache it in module globals."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including exports that have not been resolved yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.environ.get("AGENT_SKILLS_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,26 @@
+"""Worker pool shared by the framework adapters and the resources layer.
+
+Lives outside both packages so the low-level readers can use it without
+importing the adapters.
+"""
+
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+@functools.cache
+def get_tool_executor() -> ThreadPoolExecutor:
+    """Return the worker pool for async tool calls, creating it on first use.
+
+    Tool calls get their own pool rather than the event loop's default
+    executor, so long-running scripts cannot starve unrelated
+    run_in_executor() work in the host application. The pool is sized like
+    the stdlib default, which suits I/O-bound work. Both the ADK and the
+    LangChain adapters share it, as does the reference search fallback's
+    read-ahead (FullTextSearcher).
+    """
+    return ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) + 4),
+        thread_name_prefix="agent-skills-tool",
+    )
@@ -0,0 +1,71 @@
+"""JSON encoding shared by the models, adapters and audit sinks.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both backends produce the same compact UTF-8 output: non-ASCII
+characters are kept as-is, non-string dict keys are accepted, and dataclass
+instances are encoded field by field.
+"""
+
+import dataclasses
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+
+def dumps(
+    obj: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    pretty: bool = False,
+    newline: bool = False,
+) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON.
+
+    Args:
+        obj: Value to encode
+        default: Called for values JSON cannot represent, e.g. str
+        pretty: Indent the output with two spaces
+        newline: Append a trailing newline
+
+    Returns:
+        The encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=default, option=option)
+
+    def encode(value: Any) -> Any:
+        # orjson encodes dataclasses natively, before falling back to default
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+        if default is None:
+            raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+        return default(value)
+
+    if pretty:
+        text = json.dumps(obj, default=encode, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, default=encode, ensure_ascii=False, separators=(",", ":"))
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
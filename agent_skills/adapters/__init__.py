@@ -9,6 +9,9 @@ from agent_skills.adapters.tool_response import (
     build_reference_response,
     build_search_response,
     safe_tool_call,
+    safe_tool_call_async,
+    serialize_error_response,
+    serialize_response,
 )
 
 __all__ = [
@@ -20,4 +23,7 @@ __all__ = [
     "build_reference_response",
     "build_search_response",
     "safe_tool_call",
+    "safe_tool_call_async",
+    "serialize_error_response",
+    "serialize_response",
 ]
@@ -0,0 +1,421 @@
+"""File helpers shared by the framework adapters' file tools.
+
+The LangChain and ADK adapters both expose check_file, write_file,
+delete_file and list_files tools; the filesystem access and formatting behind
+them live here so the two stay in step. The adapters only parse parameters
+and wrap the result dicts returned here in their response envelopes.
+"""
+
+import codecs
+import contextlib
+import os
+import stat
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+from agent_skills import _json
+from agent_skills.resources.resolver import resolve_within
+
+
+def validate_json(data: bytes) -> None:
+    """Check that data parses as JSON, discarding the result.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    _json.loads(data)
+
+
+# Content validators for write_file, keyed by file suffix. Each takes the
+# encoded content and raises ValueError if it is malformed.
+VALIDATORS: dict[str, Callable[[bytes], None]] = {
+    ".json": validate_json,
+}
+
+
+# Largest content, in encoded bytes, that the write_file tool accepts
+MAX_WRITE_BYTES = 10 * 1024 * 1024
+
+# Chunk size for file tool writes, so a single os.write never copies more
+# than this much of the payload
+WRITE_CHUNK_BYTES = 1 << 20
+
+
+def write_bytes(path: Path, data: bytes, overwrite: bool = True) -> None:
+    """Write already-encoded data to path, creating or replacing it.
+
+    With overwrite=True the data is written to a temporary file next to path,
+    which is then renamed over it. The old file is never truncated in place,
+    so readers (including live memory maps of it) see either the old or the
+    new content. The new file takes the old one's permission bits and, where
+    the process is allowed to set them, its owner and group. A symlink is
+    resolved first, so the file it points to is replaced and the link kept.
+    A file with more than one hard link is instead rewritten in place, so
+    that every link sees the new content.
+
+    With overwrite=False the file is opened with O_EXCL, so the existence
+    check and the create are a single atomic syscall. Missing parent
+    directories are created, but only after the open fails, so writes into
+    an existing directory cost no extra syscalls.
+
+    Raises:
+        FileExistsError: If overwrite is False and path already exists
+        OSError: If the write fails or comes up short
+    """
+    replaced = None
+    if overwrite:
+        path = Path(os.path.realpath(path))
+        replaced = probe(path)
+    in_place = replaced is not None and replaced.st_nlink > 1
+    if overwrite and not in_place:
+        target = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    else:
+        target = path
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if in_place else os.O_EXCL)
+    try:
+        fd = os.open(target, flags, 0o666)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(target, flags, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view[:WRITE_CHUNK_BYTES])
+                if written == 0:
+                    raise OSError(f"Short write to {path}")
+                view = view[written:]
+        finally:
+            os.close(fd)
+        if target != path:
+            if replaced is not None:
+                _copy_ownership(replaced, target)
+            os.replace(target, path)
+    except BaseException:
+        if target != path:
+            with contextlib.suppress(OSError):
+                os.unlink(target)
+        raise
+
+
+def _copy_ownership(source: os.stat_result, target: Path) -> None:
+    """Give target the owner, group and permission bits recorded in source.
+
+    Changing the owner needs privileges most processes lack, so a refused
+    chown is ignored. The mode is set afterwards, since chown can clear the
+    setuid and setgid bits.
+    """
+    if hasattr(os, "chown"):
+        with contextlib.suppress(OSError):
+            os.chown(target, source.st_uid, source.st_gid)
+    os.chmod(target, stat.S_IMODE(source.st_mode))
+
+
+def probe(path: Path) -> os.stat_result | None:
+    """Stat a path once, returning None if it does not exist.
+
+    File tools derive existence, size and type from this single result via
+    stat.S_ISREG/S_ISDIR instead of separate exists()/is_file()/is_dir() calls.
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def format_size(size_bytes: int) -> str:
+    """Format a file size in human-readable form, e.g. 1536 -> "1.5KB".
+
+    The unit is picked from the bit length instead of dividing by 1024 in a
+    loop, so the value is scaled with a single division.
+    """
+    i = min(max(0, (size_bytes.bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f}{SIZE_UNITS[i]}"
+
+
+# Byte order marks checked by probe_encoding, longest first so a UTF-32 LE
+# mark is not mistaken for UTF-16 LE
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def probe_encoding(path: Path) -> str | None:
+    """Detect a file's text encoding from its first 1KB.
+
+    Reads raw bytes with os.read rather than a text-mode open, picks the
+    encoding from a byte order mark if there is one (UTF-8 otherwise), and
+    decodes incrementally so a multi-byte character cut at the 1KB boundary
+    is not reported as a decode error.
+
+    Returns:
+        Encoding name, or None if the file is unreadable or not valid text
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        head = os.read(fd, 1024)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+    encoding = next((name for bom, name in BOMS if head.startswith(bom)), "utf-8")
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+    return encoding
+
+
+def check_file(path: str) -> dict:
+    """Report whether path exists and, if so, its size, type and encoding.
+
+    Absolute paths are only resolved once they are known to exist, so a
+    missing file costs a single stat call.
+
+    Returns:
+        Result dict with "exists" and "path", plus "size", "is_file",
+        "is_dir" and, for regular files, "readable" and "encoding"
+    """
+    file_path = resolve_within(path, resolve_absolute=False)
+
+    # Get file information from a single stat call
+    st = probe(file_path)
+    if st is not None and os.path.isabs(path):
+        file_path = file_path.resolve()
+
+    result = {
+        "exists": st is not None,
+        "path": str(file_path),
+    }
+
+    if st is not None:
+        result["size"] = st.st_size
+        result["is_file"] = stat.S_ISREG(st.st_mode)
+        result["is_dir"] = stat.S_ISDIR(st.st_mode)
+
+        if result["is_file"]:
+            encoding = probe_encoding(file_path)
+            result["readable"] = encoding is not None
+            if encoding is not None:
+                result["encoding"] = encoding
+
+    return result
+
+
+def write_file(path: str, content: str, overwrite: bool = False) -> dict:
+    """Validate content and write it to path as UTF-8.
+
+    Returns:
+        Result dict with "success", "path", "bytes_written", "verified"
+        and "size"
+
+    Raises:
+        ValueError: If the content is too large, fails its suffix's
+            validator, or path exists and overwrite is False
+    """
+    file_path = resolve_within(path)
+
+    # Check content size (max 10MB). Every character encodes to at least
+    # one byte, so oversized content is rejected without encoding it.
+    if len(content) > MAX_WRITE_BYTES:
+        raise ValueError("Content exceeds maximum size (10MB)")
+    content_bytes = content.encode('utf-8')
+    if len(content_bytes) > MAX_WRITE_BYTES:
+        raise ValueError("Content exceeds maximum size (10MB)")
+
+    # Validate structured formats (e.g. .json) from the encoded bytes
+    validator = VALIDATORS.get(file_path.suffix)
+    if validator is not None:
+        try:
+            validator(content_bytes)
+        except ValueError as e:
+            raise ValueError(f"Invalid {file_path.suffix[1:].upper()} content: {e}") from e
+
+    # Write the bytes encoded above, creating parent directories as needed;
+    # write_bytes raises on a short write, so the size is known without
+    # stat-ing the file again, and refuses to replace an existing file unless
+    # overwrite is set
+    try:
+        write_bytes(file_path, content_bytes, overwrite=overwrite)
+    except FileExistsError:
+        raise ValueError(
+            f"File already exists: {path} (use overwrite=true to replace)"
+        ) from None
+
+    return {
+        "success": True,
+        "path": str(file_path),
+        "bytes_written": len(content_bytes),
+        "verified": True,
+        "size": len(content_bytes),
+    }
+
+
+def delete_file(path: str, confirm: bool = False) -> dict:
+    """Delete the regular file at path once confirm is set.
+
+    A symlink is removed itself rather than the file it points to.
+
+    Returns:
+        Result dict with "success", "path", "deleted" and "size"
+
+    Raises:
+        ValueError: If confirm is False, or path is missing or a directory
+    """
+    file_path = Path(path)
+    resolved_path = resolve_within(file_path)
+
+    # Check if confirmation is provided
+    if not confirm:
+        raise ValueError(
+            "Deletion requires confirmation. Set confirm=true to delete the file."
+        )
+
+    # Check existence and type from a single stat call
+    st = probe(resolved_path)
+    if st is None:
+        raise ValueError(f"File does not exist: {path}")
+
+    if stat.S_ISDIR(st.st_mode):
+        raise ValueError(
+            f"Cannot delete directory: {path}. This tool only deletes files."
+        )
+
+    # Delete the file; unlink() raises if it could not be removed, so no
+    # follow-up existence check is needed
+    file_path.unlink()
+
+    return {
+        "success": True,
+        "path": str(resolved_path),
+        "deleted": True,
+        "size": st.st_size,
+    }
+
+
+def list_files(
+    path: str = ".",
+    max_depth: int = 3,
+    show_hidden: bool = False,
+    include_size: bool = False,
+) -> dict:
+    """List path as a tree, like the tree command.
+
+    Returns:
+        Result dict with "path", "is_file", "is_dir", "tree" (the lines
+        joined with newlines) and "total_lines"
+
+    Raises:
+        ValueError: If path does not exist
+    """
+    root_path = resolve_within(path)
+
+    # Check if path exists
+    root_st = probe(root_path)
+    if root_st is None:
+        raise ValueError(f"Path does not exist: {path}")
+    root_is_file = stat.S_ISREG(root_st.st_mode)
+
+    # Build tree structure
+    if root_is_file:
+        # Single file
+        tree_lines = [str(root_path.name)]
+        if include_size:
+            tree_lines[0] += f" ({format_size(root_st.st_size)})"
+    else:
+        # Directory tree
+        tree_lines = [str(root_path) + "/"]
+        tree_lines.extend(
+            _walk_tree(str(root_path), max_depth, show_hidden, include_size)
+        )
+
+    return {
+        "path": str(root_path),
+        "is_file": root_is_file,
+        "is_dir": stat.S_ISDIR(root_st.st_mode),
+        "tree": "\n".join(tree_lines),
+        "total_lines": len(tree_lines),
+    }
+
+
+def _list_entries(
+    dir_path: str, prefix: str, lines: list[str], show_hidden: bool
+) -> list[os.DirEntry]:
+    """Return the sorted, filtered entries of one directory.
+
+    DirEntry caches the type and stat results, so sorting and formatting add
+    no extra syscalls. An unreadable directory adds a placeholder line.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            items = sorted(
+                it, key=lambda x: (not x.is_dir(follow_symlinks=False), x.name.lower())
+            )
+    except PermissionError:
+        lines.append(f"{prefix}[Permission Denied]")
+        return []
+
+    # Filter hidden files if needed
+    if not show_hidden:
+        items = [item for item in items if not item.name.startswith('.')]
+    return items
+
+
+def _walk_tree(
+    root: str, max_depth: int, show_hidden: bool, include_size: bool
+) -> list[str]:
+    """Walk the tree depth-first with an explicit stack and build its lines."""
+    lines: list[str] = []
+
+    # Each frame: [entries of one directory, next index, line prefix, depth]
+    stack = [[_list_entries(root, "", lines, show_hidden), 0, "", 0]]
+    while stack:
+        frame = stack[-1]
+        items, i, prefix, depth = frame
+        if i == len(items):
+            stack.pop()
+            continue
+        frame[1] = i + 1
+
+        item = items[i]
+        is_last = i == len(items) - 1
+        connector = "└── " if is_last else "├── "
+        extension = "    " if is_last else "│   "
+
+        # Build item info; symlinked directories are listed but not entered
+        is_dir = item.is_dir(follow_symlinks=False)
+        item_info = item.name
+        if is_dir:
+            item_info += "/"
+        elif include_size and item.is_file():
+            try:
+                size = item.stat().st_size
+                item_info += f" ({format_size(size)})"
+            except (OSError, PermissionError):
+                pass
+
+        lines.append(f"{prefix}{connector}{item_info}")
+
+        # Descend into directories
+        if is_dir and depth < max_depth:
+            child_prefix = prefix + extension
+            stack.append([
+                _list_entries(item.path, child_prefix, lines, show_hidden),
+                0,
+                child_prefix,
+                depth + 1,
+            ])
+
+    return lines
@@ -16,24 +16,231 @@ ResourcePolicy and ExecutionPolicy for security. Session management is integrate
 for stateful interactions across ADK run loops.
 """
 
-import json
+import asyncio
+import contextvars
+import copy
+import functools
+import threading
+import time
+import types
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Any
 
+from agent_skills._executor import get_tool_executor
+from agent_skills.adapters._files import check_file, delete_file, list_files, write_file
 from agent_skills.adapters.tool_response import (
+    build_asset_response,
     build_error_response,
     build_execution_response,
     build_instructions_response,
     build_metadata_response,
     build_reference_response,
-    build_asset_response,
     build_search_response,
 )
-from agent_skills.models import AuditEvent, SkillState
-from agent_skills.resources.reader import FullTextSearcher
+from agent_skills.exceptions import SessionCancelledError
+from agent_skills.models import AuditEvent, SkillDescriptor, SkillSession, SkillState
 from agent_skills.runtime.repository import SkillsRepository
 from agent_skills.runtime.session import SkillSessionManager
 
+# skills.read dispatch by kind: (path prefix, SkillHandle reader, reader
+# options, response builder, builder path keyword, whether the builder takes
+# the precomputed text size). Assets are memory-mapped and base64-encoded
+# straight from the mapping rather than first copied into a bytes object;
+# their size is always len(content).
+_READ_DISPATCH = {
+    "asset": (
+        "assets/", "load_asset", {"stream": True}, build_asset_response, "asset_path", False
+    ),
+    "reference": (
+        "references/", "load_reference", {}, build_reference_response, "reference_path", True
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _ListParams:
+    """Parameters for skills.list."""
+
+    q: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _ActivateParams:
+    """Parameters for skills.activate."""
+
+    name: str = ""
+    session_id: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _ReadParams:
+    """Parameters for skills.read."""
+
+    name: str = ""
+    path: str = ""
+    kind: str | None = None
+    max_bytes: int | None = None
+    session_id: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _RunParams:
+    """Parameters for skills.run."""
+
+    name: str = ""
+    script_path: str = ""
+    args: list | None = None
+    stdin: str | None = None
+    timeout_s: float | None = None
+    session_id: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _SearchParams:
+    """Parameters for skills.search."""
+
+    name: str = ""
+    query: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class _CheckFileParams:
+    """Parameters for skills.check_file."""
+
+    path: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class _WriteFileParams:
+    """Parameters for skills.write_file."""
+
+    path: str = ""
+    content: str = ""
+    overwrite: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class _DeleteFileParams:
+    """Parameters for skills.delete_file."""
+
+    path: str = ""
+    confirm: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class _ListFilesParams:
+    """Parameters for skills.list_files."""
+
+    path: str = "."
+    max_depth: int = 3
+    show_hidden: bool = False
+    include_size: bool = False
+
+
+@functools.cache
+def _param_spec(cls: type) -> tuple[tuple[str, tuple[type, ...]], ...]:
+    """Resolve a params dataclass into (field name, accepted runtime types) pairs.
+
+    Computed once per class so parsing a call is a single pass over the fields.
+    """
+    hints = typing.get_type_hints(cls)
+    spec = []
+    for f in fields(cls):
+        hint = hints[f.name]
+        args = typing.get_args(hint) if isinstance(hint, types.UnionType) else (hint,)
+        accepted = tuple(typing.get_origin(a) or a for a in args)
+        if float in accepted:
+            accepted += (int,)
+        spec.append((f.name, accepted))
+    return tuple(spec)
+
+
+def _parse_params(cls: type, params: dict[str, Any]) -> Any:
+    """Validate tool parameters against a params dataclass.
+
+    Unknown keys are ignored and missing keys take the field default. Values
+    are not coerced, so a mistyped argument (e.g. max_bytes="100") is
+    rejected here instead of failing deep inside a read or script run.
+
+    Args:
+        cls: One of the _*Params dataclasses
+        params: Raw tool parameters
+
+    Returns:
+        Instance of cls
+
+    Raises:
+        ValueError: If a parameter has the wrong type
+    """
+    values = {}
+    for name, accepted in _param_spec(cls):
+        if name not in params:
+            continue
+        value = params[name]
+        # bool is an int subclass, but True is never a valid byte count
+        if not isinstance(value, accepted) or (
+            isinstance(value, bool) and bool not in accepted
+        ):
+            expected = " | ".join(
+                "null" if t is type(None) else t.__name__ for t in accepted
+            )
+            raise ValueError(
+                f"Invalid parameter '{name}': expected {expected}, "
+                f"got {type(value).__name__}"
+            )
+        values[name] = value
+    return cls(**values)
+
+
+def _check_not_cancelled(session: SkillSession) -> None:
+    """Drop a tool call for a cancelled session before it does any work.
+
+    Raises:
+        SessionCancelledError: If the session has been cancelled
+    """
+    if session.cancel_requested:
+        raise SessionCancelledError(f"Session cancelled: {session.session_id}")
+
+
+# Filtered skill lists keyed by (snapshot_id, query), least recently used
+# first. Snapshot ids are unique across repositories, so the key tells
+# repositories apart without holding a reference to one.
+_FILTERED_SKILLS_CACHE_SIZE = 256
+_filtered_skills_cache: OrderedDict[tuple[int, str], tuple[SkillDescriptor, ...]] = (
+    OrderedDict()
+)
+_filtered_skills_lock = threading.Lock()
+
+
+def _filtered_skills(
+    repository: SkillsRepository,
+    query_lower: str,
+) -> tuple[SkillDescriptor, ...]:
+    """Return skills matching query_lower, ranked by SkillsRepository.search().
+
+    Memoized so repeated list queries (e.g. a model re-issuing the same filter)
+    skip the lookup. The repository's snapshot_id is part of the key, so
+    entries computed before a refresh() are never reused afterwards.
+    """
+    key = (repository.snapshot_id, query_lower)
+    with _filtered_skills_lock:
+        cached = _filtered_skills_cache.get(key)
+        if cached is not None:
+            _filtered_skills_cache.move_to_end(key)
+            return cached
+
+    skills = tuple(repository.search(query_lower))
+
+    with _filtered_skills_lock:
+        _filtered_skills_cache[key] = skills
+        _filtered_skills_cache.move_to_end(key)
+        if len(_filtered_skills_cache) > _FILTERED_SKILLS_CACHE_SIZE:
+            _filtered_skills_cache.popitem(last=False)
+    return skills
+
 
 def _handle_list(
     repository: SkillsRepository,
@@ -41,7 +248,8 @@ def _handle_list(
 ) -> dict[str, Any]:
     """Handle skills.list tool invocation.
 
-    Lists all available skills with optional filtering by query string.
+    Lists all available skills, or those matching a query string ranked by
+    relevance.
 
     Args:
         repository: SkillsRepository instance
@@ -52,18 +260,15 @@ def _handle_list(
     """
     try:
         # Get optional query parameter
-        query = params.get("q")
+        query = _parse_params(_ListParams, params).q
 
-        # Get all skills
-        skills = repository.list()
-
-        # Filter by query if provided
-        if query:
-            query_lower = query.lower()
-            skills = [
-                skill for skill in skills
-                if query_lower in skill.name.lower() or query_lower in skill.description.lower()
-            ]
+        # Get all skills, filtered by query if provided; a blank query
+        # filters nothing, so it skips the search entirely
+        query_lower = query.strip().lower() if query else ""
+        if query_lower:
+            skills = list(_filtered_skills(repository, query_lower))
+        else:
+            skills = repository.list()
 
         # Build response
         response = build_metadata_response(
@@ -100,59 +305,71 @@ def _handle_activate(
     Returns:
         ToolResponse dict with type="instructions" and session metadata
     """
-    skill_name = params.get("name", "")
-    session_id = params.get("session_id")
+    p = _ActivateParams()
 
     try:
+        p = _parse_params(_ActivateParams, params)
+        # One clock read per call, shared by the audit event and session updates
+        ts = time.time_ns()
+        now = datetime.fromtimestamp(ts / 1e9)
+        session_id = p.session_id
+
         # Get or create session
         if session_id:
             session = session_manager.get_session(session_id)
             if not session:
                 raise ValueError(f"Session not found: {session_id}")
+            _check_not_cancelled(session)
         else:
-            session = session_manager.create_session(skill_name)
+            session = session_manager.create_session(p.name)
 
         # Transition to SELECTED if still in DISCOVERED state
         if session.state == SkillState.DISCOVERED:
-            session.transition(SkillState.SELECTED)
+            session.transition(SkillState.SELECTED, now)
 
         # Open skill handle
-        handle = repository.open(skill_name)
+        handle = repository.open(p.name)
 
-        # Load instructions (lazy loaded and cached)
-        instructions = handle.instructions()
+        # A search of the skill's references usually follows activation, so
+        # build their index in the background meanwhile
+        get_tool_executor().submit(repository.warm_references, p.name)
+
+        # Load instructions (lazy loaded and cached) with their digest
+        instructions = handle.load_instructions()
 
         # Update session state to INSTRUCTIONS_LOADED if not already there
         if session.state != SkillState.INSTRUCTIONS_LOADED:
-            session.transition(SkillState.INSTRUCTIONS_LOADED)
-
-        session.add_audit(AuditEvent(
-            ts=datetime.now(),
-            kind="activate",
-            skill=skill_name,
-            path="SKILL.md",
-            bytes=len(instructions.encode("utf-8")),
-            sha256=None,  # Will be computed in build_instructions_response
-            detail={},
-        ))
-        session_manager.update_session(session)
+            session.transition(SkillState.INSTRUCTIONS_LOADED, now)
 
         # Build response with session metadata
         response = build_instructions_response(
-            skill_name=skill_name,
-            instructions=instructions,
+            skill_name=p.name,
+            instructions=instructions.content,
             skill_path="SKILL.md",
             meta={
                 "session_id": session.session_id,
                 "session_state": session.state.value,
             },
+            sha256=instructions.sha256,
+            byte_count=instructions.bytes,
         )
 
+        session.add_audit(AuditEvent(
+            ts=ts,
+            kind="activate",
+            skill=p.name,
+            path="SKILL.md",
+            bytes=response.bytes,
+            sha256=response.sha256,
+            detail={},
+        ), now)
+        session_manager.mark_dirty(session)
+
         return response.to_dict()
 
     except Exception as e:
         error_response = build_error_response(
-            skill_name=skill_name,
+            skill_name=p.name,
             error=e,
             path="SKILL.md",
             include_traceback=False,
@@ -172,70 +389,78 @@ def _handle_read(
     Args:
         repository: SkillsRepository instance
         session_manager: SkillSessionManager for tracking state
-        params: Tool parameters containing 'name', 'path', optional 'max_bytes' and 'session_id'
+        params: Tool parameters containing 'name', 'path', optional 'kind',
+                'max_bytes' and 'session_id'
 
     Returns:
         ToolResponse dict with type="reference" or "asset" and session metadata
     """
-    skill_name = params.get("name", "")
-    path = params.get("path", "")
-    max_bytes = params.get("max_bytes")
-    session_id = params.get("session_id")
+    p = _ReadParams()
 
     try:
+        p = _parse_params(_ReadParams, params)
+        # One clock read per call, shared by the audit event and session updates
+        ts = time.time_ns()
+        now = datetime.fromtimestamp(ts / 1e9)
+        max_bytes = p.max_bytes
+        session_id = p.session_id
+
         # Get session if provided
         session = None
         if session_id:
             session = session_manager.get_session(session_id)
             if not session:
                 raise ValueError(f"Session not found: {session_id}")
+            _check_not_cancelled(session)
 
         # Open skill handle
-        handle = repository.open(skill_name)
-
-        # Determine if this is a reference or asset based on path
-        if path.startswith("assets/"):
-            # Read as asset (binary)
-            asset_path = path[7:]  # Remove "assets/" prefix
-            content = handle.read_asset(asset_path, max_bytes=max_bytes)
-
-            # Build asset response
-            response = build_asset_response(
-                skill_name=skill_name,
-                asset_path=path,
-                content=content,
-                truncated=False,  # TODO: Get truncated flag from handle
-                meta={},
-            )
-        else:
-            # Read as reference (text)
-            # Remove "references/" prefix if present
-            ref_path = path[11:] if path.startswith("references/") else path
-            content = handle.read_reference(ref_path, max_bytes=max_bytes)
-
-            # Build reference response
-            response = build_reference_response(
-                skill_name=skill_name,
-                reference_path=path if path.startswith("references/") else f"references/{path}",
-                content=content,
-                truncated=False,  # TODO: Get truncated flag from handle
-                meta={},
-            )
+        handle = repository.open(p.name)
+
+        # An explicit kind wins; otherwise infer it from the path prefix
+        kind = p.kind
+        if kind is None:
+            kind = "asset" if p.path.startswith("assets/") else "reference"
+        if kind not in _READ_DISPATCH:
+            raise ValueError(f"Invalid kind: {kind!r}. Must be 'reference' or 'asset'")
+        prefix, reader, reader_options, builder, path_kw, sized = _READ_DISPATCH[kind]
+        relpath = p.path.removeprefix(prefix)
+        full_path = prefix + relpath
+
+        loaded = getattr(handle, reader)(relpath, max_bytes=max_bytes, **reader_options)
+
+        response = builder(
+            skill_name=p.name,
+            **{path_kw: full_path},
+            content=loaded.content,
+            truncated=loaded.truncated,
+            meta={},
+            sha256=loaded.sha256,
+            **({"byte_count": loaded.bytes} if sized else {}),
+        )
 
         # Update session if provided
         if session:
-            session.transition(SkillState.RESOURCE_NEEDED)
+            session.transition(SkillState.RESOURCE_NEEDED, now)
             session.add_audit(AuditEvent(
-                ts=datetime.now(),
+                ts=ts,
                 kind="read",
-                skill=skill_name,
-                path=path,
-                bytes=len(content) if isinstance(content, bytes) else len(content.encode("utf-8")),
-                sha256=None,  # Already computed in build_*_response
+                skill=p.name,
+                path=p.path,
+                bytes=response.bytes,
+                sha256=response.sha256,
                 detail={},
-            ))
-            session.add_artifact(f"read_{path}", content)
-            session_manager.update_session(session)
+            ), now)
+            # Keep a reference rather than the content itself; see
+            # SkillSessionManager.fetch_artifact()
+            session.add_artifact(f"read_{p.path}", {
+                "type": "resource_ref",
+                "skill": p.name,
+                "path": full_path,
+                "sha256": response.sha256,
+                "bytes": response.bytes,
+                "max_bytes": max_bytes,
+            }, now)
+            session_manager.mark_dirty(session)
 
             # Add session metadata to response
             response.meta["session_id"] = session.session_id
@@ -245,9 +470,9 @@ def _handle_read(
 
     except Exception as e:
         error_response = build_error_response(
-            skill_name=skill_name,
+            skill_name=p.name,
             error=e,
-            path=path,
+            path=p.path,
             include_traceback=False,
         )
         return error_response.to_dict()
@@ -271,51 +496,55 @@ def _handle_run(
     Returns:
         ToolResponse dict with type="execution_result" and session metadata
     """
-    skill_name = params.get("name", "")
-    script_path = params.get("script_path", "")
-    args = params.get("args")
-    stdin = params.get("stdin")
-    timeout_s = params.get("timeout_s")
-    session_id = params.get("session_id")
+    p = _RunParams()
 
     try:
+        p = _parse_params(_RunParams, params)
+        args = p.args
+        session_id = p.session_id
+
         # Get session if provided
         session = None
         if session_id:
             session = session_manager.get_session(session_id)
             if not session:
                 raise ValueError(f"Session not found: {session_id}")
+            _check_not_cancelled(session)
 
         # Open skill handle
-        handle = repository.open(skill_name)
+        handle = repository.open(p.name)
 
-        # Remove "scripts/" prefix if present
-        script_rel_path = script_path[8:] if script_path.startswith("scripts/") else script_path
+        # Accept paths with or without the "scripts/" prefix
+        script_rel_path = p.script_path.removeprefix("scripts/")
 
         # Execute script
         result = handle.run_script(
             relpath=script_rel_path,
             args=args,
-            stdin=stdin,
-            timeout_s=timeout_s,
+            stdin=p.stdin,
+            timeout_s=p.timeout_s,
         )
 
         # Build execution response
         response = build_execution_response(
-            skill_name=skill_name,
-            script_path=script_path if script_path.startswith("scripts/") else f"scripts/{script_path}",
+            skill_name=p.name,
+            script_path=f"scripts/{script_rel_path}",
             result=result,
             meta={},
         )
 
         # Update session if provided
         if session:
-            session.transition(SkillState.SCRIPT_NEEDED)
+            # One clock read, taken once the script has finished, shared by
+            # the audit event and session updates
+            ts = time.time_ns()
+            now = datetime.fromtimestamp(ts / 1e9)
+            session.transition(SkillState.SCRIPT_NEEDED, now)
             session.add_audit(AuditEvent(
-                ts=datetime.now(),
+                ts=ts,
                 kind="run",
-                skill=skill_name,
-                path=script_path,
+                skill=p.name,
+                path=p.script_path,
                 bytes=None,
                 sha256=None,
                 detail={
@@ -323,9 +552,9 @@ def _handle_run(
                     "exit_code": result.exit_code,
                     "duration_ms": result.duration_ms,
                 },
-            ))
-            session.add_artifact("execution_result", result.to_dict())
-            session_manager.update_session(session)
+            ), now)
+            session.add_artifact("execution_result", result.to_dict(), now)
+            session_manager.mark_dirty(session)
 
             # Add session metadata to response
             response.meta["session_id"] = session.session_id
@@ -335,9 +564,9 @@ def _handle_run(
 
     except Exception as e:
         error_response = build_error_response(
-            skill_name=skill_name,
+            skill_name=p.name,
             error=e,
-            path=script_path,
+            path=p.script_path,
             include_traceback=False,
         )
         return error_response.to_dict()
@@ -349,7 +578,8 @@ def _handle_search(
 ) -> dict[str, Any]:
     """Handle skills.search tool invocation.
 
-    Performs full-text search across all files in a skill's references/ directory.
+    Performs ranked full-text search across all files in a skill's references/
+    directory, using the repository's reference index.
 
     Args:
         repository: SkillsRepository instance
@@ -358,27 +588,18 @@ def _handle_search(
     Returns:
         ToolResponse dict with type="search_results"
     """
-    skill_name = params.get("name", "")
-    query = params.get("query", "")
+    p = _SearchParams()
 
     try:
-        # Open skill handle
-        handle = repository.open(skill_name)
-
-        # Get references directory path
-        references_dir = handle.descriptor().path / "references"
+        p = _parse_params(_SearchParams, params)
+        query = p.query
 
-        # Perform search
-        searcher = FullTextSearcher()
-        results = searcher.search(
-            directory=references_dir,
-            query=query,
-            max_results=20,
-        )
+        # Ranked lookup in the repository's reference index
+        results = repository.search_references(p.name, query, max_results=20)
 
         # Build search response
         response = build_search_response(
-            skill_name=skill_name,
+            skill_name=p.name,
             query=query,
             results=results,
             meta={},
@@ -388,7 +609,7 @@ def _handle_search(
 
     except Exception as e:
         error_response = build_error_response(
-            skill_name=skill_name,
+            skill_name=p.name,
             error=e,
             include_traceback=False,
         )
@@ -408,45 +629,18 @@ def _handle_check_file(
     Returns:
         ToolResponse dict with type="file_check"
     """
-    from pathlib import Path
-
-    path = params.get("path", "")
+    p = _CheckFileParams()
 
     try:
-        file_path = Path(path)
-
-        # Check for path traversal
-        if ".." in str(file_path):
-            raise ValueError("Invalid path: directory traversal detected")
-
-        # Get file information
-        result = {
-            "exists": file_path.exists(),
-            "path": str(file_path.resolve()),
-        }
-
-        if result["exists"]:
-            stat = file_path.stat()
-            result["size"] = stat.st_size
-            result["is_file"] = file_path.is_file()
-            result["is_dir"] = file_path.is_dir()
-
-            if file_path.is_file():
-                # Try to determine if readable
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        f.read(1024)  # Try reading first 1KB
-                    result["readable"] = True
-                    result["encoding"] = "utf-8"
-                except (UnicodeDecodeError, PermissionError):
-                    result["readable"] = False
+        p = _parse_params(_CheckFileParams, params)
+        result = check_file(p.path)
 
         # Build response
         response = {
             "ok": True,
             "type": "file_check",
             "skill": "system",
-            "path": path,
+            "path": p.path,
             "content": result,
             "bytes": None,
             "sha256": None,
@@ -460,7 +654,7 @@ def _handle_check_file(
         error_response = build_error_response(
             skill_name="system",
             error=e,
-            path=path,
+            path=p.path,
             include_traceback=False,
         )
         return error_response.to_dict()
@@ -479,64 +673,20 @@ def _handle_write_file(
     Returns:
         ToolResponse dict with type="file_write"
     """
-    from pathlib import Path
-
-    path = params.get("path", "")
-    content = params.get("content", "")
-    overwrite = params.get("overwrite", False)
+    p = _WriteFileParams()
 
     try:
-        file_path = Path(path)
-
-        # Check for path traversal
-        if ".." in str(file_path):
-            raise ValueError("Invalid path: directory traversal detected")
-
-        # Check if file exists
-        if file_path.exists() and not overwrite:
-            raise ValueError(f"File already exists: {path} (use overwrite=true to replace)")
-
-        # Validate JSON if .json extension
-        if str(file_path).endswith('.json'):
-            try:
-                json.loads(content)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON content: {e}")
-
-        # Check content size (max 10MB)
-        content_bytes = content.encode('utf-8')
-        if len(content_bytes) > 10 * 1024 * 1024:
-            raise ValueError("Content exceeds maximum size (10MB)")
-
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        # Verify write
-        if not file_path.exists():
-            raise ValueError("File write completed but verification failed")
-
-        actual_size = file_path.stat().st_size
+        p = _parse_params(_WriteFileParams, params)
+        result = write_file(p.path, p.content, overwrite=p.overwrite)
 
         # Build response
-        result = {
-            "success": True,
-            "path": str(file_path.resolve()),
-            "bytes_written": len(content_bytes),
-            "verified": True,
-            "size": actual_size,
-        }
-
         response = {
             "ok": True,
             "type": "file_write",
             "skill": "system",
-            "path": path,
+            "path": p.path,
             "content": result,
-            "bytes": actual_size,
+            "bytes": result["size"],
             "sha256": None,
             "truncated": False,
             "meta": {},
@@ -548,7 +698,7 @@ def _handle_write_file(
         error_response = build_error_response(
             skill_name="system",
             error=e,
-            path=path,
+            path=p.path,
             include_traceback=False,
         )
         return error_response.to_dict()
@@ -567,60 +717,20 @@ def _handle_delete_file(
     Returns:
         ToolResponse dict with type="file_delete"
     """
-    from pathlib import Path
-
-    path = params.get("path", "")
-    confirm = params.get("confirm", False)
+    p = _DeleteFileParams()
 
     try:
-        file_path = Path(path)
-
-        # Check for path traversal
-        if ".." in str(file_path):
-            raise ValueError("Invalid path: directory traversal detected")
-
-        # Check if confirmation is provided
-        if not confirm:
-            raise ValueError(
-                "Deletion requires confirmation. Set confirm=true to delete the file."
-            )
-
-        # Check if file exists
-        if not file_path.exists():
-            raise ValueError(f"File does not exist: {path}")
-
-        # Check if it's a directory
-        if file_path.is_dir():
-            raise ValueError(
-                f"Cannot delete directory: {path}. This tool only deletes files."
-            )
-
-        # Get file info before deletion
-        file_size = file_path.stat().st_size
-        resolved_path = str(file_path.resolve())
-
-        # Delete the file
-        file_path.unlink()
-
-        # Verify deletion
-        if file_path.exists():
-            raise ValueError("File deletion completed but verification failed")
+        p = _parse_params(_DeleteFileParams, params)
+        result = delete_file(p.path, confirm=p.confirm)
 
         # Build response
-        result = {
-            "success": True,
-            "path": resolved_path,
-            "deleted": True,
-            "size": file_size,
-        }
-
         response = {
             "ok": True,
             "type": "file_delete",
             "skill": "system",
-            "path": path,
+            "path": p.path,
             "content": result,
-            "bytes": file_size,
+            "bytes": result["size"],
             "sha256": None,
             "truncated": False,
             "meta": {},
@@ -632,7 +742,7 @@ def _handle_delete_file(
         error_response = build_error_response(
             skill_name="system",
             error=e,
-            path=path,
+            path=p.path,
             include_traceback=False,
         )
         return error_response.to_dict()
@@ -652,110 +762,31 @@ def _handle_list_files(
     Returns:
         ToolResponse dict with type="file_list"
     """
-    from pathlib import Path
-
-    path = params.get("path", ".")
-    max_depth = params.get("max_depth", 3)
-    show_hidden = params.get("show_hidden", False)
-    include_size = params.get("include_size", False)
+    p = _ListFilesParams()
 
     try:
-        root_path = Path(path)
-
-        # Check for path traversal
-        if ".." in str(root_path):
-            raise ValueError("Invalid path: directory traversal detected")
-
-        # Check if path exists
-        if not root_path.exists():
-            raise ValueError(f"Path does not exist: {path}")
-
-        def format_size(size_bytes: int) -> str:
-            """Format file size in human-readable format."""
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size_bytes < 1024.0:
-                    return f"{size_bytes:.1f}{unit}"
-                size_bytes /= 1024.0
-            return f"{size_bytes:.1f}TB"
-
-        def walk_directory(dir_path: Path, prefix: str = "", depth: int = 0) -> list[str]:
-            """Recursively walk directory and build tree structure."""
-            if depth > max_depth:
-                return []
-
-            lines = []
-
-            try:
-                # Get all items in directory
-                items = sorted(dir_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-
-                # Filter hidden files if needed
-                if not show_hidden:
-                    items = [item for item in items if not item.name.startswith('.')]
-
-                for i, item in enumerate(items):
-                    is_last = i == len(items) - 1
-                    connector = "└── " if is_last else "├── "
-                    extension = "    " if is_last else "│   "
-
-                    # Build item info
-                    item_info = item.name
-                    if item.is_dir():
-                        item_info += "/"
-                    elif include_size and item.is_file():
-                        try:
-                            size = item.stat().st_size
-                            item_info += f" ({format_size(size)})"
-                        except (OSError, PermissionError):
-                            pass
-
-                    lines.append(f"{prefix}{connector}{item_info}")
-
-                    # Recurse into directories
-                    if item.is_dir() and depth < max_depth:
-                        sub_lines = walk_directory(item, prefix + extension, depth + 1)
-                        lines.extend(sub_lines)
-
-            except PermissionError:
-                lines.append(f"{prefix}[Permission Denied]")
-
-            return lines
-
-        # Build tree structure
-        if root_path.is_file():
-            # Single file
-            tree_lines = [str(root_path.name)]
-            if include_size:
-                size = root_path.stat().st_size
-                tree_lines[0] += f" ({format_size(size)})"
-        else:
-            # Directory tree
-            tree_lines = [str(root_path.resolve()) + "/"]
-            tree_lines.extend(walk_directory(root_path))
-
-        # Build result
-        result = {
-            "path": str(root_path.resolve()),
-            "is_file": root_path.is_file(),
-            "is_dir": root_path.is_dir(),
-            "tree": "\n".join(tree_lines),
-            "total_lines": len(tree_lines),
-        }
+        p = _parse_params(_ListFilesParams, params)
+        result = list_files(
+            p.path,
+            max_depth=p.max_depth,
+            show_hidden=p.show_hidden,
+            include_size=p.include_size,
+        )
 
         # Build response
         response = {
             "ok": True,
             "type": "file_list",
             "skill": "system",
-            "path": path,
+            "path": p.path,
             "content": result,
             "bytes": None,
             "sha256": None,
             "truncated": False,
             "meta": {
-                "max_depth": max_depth,
-                "show_hidden": show_hidden,
-                "include_size": include_size,
+                "max_depth": p.max_depth,
+                "show_hidden": p.show_hidden,
+                "include_size": p.include_size,
             },
         }
 
@@ -765,12 +796,277 @@ def _handle_list_files(
         error_response = build_error_response(
             skill_name="system",
             error=e,
-            path=path,
+            path=p.path,
             include_traceback=False,
         )
         return error_response.to_dict()
 
 
+# Tool metadata shared by every toolset build; only the handlers are created
+# per repository/session manager. Treat these as read-only.
+_LIST_TOOL = {
+    "name": "skills.list",
+    "description": (
+        "List all available skills with metadata (name, description, path, etc.). "
+        "Optionally filter by query string matching skill names or descriptions."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "q": {
+                "type": "string",
+                "description": "Optional filter query to search skill names and descriptions",
+            },
+        },
+    },
+}
+
+_ACTIVATE_TOOL = {
+    "name": "skills.activate",
+    "description": (
+        "Activate a skill and load its instructions from SKILL.md. "
+        "Returns the full markdown body with usage instructions, examples, and guidance. "
+        "Creates or updates a session for stateful interaction tracking."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "Name of the skill to activate",
+            },
+            "session_id": {
+                "type": "string",
+                "description": "Optional session ID to resume an existing session",
+            },
+        },
+        "required": ["name"],
+    },
+}
+
+_READ_TOOL = {
+    "name": "skills.read",
+    "description": (
+        "Read a file from a skill's references/ or assets/ directory. "
+        "Provide the skill name, the kind ('reference' or 'asset') and the path "
+        "within that directory (e.g., kind='reference', path='api-docs.md'). "
+        "Text files are returned as strings, binary files as base64-encoded content. "
+        "To read several files, issue one read per file in parallel. "
+        "Updates session state if session_id is provided."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "Name of the skill",
+            },
+            "kind": {
+                "type": "string",
+                "enum": ["reference", "asset"],
+                "description": (
+                    "Which directory to read from. If omitted, paths starting with "
+                    "'assets/' are assets and everything else is a reference"
+                ),
+            },
+            "path": {
+                "type": "string",
+                "description": "Relative path to file in references/ or assets/ directory",
+            },
+            "max_bytes": {
+                "type": "integer",
+                "description": "Maximum bytes to read (optional)",
+            },
+            "session_id": {
+                "type": "string",
+                "description": "Optional session ID for state tracking",
+            },
+        },
+        "required": ["name", "path"],
+    },
+}
+
+_RUN_TOOL = {
+    "name": "skills.run",
+    "description": (
+        "Execute a script from a skill's scripts/ directory. "
+        "Provide the skill name and relative path (e.g., 'process.py' for scripts/process.py). "
+        "Optionally provide command-line arguments, stdin, and timeout. "
+        "Returns execution result with exit code, stdout, stderr, and duration. "
+        "Updates session state if session_id is provided."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "Name of the skill",
+            },
+            "script_path": {
+                "type": "string",
+                "description": "Relative path to script in scripts/ directory",
+            },
+            "args": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Command-line arguments for the script",
+            },
+            "stdin": {
+                "type": "string",
+                "description": "Standard input for the script",
+            },
+            "timeout_s": {
+                "type": "integer",
+                "description": "Timeout in seconds (optional)",
+            },
+            "session_id": {
+                "type": "string",
+                "description": "Optional session ID for state tracking",
+            },
+        },
+        "required": ["name", "script_path"],
+    },
+}
+
+_SEARCH_TOOL = {
+    "name": "skills.search",
+    "description": (
+        "Search for text in a skill's references/ directory. "
+        "Performs case-insensitive full-text search across all reference files. "
+        "Returns matching lines with file path, line number, and context."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "Name of the skill",
+            },
+            "query": {
+                "type": "string",
+                "description": "Search query string",
+            },
+        },
+        "required": ["name", "query"],
+    },
+}
+
+_CHECK_FILE_TOOL = {
+    "name": "skills.check_file",
+    "description": (
+        "Check if a file exists and get its properties (size, type, etc.). "
+        "Returns information about the file including whether it exists, size, and type. "
+        "Use this before reading files or after script execution to verify outputs."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": (
+                    "File path to check; relative paths must stay within the working "
+                    "directory, absolute paths are not restricted"
+                ),
+            },
+        },
+        "required": ["path"],
+    },
+}
+
+_WRITE_FILE_TOOL = {
+    "name": "skills.write_file",
+    "description": (
+        "Write content to a file safely. "
+        "Validates JSON content if the file has .json extension. "
+        "By default, will not overwrite existing files unless overwrite=true. "
+        "Maximum file size is 10MB. Use this to create configuration files, schemas, or any text files."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": (
+                    "Output file path; relative paths must stay within the working "
+                    "directory, absolute paths are not restricted"
+                ),
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to write to the file",
+            },
+            "overwrite": {
+                "type": "boolean",
+                "description": "Allow overwriting existing files (default: false)",
+            },
+        },
+        "required": ["path", "content"],
+    },
+}
+
+_DELETE_FILE_TOOL = {
+    "name": "skills.delete_file",
+    "description": (
+        "Delete a file safely. "
+        "Requires confirm=true to actually delete the file. "
+        "Will not delete directories. "
+        "Use this to remove temporary files, clean up outputs, or delete unwanted files."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": (
+                    "File path to delete; relative paths must stay within the working "
+                    "directory, absolute paths are not restricted"
+                ),
+            },
+            "confirm": {
+                "type": "boolean",
+                "description": "Confirmation flag - must be true to delete the file",
+            },
+        },
+        "required": ["path", "confirm"],
+    },
+}
+
+_LIST_FILES_TOOL = {
+    "name": "skills.list_files",
+    "description": (
+        "List files and directories in a tree-like structure. "
+        "Recursively walks through directories up to max_depth. "
+        "Similar to the 'tree' command. "
+        "Use this to explore directory structures and find files."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": (
+                    "Directory or file path to list (default: current directory); "
+                    "relative paths must stay within the working directory, "
+                    "absolute paths are not restricted"
+                ),
+            },
+            "max_depth": {
+                "type": "integer",
+                "description": "Maximum depth to recurse (default: 3)",
+            },
+            "show_hidden": {
+                "type": "boolean",
+                "description": "Show hidden files (starting with .) (default: false)",
+            },
+            "include_size": {
+                "type": "boolean",
+                "description": "Include file sizes in output (default: false)",
+            },
+        },
+    },
+}
+
+
 def build_adk_toolset(
     repository: SkillsRepository,
     session_manager: SkillSessionManager | None = None,
@@ -784,14 +1080,19 @@ def build_adk_toolset(
     Args:
         repository: SkillsRepository instance with discovered skills
         session_manager: Optional SkillSessionManager for session tracking.
-                        If not provided, a new manager will be created.
+                        If not provided, a manager is created and reused for
+                        later calls with the same repository.
 
     Returns:
-        List of ADK tool specification dicts, each containing:
+        List of ADK tool specification dicts, copied on every call (input
+        schemas included) so callers may modify them. Each contains:
         - name: Tool name (e.g., "skills.list")
         - description: Human-readable description
         - input_schema: JSON Schema for tool parameters
         - handler: Callable that takes params dict and returns response dict
+        - async_handler: Coroutine function with the same contract that runs
+          the handler in a worker thread, so parallel tool calls issued in
+          one turn can be awaited together (e.g. with asyncio.gather)
 
     Example:
         >>> from pathlib import Path
@@ -810,249 +1111,77 @@ def build_adk_toolset(
         ...     "tools": tools,
         ...     "system_prompt": repo.to_prompt(format="json"),
         ... }
+        >>>
+        >>> # Run parallel tool calls concurrently
+        >>> read = next(t for t in tools if t["name"] == "skills.read")
+        >>> results = await asyncio.gather(
+        ...     read["async_handler"]({"name": "data-processor", "path": "a.md"}),
+        ...     read["async_handler"]({"name": "data-processor", "path": "b.md"}),
+        ... )
+    """
+    # The specs are memoized in the adapter_cache of the object that owns the
+    # state their handlers bind: the session manager, or the repository when
+    # its default manager is used. They live exactly as long as that object.
+    owner = repository if session_manager is None else session_manager
+    key = ("adk_toolset", repository)
+    specs = owner.adapter_cache.get(key)
+    if specs is None:
+        specs = owner.adapter_cache.setdefault(key, _build_toolset(repository, session_manager))
+    # The schemas are nested dicts shared with the module-level tool
+    # definitions, so they are copied too; the handlers are shared
+    return [{**spec, "input_schema": copy.deepcopy(spec["input_schema"])} for spec in specs]
+
+
+def _async_handler(handler: Any) -> Any:
+    """Wrap a synchronous tool handler as a coroutine function.
+
+    Handlers spend their time in file reads and subprocesses, which release
+    the GIL, so running them on the tool worker pool lets concurrent calls
+    (e.g. a skills.read and a skills.run in the same turn) overlap their I/O
+    instead of serializing on the event loop. Context variables are carried
+    over, as with asyncio.to_thread.
+    """
+    async def run(params: dict[str, Any]) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, handler, params)
+        return await loop.run_in_executor(get_tool_executor(), call)
+
+    return run
+
+
+def _build_toolset(
+    repository: SkillsRepository,
+    session_manager: SkillSessionManager | None,
+) -> tuple[dict[str, Any], ...]:
+    """Build the tool specs for a repository/session manager pair.
+
+    build_adk_toolset() memoizes the result, so agents that are re-instantiated
+    against the same objects reuse one set of handlers instead of rebuilding
+    them.
     """
     # Create session manager if not provided
     if session_manager is None:
         session_manager = SkillSessionManager(repository)
 
-    return [
-        {
-            "name": "skills.list",
-            "description": (
-                "List all available skills with metadata (name, description, path, etc.). "
-                "Optionally filter by query string matching skill names or descriptions."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "q": {
-                        "type": "string",
-                        "description": "Optional filter query to search skill names and descriptions",
-                    },
-                },
-            },
-            "handler": lambda params: _handle_list(repository, params),
-        },
+    # functools.partial binds the shared state without adding a Python frame
+    # per call; ADK invokes handlers with the params dict as sole argument
+    specs = (
+        {**_LIST_TOOL, "handler": functools.partial(_handle_list, repository)},
         {
-            "name": "skills.activate",
-            "description": (
-                "Activate a skill and load its instructions from SKILL.md. "
-                "Returns the full markdown body with usage instructions, examples, and guidance. "
-                "Creates or updates a session for stateful interaction tracking."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the skill to activate",
-                    },
-                    "session_id": {
-                        "type": "string",
-                        "description": "Optional session ID to resume an existing session",
-                    },
-                },
-                "required": ["name"],
-            },
-            "handler": lambda params: _handle_activate(repository, session_manager, params),
-        },
-        {
-            "name": "skills.read",
-            "description": (
-                "Read a file from a skill's references/ or assets/ directory. "
-                "Provide the skill name and relative path (e.g., 'api-docs.md' for references/api-docs.md). "
-                "Text files are returned as strings, binary files as base64-encoded content. "
-                "Updates session state if session_id is provided."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the skill",
-                    },
-                    "path": {
-                        "type": "string",
-                        "description": "Relative path to file in references/ or assets/ directory",
-                    },
-                    "max_bytes": {
-                        "type": "integer",
-                        "description": "Maximum bytes to read (optional)",
-                    },
-                    "session_id": {
-                        "type": "string",
-                        "description": "Optional session ID for state tracking",
-                    },
-                },
-                "required": ["name", "path"],
-            },
-            "handler": lambda params: _handle_read(repository, session_manager, params),
-        },
-        {
-            "name": "skills.run",
-            "description": (
-                "Execute a script from a skill's scripts/ directory. "
-                "Provide the skill name and relative path (e.g., 'process.py' for scripts/process.py). "
-                "Optionally provide command-line arguments, stdin, and timeout. "
-                "Returns execution result with exit code, stdout, stderr, and duration. "
-                "Updates session state if session_id is provided."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the skill",
-                    },
-                    "script_path": {
-                        "type": "string",
-                        "description": "Relative path to script in scripts/ directory",
-                    },
-                    "args": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Command-line arguments for the script",
-                    },
-                    "stdin": {
-                        "type": "string",
-                        "description": "Standard input for the script",
-                    },
-                    "timeout_s": {
-                        "type": "integer",
-                        "description": "Timeout in seconds (optional)",
-                    },
-                    "session_id": {
-                        "type": "string",
-                        "description": "Optional session ID for state tracking",
-                    },
-                },
-                "required": ["name", "script_path"],
-            },
-            "handler": lambda params: _handle_run(repository, session_manager, params),
-        },
-        {
-            "name": "skills.search",
-            "description": (
-                "Search for text in a skill's references/ directory. "
-                "Performs case-insensitive full-text search across all reference files. "
-                "Returns matching lines with file path, line number, and context."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the skill",
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "Search query string",
-                    },
-                },
-                "required": ["name", "query"],
-            },
-            "handler": lambda params: _handle_search(repository, params),
-        },
-        {
-            "name": "skills.check_file",
-            "description": (
-                "Check if a file exists and get its properties (size, type, etc.). "
-                "Returns information about the file including whether it exists, size, and type. "
-                "Use this before reading files or after script execution to verify outputs."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "File path to check",
-                    },
-                },
-                "required": ["path"],
-            },
-            "handler": lambda params: _handle_check_file(params),
-        },
-        {
-            "name": "skills.write_file",
-            "description": (
-                "Write content to a file safely. "
-                "Validates JSON content if the file has .json extension. "
-                "By default, will not overwrite existing files unless overwrite=true. "
-                "Maximum file size is 10MB. Use this to create configuration files, schemas, or any text files."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Output file path",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content to write to the file",
-                    },
-                    "overwrite": {
-                        "type": "boolean",
-                        "description": "Allow overwriting existing files (default: false)",
-                    },
-                },
-                "required": ["path", "content"],
-            },
-            "handler": lambda params: _handle_write_file(params),
-        },
-        {
-            "name": "skills.delete_file",
-            "description": (
-                "Delete a file safely. "
-                "Requires confirm=true to actually delete the file. "
-                "Will not delete directories. "
-                "Use this to remove temporary files, clean up outputs, or delete unwanted files."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "File path to delete",
-                    },
-                    "confirm": {
-                        "type": "boolean",
-                        "description": "Confirmation flag - must be true to delete the file",
-                    },
-                },
-                "required": ["path", "confirm"],
-            },
-            "handler": lambda params: _handle_delete_file(params),
-        },
-        {
-            "name": "skills.list_files",
-            "description": (
-                "List files and directories in a tree-like structure. "
-                "Recursively walks through directories up to max_depth. "
-                "Similar to the 'tree' command. "
-                "Use this to explore directory structures and find files."
-            ),
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Directory or file path to list (default: current directory)",
-                    },
-                    "max_depth": {
-                        "type": "integer",
-                        "description": "Maximum depth to recurse (default: 3)",
-                    },
-                    "show_hidden": {
-                        "type": "boolean",
-                        "description": "Show hidden files (starting with .) (default: false)",
-                    },
-                    "include_size": {
-                        "type": "boolean",
-                        "description": "Include file sizes in output (default: false)",
-                    },
-                },
-            },
-            "handler": lambda params: _handle_list_files(params),
+            **_ACTIVATE_TOOL,
+            "handler": functools.partial(_handle_activate, repository, session_manager),
         },
-    ]
+        {**_READ_TOOL, "handler": functools.partial(_handle_read, repository, session_manager)},
+        {**_RUN_TOOL, "handler": functools.partial(_handle_run, repository, session_manager)},
+        {**_SEARCH_TOOL, "handler": functools.partial(_handle_search, repository)},
+        # File tools need no repository state, so their handlers are used as-is
+        {**_CHECK_FILE_TOOL, "handler": _handle_check_file},
+        {**_WRITE_FILE_TOOL, "handler": _handle_write_file},
+        {**_DELETE_FILE_TOOL, "handler": _handle_delete_file},
+        {**_LIST_FILES_TOOL, "handler": _handle_list_files},
+    )
+
+    for spec in specs:
+        spec["async_handler"] = _async_handler(spec["handler"])
+
+    return specs
@@ -15,11 +15,14 @@ All tools return unified JSON responses using the ToolResponse format and apply
 ResourcePolicy and ExecutionPolicy for security.
 """
 
-import json
-from pathlib import Path
+import asyncio
+import contextvars
+import functools
+import threading
+from collections import OrderedDict
 from typing import Any, Optional, Type
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 try:
     from langchain.tools import BaseTool
@@ -29,29 +32,100 @@ except ImportError:
         "Install it with: pip install langchain"
     )
 
+from agent_skills._executor import get_tool_executor
+from agent_skills.adapters._files import check_file, delete_file, list_files, write_file
 from agent_skills.adapters.tool_response import (
-    build_error_response,
     build_execution_response,
     build_instructions_response,
     build_metadata_response,
     build_reference_response,
     build_asset_response,
     build_search_response,
+    serialize_error_response,
+    serialize_response,
 )
-from agent_skills.resources.reader import FullTextSearcher
 from agent_skills.runtime.repository import SkillsRepository
 
+# skills_read dispatch by path prefix: (prefix, SkillHandle reader, reader
+# options, response builder, builder path keyword, whether the builder takes
+# the precomputed text size). Paths with neither prefix are references. As in
+# the ADK adapter, assets are memory-mapped and base64-encoded straight from
+# the mapping rather than first copied into a bytes object.
+_READ_PREFIXES = (
+    ("assets/", "load_asset", {"stream": True}, build_asset_response, "asset_path", False),
+    ("references/", "load_reference", {}, build_reference_response, "reference_path", True),
+)
+
+
+# Serialized skills_list responses keyed by (snapshot_id, q), least recently
+# used first. Snapshot ids are unique across repositories, so the key tells
+# repositories apart without holding a reference to one.
+_LIST_RESPONSE_CACHE_SIZE = 128
+_list_response_cache: OrderedDict[tuple[int, str | None], str] = OrderedDict()
+_list_response_lock = threading.Lock()
+
+
+def _list_response_json(repository: SkillsRepository, q: str | None) -> str:
+    """Build the serialized skills_list response for a stripped query.
+
+    Queries go through SkillsRepository.search(), whose index is built once
+    per refresh, so filtering allocates nothing per skill. Memoized so a model
+    re-issuing the same list call gets the cached JSON string instead of
+    re-searching and re-encoding. The repository's snapshot_id is part of the
+    key, so responses computed before a refresh() are never reused afterwards.
+    Errors are raised, not cached.
+    """
+    key = (repository.snapshot_id, q)
+    with _list_response_lock:
+        cached = _list_response_cache.get(key)
+        if cached is not None:
+            _list_response_cache.move_to_end(key)
+            return cached
+
+    # Get all skills, filtered by query if provided
+    skills = repository.search(q.lower()) if q else repository.list()
+
+    response = build_metadata_response(
+        skill_name="all",
+        descriptors=skills,
+        meta={"query": q, "count": len(skills)},
+    )
+    text = serialize_response(response)
+
+    with _list_response_lock:
+        _list_response_cache[key] = text
+        _list_response_cache.move_to_end(key)
+        if len(_list_response_cache) > _LIST_RESPONSE_CACHE_SIZE:
+            _list_response_cache.popitem(last=False)
+    return text
+
+
+class _SkillsBaseTool(BaseTool):
+    """Base class for the skills tools.
+
+    Async calls (ainvoke, or an agent fanning out parallel tool calls) run
+    the synchronous _run on the shared tool worker pool instead of the event
+    loop's default executor, the same pool the ADK async handlers use.
+    Context variables are carried over, as with asyncio.to_thread.
+    """
+
+    async def _arun(self, *args: Any, **kwargs: Any) -> str:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, self._run, *args, **kwargs)
+        return await loop.run_in_executor(get_tool_executor(), call)
+
 
 class SkillsListInput(BaseModel):
     """Input schema for skills.list tool."""
     q: Optional[str] = Field(None, description="Optional filter query to search skill names and descriptions")
 
 
-class SkillsListTool(BaseTool):
+class SkillsListTool(_SkillsBaseTool):
     """LangChain tool for listing all available skills.
 
     This tool returns metadata for all discovered skills in the repository.
-    Optionally filters skills by a query string matching name or description.
+    Optionally filters skills by a query string matching name or description,
+    ranked by relevance.
     """
 
     name: str = "skills_list"
@@ -82,33 +156,12 @@ class SkillsListTool(BaseTool):
             JSON string containing ToolResponse
         """
         try:
-            # Get all skills
-            skills = self.repository.list()
-
-            # Filter by query if provided
-            if q:
-                query_lower = q.lower()
-                skills = [
-                    skill for skill in skills
-                    if query_lower in skill.name.lower() or query_lower in skill.description.lower()
-                ]
-
-            # Build response
-            response = build_metadata_response(
-                skill_name="all",
-                descriptors=skills,
-                meta={"query": q, "count": len(skills)},
-            )
-
-            return json.dumps(response.to_dict(), indent=2)
+            # Strip before the lookup, so padded queries share the entry of the
+            # bare one, and a blank query lists everything without a search
+            return _list_response_json(self.repository, (q or "").strip() or None)
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name="all",
-                error=e,
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response("all", e)
 
 
 class SkillsActivateInput(BaseModel):
@@ -116,11 +169,13 @@ class SkillsActivateInput(BaseModel):
     name: str = Field(..., description="Name of the skill to activate")
 
 
-class SkillsActivateTool(BaseTool):
+class SkillsActivateTool(_SkillsBaseTool):
     """LangChain tool for activating a skill and loading its instructions.
 
     This tool loads the SKILL.md body content for a specific skill.
-    The content is cached after first load for performance.
+    The content is cached after first load for performance, and so is the
+    serialized response for as long as the repository hands out the same
+    skill handle (until SKILL.md changes or the repository is refreshed).
     """
 
     name: str = "skills_activate"
@@ -132,6 +187,9 @@ class SkillsActivateTool(BaseTool):
 
     repository: Any
 
+    # Serialized response per skill name, with the handle it was built from
+    _responses: dict[str, tuple[Any, str]] = PrivateAttr(default_factory=dict)
+
     def __init__(self, repository: SkillsRepository, **kwargs):
         """Initialize with repository.
 
@@ -153,27 +211,33 @@ class SkillsActivateTool(BaseTool):
             # Open skill handle
             handle = self.repository.open(name)
 
-            # Load instructions (lazy loaded and cached)
-            instructions = handle.instructions()
+            cached = self._responses.get(name)
+            if cached is not None and cached[0] is handle:
+                return cached[1]
+
+            # A search of the skill's references usually follows activation,
+            # so build their index in the background meanwhile
+            get_tool_executor().submit(self.repository.warm_references, name)
+
+            # Load instructions (lazy loaded and cached) with their digest
+            instructions = handle.load_instructions()
 
             # Build response
             response = build_instructions_response(
                 skill_name=name,
-                instructions=instructions,
+                instructions=instructions.content,
                 skill_path="SKILL.md",
                 meta={},
+                sha256=instructions.sha256,
+                byte_count=instructions.bytes,
             )
 
-            return json.dumps(response.to_dict(), indent=2)
+            result = serialize_response(response)
+            self._responses[name] = (handle, result)
+            return result
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name=name,
-                error=e,
-                path="SKILL.md",
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response(name, e, path="SKILL.md")
 
 
 class SkillsReadInput(BaseModel):
@@ -183,7 +247,7 @@ class SkillsReadInput(BaseModel):
     max_bytes: Optional[int] = Field(None, description="Maximum bytes to read (optional)")
 
 
-class SkillsReadTool(BaseTool):
+class SkillsReadTool(_SkillsBaseTool):
     """LangChain tool for reading skill resources.
 
     This tool reads files from a skill's references/ or assets/ directories.
@@ -223,46 +287,31 @@ class SkillsReadTool(BaseTool):
             # Open skill handle
             handle = self.repository.open(name)
 
-            # Determine if this is a reference or asset based on path
-            # If path starts with "assets/", treat as asset, otherwise reference
-            if path.startswith("assets/"):
-                # Read as asset (binary)
-                asset_path = path[7:]  # Remove "assets/" prefix
-                content = handle.read_asset(asset_path, max_bytes=max_bytes)
-
-                # Build asset response
-                response = build_asset_response(
-                    skill_name=name,
-                    asset_path=path,
-                    content=content,
-                    truncated=False,  # TODO: Get truncated flag from handle
-                    meta={},
-                )
-            else:
-                # Read as reference (text)
-                # Remove "references/" prefix if present
-                ref_path = path[11:] if path.startswith("references/") else path
-                content = handle.read_reference(ref_path, max_bytes=max_bytes)
-
-                # Build reference response
-                response = build_reference_response(
-                    skill_name=name,
-                    reference_path=path if path.startswith("references/") else f"references/{path}",
-                    content=content,
-                    truncated=False,  # TODO: Get truncated flag from handle
-                    meta={},
-                )
-
-            return json.dumps(response.to_dict(), indent=2)
+            # Assets are read as binary, anything else as a reference (text);
+            # the directory prefix is optional
+            prefix, reader, reader_options, builder, path_kw, sized = next(
+                (entry for entry in _READ_PREFIXES if path.startswith(entry[0])),
+                _READ_PREFIXES[-1],
+            )
+            relpath = path.removeprefix(prefix)
+            full_path = prefix + relpath
 
-        except Exception as e:
-            error_response = build_error_response(
+            loaded = getattr(handle, reader)(relpath, max_bytes=max_bytes, **reader_options)
+
+            response = builder(
                 skill_name=name,
-                error=e,
-                path=path,
-                include_traceback=False,
+                **{path_kw: full_path},
+                content=loaded.content,
+                truncated=loaded.truncated,
+                meta={},
+                sha256=loaded.sha256,
+                **({"byte_count": loaded.bytes} if sized else {}),
             )
-            return json.dumps(error_response.to_dict(), indent=2)
+
+            return serialize_response(response)
+
+        except Exception as e:
+            return serialize_error_response(name, e, path=path)
 
 
 class SkillsRunInput(BaseModel):
@@ -274,7 +323,7 @@ class SkillsRunInput(BaseModel):
     timeout_s: Optional[int] = Field(None, description="Timeout in seconds (optional)")
 
 
-class SkillsRunTool(BaseTool):
+class SkillsRunTool(_SkillsBaseTool):
     """LangChain tool for executing skill scripts.
 
     This tool executes scripts from a skill's scripts/ directory with
@@ -324,8 +373,8 @@ class SkillsRunTool(BaseTool):
             # Open skill handle
             handle = self.repository.open(name)
 
-            # Remove "scripts/" prefix if present
-            script_rel_path = script_path[8:] if script_path.startswith("scripts/") else script_path
+            # Accept paths with or without the "scripts/" prefix
+            script_rel_path = script_path.removeprefix("scripts/")
 
             # Execute script
             result = handle.run_script(
@@ -338,21 +387,15 @@ class SkillsRunTool(BaseTool):
             # Build execution response
             response = build_execution_response(
                 skill_name=name,
-                script_path=script_path if script_path.startswith("scripts/") else f"scripts/{script_path}",
+                script_path=f"scripts/{script_rel_path}",
                 result=result,
                 meta={},
             )
 
-            return json.dumps(response.to_dict(), indent=2)
+            return serialize_response(response)
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name=name,
-                error=e,
-                path=script_path,
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response(name, e, path=script_path)
 
 
 class SkillsSearchInput(BaseModel):
@@ -361,7 +404,7 @@ class SkillsSearchInput(BaseModel):
     query: str = Field(..., description="Search query string")
 
 
-class SkillsSearchTool(BaseTool):
+class SkillsSearchTool(_SkillsBaseTool):
     """LangChain tool for searching skill references.
 
     This tool performs full-text search across all files in a skill's
@@ -397,19 +440,8 @@ class SkillsSearchTool(BaseTool):
             JSON string containing ToolResponse
         """
         try:
-            # Open skill handle
-            handle = self.repository.open(name)
-
-            # Get references directory path
-            references_dir = handle.descriptor().path / "references"
-
-            # Perform search
-            searcher = FullTextSearcher()
-            results = searcher.search(
-                directory=references_dir,
-                query=query,
-                max_results=20,
-            )
+            # Ranked lookup in the repository's reference index
+            results = self.repository.search_references(name, query, max_results=20)
 
             # Build search response
             response = build_search_response(
@@ -419,23 +451,24 @@ class SkillsSearchTool(BaseTool):
                 meta={},
             )
 
-            return json.dumps(response.to_dict(), indent=2)
+            return serialize_response(response)
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name=name,
-                error=e,
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response(name, e)
 
 
 class SkillsCheckFileInput(BaseModel):
     """Input schema for skills_check_file tool."""
-    path: str = Field(..., description="File path to check")
+    path: str = Field(
+        ...,
+        description=(
+            "File path to check; relative paths must stay within the working directory, "
+            "absolute paths are not restricted"
+        ),
+    )
 
 
-class SkillsCheckFileTool(BaseTool):
+class SkillsCheckFileTool(_SkillsBaseTool):
     """LangChain tool for checking if a file exists.
 
     This tool checks if a file exists and returns its properties.
@@ -470,35 +503,7 @@ class SkillsCheckFileTool(BaseTool):
             JSON string containing file information
         """
         try:
-            from pathlib import Path
-
-            file_path = Path(path)
-
-            # Check for path traversal
-            if ".." in str(file_path):
-                raise ValueError("Invalid path: directory traversal detected")
-
-            # Get file information
-            result = {
-                "exists": file_path.exists(),
-                "path": str(file_path.resolve()),
-            }
-
-            if result["exists"]:
-                stat = file_path.stat()
-                result["size"] = stat.st_size
-                result["is_file"] = file_path.is_file()
-                result["is_dir"] = file_path.is_dir()
-
-                if file_path.is_file():
-                    # Try to determine if readable
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            f.read(1024)  # Try reading first 1KB
-                        result["readable"] = True
-                        result["encoding"] = "utf-8"
-                    except (UnicodeDecodeError, PermissionError):
-                        result["readable"] = False
+            result = check_file(path)
 
             # Build response
             response = {
@@ -510,26 +515,26 @@ class SkillsCheckFileTool(BaseTool):
                 "meta": {},
             }
 
-            return json.dumps(response, indent=2)
+            return serialize_response(response)
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name="system",
-                error=e,
-                path=path,
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response("system", e, path=path)
 
 
 class SkillsWriteFileInput(BaseModel):
     """Input schema for skills_write_file tool."""
-    path: str = Field(..., description="Output file path")
+    path: str = Field(
+        ...,
+        description=(
+            "Output file path; relative paths must stay within the working directory, "
+            "absolute paths are not restricted"
+        ),
+    )
     content: str = Field(..., description="Content to write to the file")
     overwrite: Optional[bool] = Field(False, description="Allow overwriting existing files")
 
 
-class SkillsWriteFileTool(BaseTool):
+class SkillsWriteFileTool(_SkillsBaseTool):
     """LangChain tool for writing content to a file.
 
     This tool writes content to a file with validation and safety checks.
@@ -567,84 +572,41 @@ class SkillsWriteFileTool(BaseTool):
             JSON string containing write result
         """
         try:
-            from pathlib import Path
-
-            file_path = Path(path)
-
-            # Check for path traversal
-            if ".." in str(file_path):
-                raise ValueError("Invalid path: directory traversal detected")
-
-            # Check if file exists
-            if file_path.exists() and not overwrite:
-                raise ValueError(f"File already exists: {path} (use overwrite=true to replace)")
-
-            # Validate JSON if .json extension
-            if str(file_path).endswith('.json'):
-                try:
-                    json.loads(content)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON content: {e}")
-
-            # Check content size (max 10MB)
-            content_bytes = content.encode('utf-8')
-            if len(content_bytes) > 10 * 1024 * 1024:
-                raise ValueError("Content exceeds maximum size (10MB)")
-
-            # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            # Verify write
-            if not file_path.exists():
-                raise ValueError("File write completed but verification failed")
-
-            actual_size = file_path.stat().st_size
+            result = write_file(path, content, overwrite=overwrite)
 
             # Build response
-            result = {
-                "success": True,
-                "path": str(file_path.resolve()),
-                "bytes_written": len(content_bytes),
-                "verified": True,
-                "size": actual_size,
-            }
-
             response = {
                 "ok": True,
                 "type": "file_write",
                 "skill": "system",
                 "path": path,
                 "content": result,
-                "bytes": actual_size,
+                "bytes": result["size"],
                 "meta": {},
             }
 
-            return json.dumps(response, indent=2)
+            return serialize_response(response)
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name="system",
-                error=e,
-                path=path,
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response("system", e, path=path)
 
 
 class SkillsDeleteFileInput(BaseModel):
     """Input schema for skills_delete_file tool."""
-    path: str = Field(..., description="File path to delete")
+    path: str = Field(
+        ...,
+        description=(
+            "File path to delete; relative paths must stay within the working directory, "
+            "absolute paths are not restricted"
+        ),
+    )
     confirm: bool = Field(
         False,
         description="Confirmation flag - must be true to delete the file"
     )
 
 
-class SkillsDeleteFileTool(BaseTool):
+class SkillsDeleteFileTool(_SkillsBaseTool):
     """LangChain tool for deleting a file.
 
     This tool deletes a file with safety checks and confirmation requirement.
@@ -681,80 +643,40 @@ class SkillsDeleteFileTool(BaseTool):
             JSON string containing deletion result
         """
         try:
-            from pathlib import Path
-
-            file_path = Path(path)
-
-            # Check for path traversal
-            if ".." in str(file_path):
-                raise ValueError("Invalid path: directory traversal detected")
-
-            # Check if confirmation is provided
-            if not confirm:
-                raise ValueError(
-                    "Deletion requires confirmation. Set confirm=true to delete the file."
-                )
-
-            # Check if file exists
-            if not file_path.exists():
-                raise ValueError(f"File does not exist: {path}")
-
-            # Check if it's a directory
-            if file_path.is_dir():
-                raise ValueError(
-                    f"Cannot delete directory: {path}. This tool only deletes files."
-                )
-
-            # Get file info before deletion
-            file_size = file_path.stat().st_size
-            resolved_path = str(file_path.resolve())
-
-            # Delete the file
-            file_path.unlink()
-
-            # Verify deletion
-            if file_path.exists():
-                raise ValueError("File deletion completed but verification failed")
+            result = delete_file(path, confirm=confirm)
 
             # Build response
-            result = {
-                "success": True,
-                "path": resolved_path,
-                "deleted": True,
-                "size": file_size,
-            }
-
             response = {
                 "ok": True,
                 "type": "file_delete",
                 "skill": "system",
                 "path": path,
                 "content": result,
-                "bytes": file_size,
+                "bytes": result["size"],
                 "meta": {},
             }
 
-            return json.dumps(response, indent=2)
+            return serialize_response(response)
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name="system",
-                error=e,
-                path=path,
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response("system", e, path=path)
 
 
 class SkillsListFilesInput(BaseModel):
     """Input schema for skills_list_files tool."""
-    path: Optional[str] = Field(".", description="Directory or file path to list")
+    path: Optional[str] = Field(
+        ".",
+        description=(
+            "Directory or file path to list; relative paths must stay within the "
+            "working directory, absolute paths are not restricted"
+        ),
+    )
     max_depth: Optional[int] = Field(3, description="Maximum depth to recurse")
     show_hidden: Optional[bool] = Field(False, description="Show hidden files")
     include_size: Optional[bool] = Field(False, description="Include file sizes")
 
 
-class SkillsListFilesTool(BaseTool):
+class SkillsListFilesTool(_SkillsBaseTool):
     """LangChain tool for listing files and directories in tree structure.
 
     This tool lists files and directories recursively, similar to the 'tree' command.
@@ -799,89 +721,12 @@ class SkillsListFilesTool(BaseTool):
             JSON string containing file tree
         """
         try:
-            from pathlib import Path
-
-            root_path = Path(path)
-
-            # Check for path traversal
-            if ".." in str(root_path):
-                raise ValueError("Invalid path: directory traversal detected")
-
-            # Check if path exists
-            if not root_path.exists():
-                raise ValueError(f"Path does not exist: {path}")
-
-            def format_size(size_bytes: int) -> str:
-                """Format file size in human-readable format."""
-                for unit in ['B', 'KB', 'MB', 'GB']:
-                    if size_bytes < 1024.0:
-                        return f"{size_bytes:.1f}{unit}"
-                    size_bytes /= 1024.0
-                return f"{size_bytes:.1f}TB"
-
-            def walk_directory(dir_path: Path, prefix: str = "", depth: int = 0) -> list[str]:
-                """Recursively walk directory and build tree structure."""
-                if depth > max_depth:
-                    return []
-
-                lines = []
-
-                try:
-                    # Get all items in directory
-                    items = sorted(dir_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-
-                    # Filter hidden files if needed
-                    if not show_hidden:
-                        items = [item for item in items if not item.name.startswith('.')]
-
-                    for i, item in enumerate(items):
-                        is_last = i == len(items) - 1
-                        connector = "└── " if is_last else "├── "
-                        extension = "    " if is_last else "│   "
-
-                        # Build item info
-                        item_info = item.name
-                        if item.is_dir():
-                            item_info += "/"
-                        elif include_size and item.is_file():
-                            try:
-                                size = item.stat().st_size
-                                item_info += f" ({format_size(size)})"
-                            except (OSError, PermissionError):
-                                pass
-
-                        lines.append(f"{prefix}{connector}{item_info}")
-
-                        # Recurse into directories
-                        if item.is_dir() and depth < max_depth:
-                            sub_lines = walk_directory(item, prefix + extension, depth + 1)
-                            lines.extend(sub_lines)
-
-                except PermissionError:
-                    lines.append(f"{prefix}[Permission Denied]")
-
-                return lines
-
-            # Build tree structure
-            if root_path.is_file():
-                # Single file
-                tree_lines = [str(root_path.name)]
-                if include_size:
-                    size = root_path.stat().st_size
-                    tree_lines[0] += f" ({format_size(size)})"
-            else:
-                # Directory tree
-                tree_lines = [str(root_path.resolve()) + "/"]
-                tree_lines.extend(walk_directory(root_path))
-
-            # Build result
-            result = {
-                "path": str(root_path.resolve()),
-                "is_file": root_path.is_file(),
-                "is_dir": root_path.is_dir(),
-                "tree": "\n".join(tree_lines),
-                "total_lines": len(tree_lines),
-            }
+            result = list_files(
+                path,
+                max_depth=max_depth,
+                show_hidden=show_hidden,
+                include_size=include_size,
+            )
 
             # Build response
             response = {
@@ -900,16 +745,10 @@ class SkillsListFilesTool(BaseTool):
                 },
             }
 
-            return json.dumps(response, indent=2)
+            return serialize_response(response)
 
         except Exception as e:
-            error_response = build_error_response(
-                skill_name="system",
-                error=e,
-                path=path,
-                include_traceback=False,
-            )
-            return json.dumps(error_response.to_dict(), indent=2)
+            return serialize_error_response("system", e, path=path)
 
 
 def build_langchain_tools(repository: SkillsRepository) -> list[BaseTool]:
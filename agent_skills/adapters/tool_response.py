@@ -1,18 +1,33 @@
 """Helper functions for building ToolResponse objects.
 
 This module provides convenience functions for creating ToolResponse objects
-for different tool operations (list, activate, read, run, search) and for
-converting exceptions to error responses.
+for different tool operations (list, activate, read, run, search), for
+converting exceptions to error responses, and for serializing responses for
+frameworks that expect a JSON string.
 """
 
+import asyncio
 import hashlib
+import inspect
 import traceback
+from collections.abc import Callable
 from typing import Any
 
+from agent_skills import _json
 from agent_skills.exceptions import AgentSkillsError
 from agent_skills.models import ExecutionResult, SkillDescriptor, ToolResponse
 
 
+def _sha256_hex(data: bytes | memoryview) -> str:
+    """Return the hex SHA-256 of data, for response fingerprints.
+
+    The digest is an integrity tag rather than a security control, so it is
+    requested with usedforsecurity=False; on FIPS-enabled OpenSSL builds this
+    skips the approved-provider check and uses the fastest implementation.
+    """
+    return hashlib.sha256(data, usedforsecurity=False).hexdigest()
+
+
 def build_metadata_response(
     skill_name: str,
     descriptors: list[SkillDescriptor],
@@ -48,6 +63,8 @@ def build_instructions_response(
     instructions: str,
     skill_path: str,
     meta: dict | None = None,
+    sha256: str | None = None,
+    byte_count: int | None = None,
 ) -> ToolResponse:
     """Build a success response for skills.activate tool.
 
@@ -56,12 +73,17 @@ def build_instructions_response(
         instructions: The SKILL.md body content
         skill_path: Path to SKILL.md file
         meta: Optional metadata dictionary
+        sha256: Optional precomputed SHA-256 of instructions (skips hashing)
+        byte_count: Optional precomputed UTF-8 length of instructions; with
+                   sha256, avoids encoding the content at all
 
     Returns:
         ToolResponse with type="instructions"
     """
-    content_bytes = instructions.encode("utf-8")
-    sha256_hash = hashlib.sha256(content_bytes).hexdigest()
+    if sha256 is None or byte_count is None:
+        content_bytes = instructions.encode("utf-8")
+        sha256 = sha256 or _sha256_hex(content_bytes)
+        byte_count = len(content_bytes)
 
     return ToolResponse(
         ok=True,
@@ -69,8 +91,8 @@ def build_instructions_response(
         skill=skill_name,
         path=skill_path,
         content=instructions,
-        bytes=len(content_bytes),
-        sha256=sha256_hash,
+        bytes=byte_count,
+        sha256=sha256,
         truncated=False,
         meta=meta or {},
     )
@@ -82,6 +104,8 @@ def build_reference_response(
     content: str,
     truncated: bool = False,
     meta: dict | None = None,
+    sha256: str | None = None,
+    byte_count: int | None = None,
 ) -> ToolResponse:
     """Build a success response for reading a reference file.
 
@@ -91,12 +115,17 @@ def build_reference_response(
         content: The file content
         truncated: Whether the content was truncated
         meta: Optional metadata dictionary
+        sha256: Optional precomputed SHA-256 of content (skips hashing)
+        byte_count: Optional precomputed UTF-8 length of content; with
+                   sha256, avoids encoding the content at all
 
     Returns:
         ToolResponse with type="reference"
     """
-    content_bytes = content.encode("utf-8")
-    sha256_hash = hashlib.sha256(content_bytes).hexdigest()
+    if sha256 is None or byte_count is None:
+        content_bytes = content.encode("utf-8")
+        sha256 = sha256 or _sha256_hex(content_bytes)
+        byte_count = len(content_bytes)
 
     return ToolResponse(
         ok=True,
@@ -104,8 +133,8 @@ def build_reference_response(
         skill=skill_name,
         path=reference_path,
         content=content,
-        bytes=len(content_bytes),
-        sha256=sha256_hash,
+        bytes=byte_count,
+        sha256=sha256,
         truncated=truncated,
         meta=meta or {},
     )
@@ -114,23 +143,26 @@ def build_reference_response(
 def build_asset_response(
     skill_name: str,
     asset_path: str,
-    content: bytes,
+    content: bytes | memoryview,
     truncated: bool = False,
     meta: dict | None = None,
+    sha256: str | None = None,
 ) -> ToolResponse:
     """Build a success response for reading an asset file.
 
     Args:
         skill_name: Name of the skill
         asset_path: Relative path to the asset file
-        content: The binary file content
+        content: The binary file content (bytes or a memoryview, e.g. from
+                SkillHandle.read_asset(..., stream=True))
         truncated: Whether the content was truncated
         meta: Optional metadata dictionary
+        sha256: Optional precomputed SHA-256 of content (skips hashing)
 
     Returns:
         ToolResponse with type="asset"
     """
-    sha256_hash = hashlib.sha256(content).hexdigest()
+    sha256_hash = sha256 or _sha256_hex(content)
 
     return ToolResponse(
         ok=True,
@@ -162,8 +194,10 @@ def build_execution_response(
     Returns:
         ToolResponse with type="execution_result"
     """
-    # Merge result.meta with provided meta
-    merged_meta = {**result.meta, **(meta or {})}
+    # Merge result.meta with provided meta (which wins on conflicts)
+    merged_meta = result.meta.copy()
+    if meta:
+        merged_meta.update(meta)
 
     return ToolResponse(
         ok=True,
@@ -195,11 +229,10 @@ def build_search_response(
     Returns:
         ToolResponse with type="search_results"
     """
-    merged_meta = {
-        "query": query,
-        "result_count": len(results),
-        **(meta or {}),
-    }
+    # Provided meta wins over the computed keys on conflicts
+    merged_meta = {"query": query, "result_count": len(results)}
+    if meta:
+        merged_meta.update(meta)
 
     return ToolResponse(
         ok=True,
@@ -242,16 +275,19 @@ def build_error_response(
         "error_type": error_type,
     }
 
-    # Add additional details for specific error types
-    if hasattr(error, "__dict__"):
+    # Add additional details for specific error types. Most exceptions carry
+    # no instance attributes, so skip the scan when there is nothing to copy.
+    attributes = getattr(error, "__dict__", None)
+    if attributes:
         error_details = {
-            k: v for k, v in error.__dict__.items()
-            if not k.startswith("_") and k not in ("args",)
+            k: v for k, v in attributes.items()
+            if k != "args" and not k.startswith("_")
         }
         if error_details:
             meta["error_details"] = error_details
 
-    # Include traceback if requested
+    # Include traceback if requested; formatting walks the whole stack, so it
+    # is never done on the default path
     if include_traceback:
         meta["traceback"] = traceback.format_exc()
 
@@ -268,6 +304,84 @@ def build_error_response(
     )
 
 
+def serialize_response(response: ToolResponse | dict, pretty: bool = False) -> str:
+    """Serialize a tool response to a JSON string.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Output is compact by default, which is what agents consume;
+    pass pretty=True for human-facing output. Values JSON cannot represent
+    (such as Paths in error details) are converted with str().
+
+    Args:
+        response: ToolResponse, or a response dict already in to_dict() form
+        pretty: Indent the output with two spaces
+
+    Returns:
+        JSON text of the response
+
+    Example:
+        >>> serialize_response(build_error_response("demo", ValueError("bad")))
+        '{"ok":false,"type":"error","skill":"demo",...}'
+    """
+    data = response
+    # The dataclass fields encode directly, in to_dict() order, so only binary
+    # content (which needs base64) goes through to_dict()
+    if isinstance(response, ToolResponse) and isinstance(response.content, (bytes, memoryview)):
+        data = response.to_dict()
+    return _json.dumps(data, default=str, pretty=pretty).decode("utf-8")
+
+
+# Compact serialization of an error response whose meta holds only error_type,
+# with the variable fields left as %s slots (keys in ToolResponse.to_dict order)
+_ERROR_JSON_TEMPLATE = (
+    '{"ok":false,"type":"error","skill":%s,"path":%s,"content":%s,'
+    '"bytes":null,"sha256":null,"truncated":false,"meta":{"error_type":%s}}'
+)
+
+
+def _json_string(value: str | None) -> str:
+    """Encode a string (or None) as a JSON literal, matching serialize_response."""
+    if value is None:
+        return "null"
+    return _json.dumps(value).decode("utf-8")
+
+
+def serialize_error_response(
+    skill_name: str,
+    error: Exception,
+    path: str | None = None,
+) -> str:
+    """Serialize an error response for an exception straight to a JSON string.
+
+    Equivalent to serialize_response(build_error_response(skill_name, error,
+    path)), but errors without extra attributes (the common case, such as an
+    unknown skill name or a path outside the skill) are written into a
+    precomputed template, so only the message strings are encoded.
+
+    Args:
+        skill_name: Name of the skill
+        error: The exception that occurred
+        path: Optional path related to the error
+
+    Returns:
+        Compact JSON text of the error response
+    """
+    attributes = getattr(error, "__dict__", None)
+    has_details = attributes and any(
+        not k.startswith("_") and k != "args" for k in attributes
+    )
+    if has_details or not isinstance(path, (str, type(None))):
+        return serialize_response(build_error_response(skill_name, error, path=path))
+
+    error_type = type(error).__name__
+    return _ERROR_JSON_TEMPLATE % (
+        _json_string(skill_name),
+        _json_string(path),
+        _json_string(f"{error_type}: {error}"),
+        _json_string(error_type),
+    )
+
+
 def safe_tool_call(
     skill_name: str,
     operation: callable,
@@ -302,3 +416,42 @@ def safe_tool_call(
             path=path,
             include_traceback=include_traceback,
         )
+
+
+async def safe_tool_call_async(
+    skill_name: str,
+    operation: Callable[[], Any],
+    path: str | None = None,
+    include_traceback: bool = False,
+) -> ToolResponse:
+    """Async variant of safe_tool_call.
+
+    Coroutine functions are awaited directly; plain callables are run in a
+    worker thread so blocking file or subprocess work does not stall the
+    event loop.
+
+    Args:
+        skill_name: Name of the skill
+        operation: Callable or coroutine function that returns a ToolResponse
+        path: Optional path related to the operation
+        include_traceback: Whether to include full traceback in error responses
+
+    Returns:
+        ToolResponse (either success from operation or error response)
+
+    Example:
+        >>> async def do_work():
+        ...     return build_instructions_response("my-skill", "content", "SKILL.md")
+        >>> response = await safe_tool_call_async("my-skill", do_work)
+    """
+    try:
+        if inspect.iscoroutinefunction(operation):
+            return await operation()
+        return await asyncio.to_thread(operation)
+    except Exception as e:
+        return build_error_response(
+            skill_name=skill_name,
+            error=e,
+            path=path,
+            include_traceback=include_traceback,
+        )
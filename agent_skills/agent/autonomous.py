@@ -9,10 +9,16 @@ from dataclasses import dataclass
 from typing import Callable, Optional, Any
 from pathlib import Path
 import json
+import threading
 
 from agent_skills.runtime import SkillsRepository
 from agent_skills.models import ExecutionPolicy
 
+try:
+    from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+except ImportError:  # Checked in AutonomousAgent.run()
+    HumanMessage = SystemMessage = ToolMessage = None
+
 
 @dataclass
 class ApprovalRequest:
@@ -111,6 +117,11 @@ class AutonomousAgent:
         self.approval_callback = approval_callback
         self.max_iterations = max_iterations
         self.verbose = verbose
+        # Cancellation token of the run in progress, None between runs. Each
+        # run() creates its own, so a cancel() can never outlive its run.
+        self._cancel_event: threading.Event | None = None
+        # (repository snapshot_id, system prompt SystemMessage) from the last run
+        self._system_prompt: tuple[int, Any] | None = None
 
         # Build tools from repository
         self._build_tools()
@@ -122,6 +133,8 @@ class AutonomousAgent:
 
         self.tools = build_langchain_tools(self.repository)
         self.tools_by_name = {tool.name: tool for tool in self.tools}
+        # Bound lazily on first run; binding converts every args_schema to JSON schema
+        self._llm_with_tools = None
 
         if self.verbose:
             print(f"[Agent] Built {len(self.tools)} tools:")
@@ -134,11 +147,38 @@ class AutonomousAgent:
             print(f"  • skills_write_file - Write files")
             print(f"  • skills_delete_file - Delete files")
 
+    def cancel(self) -> None:
+        """Cancel the current run from another thread.
+
+        The agent stops before its next LLM call or tool call; tool calls
+        still queued from the last LLM response are not executed. Only the
+        run in progress is cancelled: once run() has been entered its
+        cancellation token exists, even if its loop has not started yet. A
+        cancel() while no run is in progress does nothing, so it cannot abort
+        a later run.
+        """
+        cancel_event = self._cancel_event
+        if cancel_event is not None:
+            cancel_event.set()
+
     def _log(self, message: str):
         """Log message if verbose mode is enabled."""
         if self.verbose:
             print(message)
 
+    def _get_system_prompt(self) -> Any:
+        """Return the system prompt message, rebuilding it only after a repository refresh.
+
+        The SystemMessage itself is kept, so repeated runs skip both the prompt
+        rendering and the message validation.
+        """
+        snapshot_id = self.repository.snapshot_id
+        if self._system_prompt is None or self._system_prompt[0] != snapshot_id:
+            self._system_prompt = (
+                snapshot_id, SystemMessage(content=self._create_system_prompt())
+            )
+        return self._system_prompt[1]
+
     def _create_system_prompt(self) -> str:
         """Create system prompt with available skills."""
         skills_info = self.repository.to_prompt(format="json")
@@ -332,27 +372,35 @@ determine the best approach.
             >>> result = agent.run("Convert sample.csv to JSON format")
             >>> print(result)
         """
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
         self.current_task = task
+        try:
+            return self._run(task, cancel_event)
+        finally:
+            if self._cancel_event is cancel_event:
+                self._cancel_event = None
 
+    def _run(self, task: str, cancel_event: threading.Event) -> str:
+        """Run the agent loop for run(), stopping once cancel_event is set."""
         self._log("=" * 70)
         self._log(f"[Agent] Starting autonomous execution")
         self._log(f"[Agent] Task: {task}")
         self._log("=" * 70)
 
-        # Import LangChain components
-        try:
-            from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
-        except ImportError:
+        if SystemMessage is None:
             raise ImportError(
                 "LangChain is required for autonomous agent. "
                 "Install with: pip install langchain-core"
             )
 
-        # Bind tools to LLM
-        llm_with_tools = self.llm.bind_tools(self.tools)
+        # Bind tools to LLM once and reuse the binding across runs
+        if self._llm_with_tools is None:
+            self._llm_with_tools = self.llm.bind_tools(self.tools)
+        llm_with_tools = self._llm_with_tools
 
         # Create initial messages
-        system_msg = SystemMessage(content=self._create_system_prompt())
+        system_msg = self._get_system_prompt()
         user_msg = HumanMessage(content=task)
         messages = [system_msg, user_msg]
 
@@ -360,6 +408,9 @@ determine the best approach.
         for iteration in range(self.max_iterations):
             self._log(f"\n[Iteration {iteration + 1}]")
 
+            if cancel_event.is_set():
+                return self._cancelled()
+
             # Get LLM response
             try:
                 ai_msg = llm_with_tools.invoke(messages)
@@ -382,35 +433,48 @@ determine the best approach.
 
                 return final_answer
 
-            # Execute tool calls
-            for tool_call in ai_msg.tool_calls:
-                tool_name = tool_call["name"]
-                tool_args = tool_call["args"]
-
-                self._log(f"  → Calling: {tool_name}")
-
-                # Log args (truncate if too long)
-                args_str = str(tool_args)
-                if len(args_str) > 100:
-                    args_str = args_str[:100] + "..."
-                self._log(f"    Args: {args_str}")
-
-                # Execute tool
-                result = self._execute_tool(tool_name, tool_args)
-
-                # Add tool result to messages
-                tool_msg = ToolMessage(
-                    content=str(result),
-                    tool_call_id=tool_call["id"]
-                )
-                messages.append(tool_msg)
-
-                # Log result (truncate if too long)
-                result_str = str(result)
-                if len(result_str) > 200:
-                    result_str = result_str[:200] + "..."
-                self._log(f"    Result: {result_str}")
+            # Execute tool calls as one turn, so tools working on the same
+            # skill share one handle
+            with self.repository.turn():
+                for tool_call in ai_msg.tool_calls:
+                    if cancel_event.is_set():
+                        return self._cancelled()
+
+                    tool_name = tool_call["name"]
+                    tool_args = tool_call["args"]
+
+                    self._log(f"  → Calling: {tool_name}")
+
+                    # Log args (truncate if too long); skipped entirely when
+                    # not verbose, since stringifying large args is O(n)
+                    if self.verbose:
+                        args_str = str(tool_args)
+                        if len(args_str) > 100:
+                            args_str = args_str[:100] + "..."
+                        self._log(f"    Args: {args_str}")
+
+                    # Execute tool
+                    result = self._execute_tool(tool_name, tool_args)
+
+                    # Add tool result to messages
+                    result_str = str(result)
+                    tool_msg = ToolMessage(
+                        content=result_str,
+                        tool_call_id=tool_call["id"]
+                    )
+                    messages.append(tool_msg)
+
+                    # Log result (truncate if too long)
+                    if self.verbose:
+                        if len(result_str) > 200:
+                            result_str = result_str[:200] + "..."
+                        self._log(f"    Result: {result_str}")
 
         # Max iterations reached
         self._log(f"[Agent] Max iterations ({self.max_iterations}) reached")
         return f"Task incomplete: Maximum iterations ({self.max_iterations}) reached. Please try again with a more specific task or increase max_iterations."
+
+    def _cancelled(self) -> str:
+        """Log and return the result of a cancelled run."""
+        self._log("[Agent] Run cancelled")
+        return "Task cancelled by user."
@@ -3,5 +3,6 @@
 from agent_skills.discovery.scanner import SkillScanner
 from agent_skills.discovery.index import SkillIndexer
 from agent_skills.discovery.cache import MetadataCache
+from agent_skills.discovery.search import SkillSearchIndex
 
-__all__ = ["SkillScanner", "SkillIndexer", "MetadataCache"]
+__all__ = ["SkillScanner", "SkillIndexer", "MetadataCache", "SkillSearchIndex"]
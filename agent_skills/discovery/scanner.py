@@ -1,7 +1,12 @@
 """Filesystem scanning for skill discovery."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Resource directories inside a skill; they hold skill content, not skills
+RESOURCE_DIRS = frozenset({"references", "assets", "scripts"})
+
 
 class SkillScanner:
     """Scans filesystem for skills.
@@ -9,6 +14,11 @@ class SkillScanner:
     A skill is identified by the presence of a SKILL.md file in a directory.
     The scanner recursively searches through provided root directories to find
     all directories containing SKILL.md files.
+
+    The walk uses os.scandir, whose entries carry the file type from the
+    directory listing, so it costs one listing per directory rather than a
+    stat() per entry. The references/, assets/ and scripts/ directories of a
+    skill are not descended into, and multiple roots are scanned in parallel.
     """
 
     def scan(self, roots: list[Path]) -> list[Path]:
@@ -25,20 +35,56 @@ class SkillScanner:
             >>> skills = scanner.scan([Path("./skills"), Path("~/.agent-skills")])
             >>> print(f"Found {len(skills)} skills")
         """
-        skill_paths = []
+        # Expand user home directory if present
+        roots = [root.expanduser() for root in roots]
+
+        if len(roots) <= 1:
+            per_root = [self._scan_root(root) for root in roots]
+        else:
+            # Directory listing releases the GIL, so roots can be walked concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(roots))) as executor:
+                per_root = list(executor.map(self._scan_root, roots))
 
-        for root in roots:
-            # Expand user home directory if present
-            root = root.expanduser()
+        return [skill_dir for skill_dirs in per_root for skill_dir in skill_dirs]
+
+    def _scan_root(self, root: Path) -> list[Path]:
+        """Walk a single root depth-first and collect skill directories.
+
+        Args:
+            root: Root directory to scan
 
-            # Skip if root doesn't exist or isn't a directory
-            if not root.exists() or not root.is_dir():
+        Returns:
+            Skill directories under root, in pre-order
+        """
+        skill_paths: list[Path] = []
+
+        # Skip if root doesn't exist or isn't a directory
+        if not root.is_dir():
+            return skill_paths
+
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                # Unreadable directories are skipped, as with Path.rglob
                 continue
 
-            # Recursively find all SKILL.md files
-            for skill_md in root.rglob("SKILL.md"):
-                # The skill directory is the parent of SKILL.md
-                skill_dir = skill_md.parent
-                skill_paths.append(skill_dir)
+            is_skill = any(
+                entry.name == "SKILL.md" and entry.is_file() for entry in entries
+            )
+            if is_skill:
+                skill_paths.append(directory)
+
+            # Symlinked directories are not followed, matching Path.rglob
+            subdirs = [
+                directory / entry.name
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and not (is_skill and entry.name in RESOURCE_DIRS)
+            ]
+            stack.extend(reversed(subdirs))
 
         return skill_paths
@@ -0,0 +1,439 @@
+"""Ranked full-text search over skill metadata and reference files."""
+
+import bisect
+import functools
+import itertools
+import math
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+
+from ..models import SkillDescriptor
+from ..resources.reader import FullTextSearcher, SearchResult, iter_files
+
+# Maps a batch of texts to one embedding vector per text
+Embedder = Callable[[list[str]], Sequence[Sequence[float]]]
+
+# Reciprocal Rank Fusion constant and per-ranker weights
+RRF_K = 60
+KEYWORD_WEIGHT = 0.5
+SEMANTIC_WEIGHT = 0.5
+
+# Column weights for bm25(): a hit in the skill name counts twice as much as
+# a hit in the description
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 5.0
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _fts5_available() -> bool:
+    """Check whether the linked SQLite library was built with FTS5."""
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(x)")
+        finally:
+            conn.close()
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+
+def _match_expression(query: str) -> str | None:
+    """Build an FTS5 MATCH expression with every query word as a prefix."""
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _normalize(vector: Sequence[float]) -> list[float]:
+    """Scale a vector to unit length so dot products are cosine similarities."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+class SkillSearchIndex:
+    """BM25-ranked index over skill names and descriptions.
+
+    The index is an in-memory SQLite FTS5 table rebuilt from the descriptor
+    list on every repository refresh. Queries are tokenized and each token is
+    matched as a prefix, so "proc csv" finds "data-processor: Process CSV
+    files". Results are ordered by bm25() with names weighted above
+    descriptions.
+
+    Every skill whose name or description contains the query as a
+    case-insensitive substring is matched too, so the results are always a
+    superset of the plain substring filter: "data" finds "bigdata-tool" even
+    though no token starts with "data". Such matches follow the ranked index
+    hits, in registry order. Without FTS5 only the substring scan runs.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._skills: dict[str, SkillDescriptor] = {}
+        # Casefolded "name\x00description" of every skill, joined with "\x00"
+        # separators, the offset where each skill's record starts, and the
+        # descriptor each record belongs to (parallel to _offsets)
+        self._blob = ""
+        self._offsets: list[int] = []
+        self._ordered: list[SkillDescriptor] = []
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        if FTS5_AVAILABLE:
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE skills_fts USING fts5("
+                "name, description, skill_id UNINDEXED, "
+                "tokenize='porter unicode61')"
+            )
+
+    def build(self, descriptors: list[SkillDescriptor]) -> None:
+        """Replace the index contents with the given descriptors.
+
+        Args:
+            descriptors: All skills currently in the repository
+        """
+        with self._lock:
+            self._skills = {desc.name: desc for desc in descriptors}
+            self._ordered = list(self._skills.values())
+            records = [
+                f"{desc.name.casefold()}\x00{desc.description.casefold()}"
+                for desc in self._ordered
+            ]
+            self._offsets = list(itertools.accumulate((len(r) + 1 for r in records), initial=0))
+            self._blob = "\x00".join(records)
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.execute("DELETE FROM skills_fts")
+                self._conn.executemany(
+                    "INSERT INTO skills_fts (name, description, skill_id) VALUES (?, ?, ?)",
+                    [(desc.name, desc.description, desc.name) for desc in descriptors],
+                )
+
+    def search(self, query: str, limit: int | None = None) -> list[SkillDescriptor]:
+        """Return skills matching a query, best match first.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results, or None for all matches
+
+        Returns:
+            List of matching SkillDescriptor objects
+        """
+        match = _match_expression(query)
+        with self._lock:
+            results = []
+            if self._conn is not None and match:
+                rows = self._conn.execute(
+                    "SELECT skill_id FROM skills_fts WHERE skills_fts MATCH ? "
+                    "ORDER BY bm25(skills_fts, ?, ?) LIMIT ?",
+                    (match, NAME_WEIGHT, DESCRIPTION_WEIGHT, -1 if limit is None else limit),
+                ).fetchall()
+                results = [self._skills[row[0]] for row in rows]
+
+            # Substring matches the token index cannot see (e.g. mid-word)
+            if limit is None or len(results) < limit:
+                seen = {desc.name for desc in results}
+                results.extend(
+                    desc for desc in self._substring_search(query.casefold())
+                    if desc.name not in seen
+                )
+
+        return results if limit is None else results[:limit]
+
+    def _substring_search(self, query: str) -> list[SkillDescriptor]:
+        """Case-insensitive substring match over name and description.
+
+        Scans the single precomputed blob with str.find rather than testing
+        each descriptor, skipping to the next record after every hit.
+        """
+        if not query:
+            return list(self._ordered)
+        if "\x00" in query:
+            return []
+
+        skills = self._ordered
+        results = []
+        pos = self._blob.find(query)
+        while pos != -1:
+            index = bisect.bisect_right(self._offsets, pos) - 1
+            results.append(skills[index])
+            pos = self._blob.find(query, self._offsets[index + 1])
+        return results
+
+
+def _result_dicts(rows: Sequence[tuple[str, int, str]]) -> list[SearchResult]:
+    """Build fresh SearchResult dicts from (path, line number, line text) rows."""
+    return [
+        {"path": path, "line_num": line_num, "context": context}
+        for path, line_num, context in rows
+    ]
+
+
+class _IndexedDirectory:
+    """Indexed state of one references/ directory."""
+
+    __slots__ = ("signature", "rows", "vectors", "results")
+
+    def __init__(self, signature: tuple, rows: list[tuple[str, int, str]]):
+        self.signature = signature
+        # (relative path, line number, line text) in rowid order, starting at 1
+        self.rows = rows
+        # Unit-length embedding per row, when an embedder is configured
+        self.vectors: list[list[float]] | None = None
+        # Final results per (query, max_results) as (path, line number, line
+        # text) tuples, least recently used first; valid while signature is
+        self.results: OrderedDict[tuple[str, int], tuple[tuple[str, int, str], ...]] = (
+            OrderedDict()
+        )
+
+
+class ReferenceIndex:
+    """Hybrid keyword/semantic index over skill reference files.
+
+    Each references/ directory is indexed on first search: every non-blank
+    line becomes a row in an in-memory FTS5 table, so later searches are an
+    index lookup instead of a read of every file. A directory is re-indexed
+    only when the set of files or any file's mtime/size changes.
+
+    Results are memoized per directory, query and max_results until the
+    directory is re-indexed, so an agent repeating a search gets the previous
+    answer without touching the index.
+
+    Lines are ranked by bm25(). When an embedder is supplied, lines are also
+    embedded at index time and ranked by cosine similarity to the query, and
+    the two rankings are merged with Reciprocal Rank Fusion
+    (score = 0.5/(60 + keyword rank) + 0.5/(60 + semantic rank)).
+
+    Every indexed line that contains the query as a case-insensitive
+    substring is matched too, after the ranked hits and in file order, so
+    the results are always a superset of FullTextSearcher's substring scan:
+    "thentic" finds "Authentication" even though no token starts with it.
+    If FTS5 is unavailable, search() uses FullTextSearcher directly.
+
+    Each directory has its own lock, held while it is indexed or searched,
+    so searches of different skills' references run concurrently. The
+    index-wide lock only guards the SQLite connection and the directory
+    table; file reads and embedder calls never run under it.
+    """
+
+    # Candidates taken from each ranker before fusion
+    CANDIDATES = 100
+
+    # Memoized result lists kept per indexed directory
+    RESULT_CACHE_SIZE = 256
+
+    def __init__(self, embedder: Embedder | None = None):
+        """Initialize an empty index.
+
+        Args:
+            embedder: Optional function mapping a list of texts to embedding
+                      vectors. Enables the semantic ranker.
+        """
+        self._embedder = embedder
+        self._embed_query = functools.lru_cache(maxsize=256)(self._embed_one)
+        self._searcher = FullTextSearcher()
+        self._directories: dict[Path, _IndexedDirectory] = {}
+        self._directory_locks: dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        if FTS5_AVAILABLE:
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE refs_fts USING fts5("
+                "context, directory UNINDEXED, row UNINDEXED, "
+                "tokenize='porter unicode61')"
+            )
+
+    def search(self, directory: Path, query: str, max_results: int = 20) -> list[SearchResult]:
+        """Search the reference files under directory.
+
+        Args:
+            directory: A skill's references/ directory
+            query: Free-text query
+            max_results: Maximum number of results to return (default: 20)
+
+        Returns:
+            List of SearchResult dicts, best match first
+        """
+        if self._conn is None or not directory.is_dir():
+            return self._searcher.search(directory, query, max_results)
+
+        with self._directory_lock(directory):
+            indexed = self._ensure_indexed(directory)
+            key = (query, max_results)
+            cached = indexed.results.get(key)
+            if cached is not None:
+                indexed.results.move_to_end(key)
+                return _result_dicts(cached)
+
+            with self._lock:
+                keyword = self._keyword_ranking(directory, query)
+            semantic = self._semantic_ranking(indexed, query)
+
+            if not keyword and not semantic:
+                ranked = []
+            elif semantic is None:
+                ranked = keyword
+            else:
+                scores: dict[int, float] = {}
+                for weight, ranking in ((KEYWORD_WEIGHT, keyword), (SEMANTIC_WEIGHT, semantic)):
+                    for rank, row in enumerate(ranking, start=1):
+                        scores[row] = scores.get(row, 0.0) + weight / (RRF_K + rank)
+                ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+            ranked = ranked[:max_results]
+
+            # Substring matches the token index cannot see (e.g. mid-word).
+            # A row is one (path, line_num), so this also removes duplicates.
+            if len(ranked) < max_results:
+                seen = set(ranked)
+                for row in self._substring_rows(indexed, query):
+                    if row not in seen:
+                        ranked.append(row)
+                        if len(ranked) >= max_results:
+                            break
+
+            # Entries are immutable tuples, so callers can never alter them
+            rows = tuple(indexed.rows[row - 1] for row in ranked)
+            indexed.results[key] = rows
+            if len(indexed.results) > self.RESULT_CACHE_SIZE:
+                indexed.results.popitem(last=False)
+        return _result_dicts(rows)
+
+    def warm(self, directory: Path) -> None:
+        """Index directory ahead of its first search.
+
+        Indexing only fills this index, with no audit or session side
+        effects, so it is safe to run speculatively, e.g. when a skill is
+        activated and a search of its references is likely to follow.
+
+        Args:
+            directory: A skill's references/ directory
+        """
+        if self._conn is None or not directory.is_dir():
+            return
+        with self._directory_lock(directory):
+            self._ensure_indexed(directory)
+
+    def prune(self, keep: list[Path]) -> None:
+        """Drop indexed directories that are not under any of the given paths.
+
+        Args:
+            keep: Skill directories that still exist in the repository
+        """
+        with self._lock:
+            for directory in list(self._directory_locks):
+                if not any(directory.is_relative_to(path) for path in keep):
+                    self._drop(directory)
+                    del self._directory_locks[directory]
+
+    def _directory_lock(self, directory: Path) -> threading.Lock:
+        """Return the lock serializing indexing and searches of directory."""
+        with self._lock:
+            return self._directory_locks.setdefault(directory, threading.Lock())
+
+    def _ensure_indexed(self, directory: Path) -> _IndexedDirectory:
+        """Index directory, or re-index it if its files changed.
+
+        Called with the directory's lock held. Files are read and embedded
+        without holding the index-wide lock.
+        """
+        stats = []
+        for entry in iter_files(directory):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stats.append((Path(entry.path), st.st_mtime_ns, st.st_size))
+        signature = tuple(sorted(stats))
+
+        with self._lock:
+            indexed = self._directories.get(directory)
+        if indexed is not None and indexed.signature == signature:
+            return indexed
+
+        rows: list[tuple[str, int, str]] = []
+        for file_path, _, _ in stats:
+            try:
+                with open(file_path, encoding="utf-8", errors="replace") as f:
+                    lines = [line.rstrip("\n\r") for line in f]
+            except OSError:
+                continue
+            rel_path = str(file_path.relative_to(directory))
+            rows.extend(
+                (rel_path, line_num, line)
+                for line_num, line in enumerate(lines, start=1)
+                if line.strip()
+            )
+
+        indexed = _IndexedDirectory(signature, rows)
+        if self._embedder is not None and rows:
+            vectors = self._embedder([context for _, _, context in rows])
+            indexed.vectors = [_normalize(v) for v in vectors]
+
+        key = str(directory)
+        with self._lock:
+            self._drop(directory)
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO refs_fts (context, directory, row) VALUES (?, ?, ?)",
+                    [(context, key, row) for row, (_, _, context) in enumerate(rows, start=1)],
+                )
+            self._directories[directory] = indexed
+        return indexed
+
+    def _drop(self, directory: Path) -> None:
+        """Remove a directory's rows from the index. Called with _lock held."""
+        if self._directories.pop(directory, None) is not None:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM refs_fts WHERE directory = ?", (str(directory),)
+                )
+
+    def _keyword_ranking(self, directory: Path, query: str) -> list[int]:
+        """Return row numbers matching query, best bm25() score first.
+
+        Called with _lock held, since it uses the shared connection.
+        """
+        match = _match_expression(query)
+        if match is None:
+            return []
+        rows = self._conn.execute(
+            "SELECT row FROM refs_fts WHERE refs_fts MATCH ? AND directory = ? "
+            "ORDER BY bm25(refs_fts) LIMIT ?",
+            (match, str(directory), self.CANDIDATES),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _substring_rows(indexed: _IndexedDirectory, query: str) -> Iterator[int]:
+        """Yield row numbers whose line contains query, ignoring case, in file order."""
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        for row, (_, _, context) in enumerate(indexed.rows, start=1):
+            if pattern.search(context):
+                yield row
+
+    def _semantic_ranking(self, indexed: _IndexedDirectory, query: str) -> list[int] | None:
+        """Return row numbers by cosine similarity, or None without an embedder."""
+        if indexed.vectors is None:
+            return None
+        query_vector = self._embed_query(query)
+        scores = [
+            sum(a * b for a, b in zip(vector, query_vector, strict=True))
+            for vector in indexed.vectors
+        ]
+        order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        return [i + 1 for i in order[: self.CANDIDATES]]
+
+    def _embed_one(self, query: str) -> tuple[float, ...]:
+        """Embed a single query; memoized per query string."""
+        return tuple(_normalize(self._embedder([query])[0]))
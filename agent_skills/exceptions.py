@@ -44,3 +44,8 @@ class ScriptTimeoutError(AgentSkillsError):
 class ScriptFailedError(AgentSkillsError):
     """Raised when script execution fails."""
     pass
+
+
+class SessionCancelledError(AgentSkillsError):
+    """Raised when a tool call targets a session that has been cancelled."""
+    pass
@@ -7,6 +7,8 @@ to a SandboxProvider for actual execution.
 """
 
 import fnmatch
+import os
+import stat
 import tempfile
 from pathlib import Path
 
@@ -144,14 +146,15 @@ class ScriptRunner:
                 f"Script path validation failed for '{script_relpath}': {e}"
             )
 
-        # Verify the script file exists
-        if not script_path.exists():
+        # Verify the script file exists and is a file (not a directory),
+        # with a single stat() call
+        try:
+            script_mode = os.stat(script_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             raise PolicyViolationError(
                 f"Script file does not exist: {script_relpath}"
-            )
-
-        # Verify it's a file (not a directory)
-        if not script_path.is_file():
+            ) from None
+        if not stat.S_ISREG(script_mode):
             raise PolicyViolationError(
                 f"Script path is not a file: {script_relpath}"
             )
@@ -173,7 +176,6 @@ class ScriptRunner:
         env: dict[str, str] = {}
 
         # Add allowed environment variables from the current environment
-        import os
         if self.policy.env_allowlist:
             for var_name in self.policy.env_allowlist:
                 if var_name in os.environ:
@@ -1,11 +1,16 @@
 """Data models for Agent Skills Runtime."""
 
+import base64
+import hashlib
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from agent_skills import _json
+
 
 class SkillState(Enum):
     """State machine for skill interaction lifecycle.
@@ -175,10 +180,62 @@ class ExecutionResult:
         )
 
 
+@dataclass(frozen=True)
+class ResourceContent:
+    """Content read from a skill file, with the digest of exactly that content.
+
+    Returned by the SkillHandle.load_* methods so that callers get the SHA-256
+    and size of the content they received, even when other threads read the
+    same file through a shared handle at the same time.
+
+    Attributes:
+        content: Text (for SKILL.md and references) or binary content (for
+                assets; a memoryview when read with stream=True)
+        sha256: Hexadecimal SHA-256 of content (of its UTF-8 encoding for text)
+        bytes: Size of content in bytes (UTF-8 encoded length for text)
+        truncated: Whether content was cut off at the size limit
+
+    Example:
+        >>> loaded = ResourceContent.from_content("# Notes\n")
+        >>> loaded.bytes
+        8
+    """
+    content: str | bytes | memoryview
+    sha256: str
+    bytes: int
+    truncated: bool = False
+
+    @classmethod
+    def from_content(
+        cls, content: str | bytes | memoryview, truncated: bool = False
+    ) -> "ResourceContent":
+        """Build a ResourceContent, hashing and measuring content once.
+
+        Args:
+            content: Text or binary content
+            truncated: Whether content was cut off at the size limit
+
+        Returns:
+            ResourceContent describing content
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        return cls(
+            content=content,
+            sha256=hashlib.sha256(data).hexdigest(),
+            bytes=len(data),
+            truncated=truncated,
+        )
+
+
 @dataclass
 class AuditEvent:
-    """Record of a skill operation."""
-    ts: datetime
+    """Record of a skill operation.
+
+    The timestamp may be a datetime or an integer epoch time in nanoseconds
+    (as returned by time.time_ns()). Hot paths use the integer form so no
+    datetime is built per event; conversion happens only on serialization.
+    """
+    ts: datetime | int
     kind: str  # "scan", "activate", "read", "run", "error"
     skill: str
     path: str | None = None
@@ -186,10 +243,17 @@ class AuditEvent:
     sha256: str | None = None
     detail: dict = field(default_factory=dict)
 
+    @property
+    def ts_iso(self) -> str:
+        """Timestamp as an ISO 8601 string (local time)."""
+        if isinstance(self.ts, int):
+            return datetime.fromtimestamp(self.ts / 1_000_000_000).isoformat()
+        return self.ts.isoformat()
+
     def to_dict(self) -> dict:
         """Serialize to JSON-compatible dict."""
         return {
-            "ts": self.ts.isoformat(),
+            "ts": self.ts_iso,
             "kind": self.kind,
             "skill": self.skill,
             "path": self.path,
@@ -222,9 +286,28 @@ class SkillSession:
     audit: list[AuditEvent] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    _cancel_event: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False, compare=False
+    )
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether cancel() has been called; safe to read from any thread."""
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation so later tool calls for this session are dropped."""
+        self._cancel_event.set()
+        self.updated_at = datetime.now()
+
+    def transition(self, new_state: SkillState, now: datetime | None = None) -> None:
+        """Transition to new state with validation.
 
-    def transition(self, new_state: SkillState) -> None:
-        """Transition to new state with validation."""
+        Args:
+            new_state: State to move to
+            now: Timestamp for updated_at; lets a caller making several updates
+                 in one request read the clock once. Defaults to datetime.now().
+        """
         # Define valid state transitions
         valid_transitions = {
             SkillState.DISCOVERED: {SkillState.SELECTED, SkillState.FAILED},
@@ -258,17 +341,30 @@ class SkillSession:
             )
 
         self.state = new_state
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
 
-    def add_artifact(self, key: str, value: Any) -> None:
-        """Store execution artifact."""
+    def add_artifact(self, key: str, value: Any, now: datetime | None = None) -> None:
+        """Store execution artifact. See transition() for now."""
         self.artifacts[key] = value
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
+
+    @property
+    def artifact_bytes_retained(self) -> int:
+        """Size of raw text/binary artifact values held by this session.
 
-    def add_audit(self, event: AuditEvent) -> None:
-        """Append audit event."""
+        Counts bytes for binary values and characters for text; structured
+        artifacts (dicts, such as resource references) are not counted.
+        """
+        return sum(
+            len(value)
+            for value in self.artifacts.values()
+            if isinstance(value, (str, bytes, bytearray, memoryview))
+        )
+
+    def add_audit(self, event: AuditEvent, now: datetime | None = None) -> None:
+        """Append audit event. See transition() for now."""
         self.audit.append(event)
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
 
     def to_dict(self) -> dict:
         """Serialize to JSON-compatible dict."""
@@ -280,12 +376,13 @@ class SkillSession:
             "audit": [event.to_dict() for event in self.audit],
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
+            "cancel_requested": self.cancel_requested,
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "SkillSession":
         """Deserialize from dict."""
-        return cls(
+        session = cls(
             session_id=data["session_id"],
             skill_name=data["skill_name"],
             state=SkillState(data["state"]),
@@ -294,6 +391,9 @@ class SkillSession:
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
         )
+        if data.get("cancel_requested"):
+            session._cancel_event.set()
+        return session
 
 
 @dataclass
@@ -303,7 +403,7 @@ class ToolResponse:
     type: str  # "metadata", "instructions", "reference", "asset", "execution_result", "error"
     skill: str
     path: str | None = None
-    content: str | bytes | dict | None = None
+    content: str | bytes | memoryview | dict | None = None
     bytes: int | None = None
     sha256: str | None = None
     truncated: bool = False
@@ -311,11 +411,10 @@ class ToolResponse:
 
     def to_dict(self) -> dict:
         """Serialize to JSON-compatible dict."""
-        # Handle bytes content by converting to base64 or indicating binary
+        # Handle binary content (bytes or a mapped memoryview) by converting to base64
         content = self.content
-        if isinstance(content, bytes):
-            import base64
-            content = base64.b64encode(content).decode("utf-8")
+        if isinstance(content, (bytes, memoryview)):
+            content = base64.b64encode(content).decode("ascii")
 
         return {
             "ok": self.ok,
@@ -329,6 +428,20 @@ class ToolResponse:
             "meta": self.meta,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON for the wire.
+
+        Uses orjson when it is installed and falls back to the standard
+        library otherwise. Values JSON cannot represent are converted with str().
+
+        Returns:
+            Compact JSON encoding of to_dict()
+        """
+        # The dataclass fields encode directly, in to_dict() order; only binary
+        # content needs the base64 conversion to_dict() does
+        binary = isinstance(self.content, (bytes, memoryview))
+        return _json.dumps(self.to_dict() if binary else self, default=str)
+
     @classmethod
     def from_dict(cls, data: dict) -> "ToolResponse":
         """Deserialize from dict."""
@@ -336,7 +449,6 @@ class ToolResponse:
         # If content looks like base64 and type suggests binary, decode it
         if isinstance(content, str) and data.get("type") == "asset":
             try:
-                import base64
                 content = base64.b64decode(content)
             except Exception:
                 pass  # Keep as string if decode fails
@@ -4,12 +4,21 @@ This module provides the AuditSink abstract interface for recording skill operat
 along with concrete implementations for different logging backends.
 """
 
-import json
 from abc import ABC, abstractmethod
 from pathlib import Path
+from agent_skills import _json
 from agent_skills.models import AuditEvent
 
 
+def _encode_line(event: AuditEvent) -> bytes:
+    """Serialize an event as one compact UTF-8 JSON line, newline included.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise.
+    """
+    return _json.dumps(event.to_dict(), newline=True)
+
+
 class AuditSink(ABC):
     """Abstract interface for audit logging.
 
@@ -71,15 +80,12 @@ class JSONLAuditSink(AuditSink):
             IOError: If the log file cannot be written to.
             JSONEncodeError: If the event cannot be serialized to JSON.
         """
-        # Serialize event to JSON-compatible dict
-        event_dict = event.to_dict()
-
-        # Write as single JSON line (no pretty printing)
-        json_line = json.dumps(event_dict, separators=(',', ':'))
+        # Serialize as a single JSON line (no pretty printing)
+        json_line = _encode_line(event)
 
-        # Append to log file with newline
-        with open(self.log_path, 'a', encoding='utf-8') as f:
-            f.write(json_line + '\n')
+        # Append the already-encoded line to the log file
+        with open(self.log_path, 'ab') as f:
+            f.write(json_line)
 
 
 class StdoutAuditSink(AuditSink):
@@ -104,11 +110,8 @@ class StdoutAuditSink(AuditSink):
         Raises:
             JSONEncodeError: If the event cannot be serialized to JSON.
         """
-        # Serialize event to JSON-compatible dict
-        event_dict = event.to_dict()
-
-        # Write as single JSON line (no pretty printing)
-        json_line = json.dumps(event_dict, separators=(',', ':'))
+        # Serialize as a single JSON line (no pretty printing)
+        json_line = _encode_line(event)
 
         # Print to stdout
-        print(json_line)
+        print(json_line.decode('utf-8'), end='')
@@ -1,10 +1,94 @@
 """File reading with policy enforcement and size limits."""
 
+import codecs
+import contextlib
 import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future
 from pathlib import Path
 from typing import TypedDict
-from agent_skills.models import ResourcePolicy
+
+from agent_skills._executor import get_tool_executor
 from agent_skills.exceptions import ResourceTooLargeError
+from agent_skills.models import ResourcePolicy
+
+
+def utf8_len(text: str) -> int:
+    """Return the UTF-8 encoded length of text.
+
+    ASCII strings (the common case for skill files) are measured without
+    building an encoded copy; other strings fall back to encoding.
+
+    Args:
+        text: String to measure
+
+    Returns:
+        Number of bytes text occupies when encoded as UTF-8
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-8'))
+
+
+def iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield the files under root, recursively, as os.DirEntry objects.
+
+    Walks with os.scandir and an explicit stack. File type comes from the
+    directory listing, so telling files from directories costs no stat()
+    call, and callers can use the entry's cached stat(). Directories are
+    visited in the same pre-order as Path.rglob("*"). Symlinks to files are
+    yielded; symlinked directories are not entered. Unreadable directories
+    are skipped.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        DirEntry for each regular file (or symlink to one)
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def _read_text_file(path: str) -> str | None:
+    """Read a whole file as UTF-8 text with text-mode newline translation.
+
+    Returns:
+        The decoded text, or None if the file cannot be read
+    """
+    try:
+        with _read_prefix(path, sys.maxsize) as (data, _):
+            text = str(data, 'utf-8', 'replace')
+    except OSError:
+        return None
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 class SearchResult(TypedDict):
@@ -14,6 +98,68 @@ class SearchResult(TypedDict):
     context: str
 
 
+# Per-thread pool of read buffers, so reading many files (a search walking a
+# references/ tree, repeated tool reads) does not allocate a buffer for each
+_buffer_pool = threading.local()
+
+# Buffers larger than this are used once and not returned to the pool
+_POOLED_BUFFER_MAX_BYTES = 1 << 20
+
+# map_binary() copies reads smaller than this instead of mapping the file:
+# a copy is as cheap at that size and cannot fault if the file is truncated
+_MMAP_MIN_BYTES = 1 << 20
+
+
+@contextlib.contextmanager
+def _pooled_buffer(size: int) -> Iterator[bytearray]:
+    """Lend a bytearray of at least size bytes from the calling thread's pool.
+
+    The buffer is taken out of the pool while lent, so nested reads on the
+    same thread never share one.
+    """
+    pool = getattr(_buffer_pool, 'buffers', None)
+    if pool is None:
+        pool = _buffer_pool.buffers = []
+    buf = pool.pop() if pool else None
+    if buf is None or len(buf) < size:
+        buf = bytearray(size)
+    try:
+        yield buf
+    finally:
+        if len(buf) <= _POOLED_BUFFER_MAX_BYTES:
+            pool.append(buf)
+
+
+@contextlib.contextmanager
+def _read_prefix(path: Path | str, limit: int) -> Iterator[tuple[memoryview, bool]]:
+    """Read at most limit bytes of a file and report whether more remain.
+
+    Uses an unbuffered file and reads straight into a pooled buffer sized
+    from one fstat() call, skipping BufferedReader's intermediate copy. One
+    byte past the limit is requested so truncation is detected in the same
+    read.
+
+    Yields:
+        Tuple of (content, truncated). content is a view of the pooled
+        buffer and is only valid inside the with block; copy or decode it
+        there.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        size = min(os.fstat(f.fileno()).st_size, limit) + 1
+        with _pooled_buffer(size) as buf:
+            view = memoryview(buf)[:size]
+            filled = 0
+            while filled < size:
+                count = f.readinto(view[filled:])
+                if not count:
+                    break
+                filled += count
+            try:
+                yield view[:min(filled, limit)], filled > limit
+            finally:
+                view.release()
+
+
 class ResourceReader:
     """Reads files with policy enforcement.
 
@@ -43,7 +189,8 @@ class ResourceReader:
 
         Returns:
             Tuple of (content, truncated) where:
-            - content: The file content as a string
+            - content: The file content as a string, at most max_bytes when
+              encoded as UTF-8 and cut on a character boundary
             - truncated: True if content was truncated due to size limits
 
         Raises:
@@ -53,48 +200,19 @@ class ResourceReader:
         if max_bytes is None:
             max_bytes = self.policy.max_file_bytes
 
-        # Check if we can read any more bytes in this session
-        if self.session_bytes_read >= self.policy.max_total_bytes_per_session:
-            raise ResourceTooLargeError(
-                f"Session byte limit exceeded: {self.session_bytes_read} >= "
-                f"{self.policy.max_total_bytes_per_session}"
-            )
-
-        # Calculate how many bytes we can still read in this session
-        remaining_session_bytes = (
-            self.policy.max_total_bytes_per_session - self.session_bytes_read
-        )
-
-        # Limit read to the smaller of max_bytes and remaining session bytes
-        effective_max_bytes = min(max_bytes, remaining_session_bytes)
+        effective_max_bytes = self.effective_max_bytes(max_bytes)
 
-        # Read the file with size limit
-        truncated = False
-        try:
-            with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                # Read up to effective_max_bytes
-                content = f.read(effective_max_bytes)
-
-                # Check if there's more content (file was truncated)
-                if f.read(1):  # Try to read one more byte
-                    truncated = True
-        except UnicodeDecodeError:
-            # If we can't decode as UTF-8, try with error replacement
-            with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read(effective_max_bytes)
-                if f.read(1):
-                    truncated = True
+        # Read up to effective_max_bytes bytes. A character cut at the limit
+        # is dropped rather than replaced, and newlines are translated as in
+        # text mode.
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        with _read_prefix(path, effective_max_bytes) as (data, truncated):
+            content = decoder.decode(data, final=not truncated)
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
 
         # Update session byte counter
-        bytes_read = len(content.encode('utf-8'))
-        self.session_bytes_read += bytes_read
-
-        # Check if we've now exceeded the session limit
-        if self.session_bytes_read > self.policy.max_total_bytes_per_session:
-            raise ResourceTooLargeError(
-                f"Session byte limit exceeded after read: {self.session_bytes_read} > "
-                f"{self.policy.max_total_bytes_per_session}"
-            )
+        self.charge(utf8_len(content))
 
         return content, truncated
 
@@ -121,6 +239,86 @@ class ResourceReader:
         if max_bytes is None:
             max_bytes = self.policy.binary_max_bytes
 
+        effective_max_bytes = self.effective_max_bytes(max_bytes)
+
+        # Read the file with size limit. The result is a new bytes object
+        # either way, so reading straight into it is the one copy needed; a
+        # pooled buffer would add a second.
+        with open(path, 'rb') as f:
+            content = f.read(effective_max_bytes)
+
+            # Check if there's more content (file was truncated)
+            truncated = bool(f.read(1))
+
+        # Update session byte counter
+        self.charge(len(content))
+
+        return content, truncated
+
+    def map_binary(
+        self,
+        path: Path,
+        max_bytes: int | None = None
+    ) -> tuple[memoryview, bool]:
+        """Memory-map a binary file with size limits.
+
+        Like read_binary(), but returns a read-only view over an mmap of the
+        file instead of copying it into a bytes object, so large assets can be
+        hashed and base64-encoded straight from the page cache. Reads under
+        1 MiB are copied into memory instead.
+
+        Args:
+            path: Path to the file to map
+            max_bytes: Optional override for max file size (defaults to policy.binary_max_bytes)
+
+        Returns:
+            Tuple of (content, truncated) where:
+            - content: Read-only memoryview of at most max_bytes of the file
+            - truncated: True if content was truncated due to size limits
+
+        Raises:
+            ResourceTooLargeError: If total session bytes exceed max_total_bytes_per_session
+
+        Note:
+            A mapping stays open for as long as the view (or a slice of it)
+            is referenced, and truncating the file underneath it faults the
+            process on access. Callers should drop the view once they have
+            encoded it, and copy it with bytes(view) if they keep the content.
+        """
+        # Use policy default if max_bytes not specified
+        if max_bytes is None:
+            max_bytes = self.policy.binary_max_bytes
+
+        effective_max_bytes = self.effective_max_bytes(max_bytes)
+
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            truncated = size > effective_max_bytes
+            length = min(size, effective_max_bytes)
+            if length < _MMAP_MIN_BYTES:
+                # Also covers empty files, which cannot be mapped
+                content = memoryview(f.read(length))
+            else:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                content = memoryview(mapped)[:length]
+
+        # Update session byte counter
+        self.session_bytes_read += length
+
+        return content, truncated
+
+    def effective_max_bytes(self, max_bytes: int) -> int:
+        """Clamp a read size to what remains of the session byte budget.
+
+        Args:
+            max_bytes: Requested maximum number of bytes
+
+        Returns:
+            The smaller of max_bytes and the bytes left in the session budget
+
+        Raises:
+            ResourceTooLargeError: If the session budget is already exhausted
+        """
         # Check if we can read any more bytes in this session
         if self.session_bytes_read >= self.policy.max_total_bytes_per_session:
             raise ResourceTooLargeError(
@@ -134,20 +332,23 @@ class ResourceReader:
         )
 
         # Limit read to the smaller of max_bytes and remaining session bytes
-        effective_max_bytes = min(max_bytes, remaining_session_bytes)
+        return min(max_bytes, remaining_session_bytes)
 
-        # Read the file with size limit
-        truncated = False
-        with open(path, 'rb') as f:
-            content = f.read(effective_max_bytes)
+    def charge(self, nbytes: int) -> None:
+        """Count bytes returned to a caller against the session budget.
 
-            # Check if there's more content (file was truncated)
-            if f.read(1):  # Try to read one more byte
-                truncated = True
+        The read methods call this themselves. Callers that return content
+        from an earlier read again call it directly, so reused content costs
+        the same budget as a fresh read.
 
-        # Update session byte counter
-        bytes_read = len(content)
-        self.session_bytes_read += bytes_read
+        Args:
+            nbytes: Number of bytes returned
+
+        Raises:
+            ResourceTooLargeError: If total session bytes now exceed
+                max_total_bytes_per_session
+        """
+        self.session_bytes_read += nbytes
 
         # Check if we've now exceeded the session limit
         if self.session_bytes_read > self.policy.max_total_bytes_per_session:
@@ -156,9 +357,7 @@ class ResourceReader:
                 f"{self.policy.max_total_bytes_per_session}"
             )
 
-        return content, truncated
-
-    def compute_sha256(self, content: str | bytes) -> str:
+    def compute_sha256(self, content: str | bytes | memoryview) -> str:
         """Compute SHA256 hash of content.
 
         Args:
@@ -192,8 +391,26 @@ class FullTextSearcher:
 
     This class provides full-text search functionality across all text files
     in a directory, returning matches with context.
+
+    When ripgrep (``rg``) is on PATH the scan is delegated to it, which is
+    much faster than a Python line loop on large reference directories. The
+    pure-Python scan is used when ripgrep is unavailable or fails.
     """
 
+    # Upper bound on a single ripgrep invocation before falling back
+    RIPGREP_TIMEOUT_S = 10
+
+    # Files read ahead of the scan by the Python fallback
+    PREFETCH_DEPTH = 16
+
+    def __init__(self, use_ripgrep: bool = True):
+        """Initialize the searcher.
+
+        Args:
+            use_ripgrep: Use ripgrep when it is installed (default: True)
+        """
+        self._rg = shutil.which("rg") if use_ripgrep else None
+
     def search(
         self,
         directory: Path,
@@ -219,49 +436,183 @@ class FullTextSearcher:
             - Returns up to max_results matches to prevent excessive response size
             - Context includes the matching line only (not surrounding lines)
         """
+        # If directory doesn't exist, return empty results
+        if not directory.is_dir():
+            return []
+
+        if self._rg is not None:
+            results = self._search_ripgrep(directory, query, max_results)
+            if results is not None:
+                return results
+
+        return self._search_python(directory, query, max_results)
+
+    def _search_ripgrep(
+        self,
+        directory: Path,
+        query: str,
+        max_results: int
+    ) -> list[SearchResult] | None:
+        """Search using ripgrep's JSON output.
+
+        Returns:
+            List of results, or None if ripgrep could not be run
+        """
+        cmd = [
+            self._rg, "--json", "--no-config", "--fixed-strings",
+            "--ignore-case", "--line-number", "--hidden", "--no-ignore",
+            "--sort", "path", "--max-count", str(max_results),
+            "--", query, str(directory),
+        ]
+        try:
+            proc = subprocess.run(
+                cmd, capture_output=True, timeout=self.RIPGREP_TIMEOUT_S
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        # Exit code 1 means "no matches"; anything else without output is an error
+        if proc.returncode not in (0, 1) and not proc.stdout:
+            return None
+
         results: list[SearchResult] = []
-        query_lower = query.lower()
+        for raw in proc.stdout.splitlines():
+            try:
+                event = json.loads(raw)
+            except ValueError:
+                continue
+            if event.get("type") != "match":
+                continue
 
-        # If directory doesn't exist, return empty results
-        if not directory.exists() or not directory.is_dir():
-            return results
+            data = event["data"]
+            path_text = data["path"].get("text")
+            line_text = data["lines"].get("text")
+            if path_text is None or line_text is None:
+                # Non-UTF-8 path or line; ripgrep reports these as base64 bytes
+                continue
+
+            file_path = Path(path_text)
+            try:
+                rel_path = file_path.relative_to(directory)
+            except ValueError:
+                rel_path = file_path
+
+            results.append({
+                'path': str(rel_path),
+                'line_num': data["line_number"],
+                'context': line_text.rstrip('\n\r')
+            })
+            if len(results) >= max_results:
+                break
+
+        return results
+
+    def _search_python(
+        self,
+        directory: Path,
+        query: str,
+        max_results: int
+    ) -> list[SearchResult]:
+        """Search by scanning files in Python.
+
+        The query is compiled once into a case-insensitive regular expression
+        that is run over each file's whole text, so the scan happens in the
+        regex engine rather than a per-line Python loop. Line numbers and
+        context are derived from the match offsets. Files are read ahead on
+        worker threads (see _read_ahead) while earlier ones are scanned.
+        """
+        # Matches are reported per line, so a query spanning lines never matches
+        if "\n" in query or "\r" in query:
+            return []
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
 
         # Recursively search all files in directory
-        for file_path in directory.rglob('*'):
-            # Skip directories
-            if not file_path.is_file():
-                continue
+        with contextlib.closing(self._read_ahead(directory)) as files:
+            return self._scan_files(files, directory, pattern, max_results)
 
+    def _scan_files(
+        self,
+        files: Iterator[tuple[Path, str | None]],
+        directory: Path,
+        pattern: re.Pattern,
+        max_results: int
+    ) -> list[SearchResult]:
+        """Collect matching lines from (path, text) pairs."""
+        results: list[SearchResult] = []
+        for file_path, text in files:
             # Skip if we've already found enough results
             if len(results) >= max_results:
                 break
 
-            # Try to read as text file
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    for line_num, line in enumerate(f, start=1):
-                        # Check if query is in line (case-insensitive)
-                        if query_lower in line.lower():
-                            # Get relative path from search directory
-                            try:
-                                rel_path = file_path.relative_to(directory)
-                            except ValueError:
-                                # If relative_to fails, use absolute path
-                                rel_path = file_path
-
-                            # Add result with context (the matching line, stripped)
-                            results.append({
-                                'path': str(rel_path),
-                                'line_num': line_num,
-                                'context': line.rstrip('\n\r')
-                            })
-
-                            # Check if we've hit the limit
-                            if len(results) >= max_results:
-                                return results
-
-            except (UnicodeDecodeError, PermissionError, OSError):
-                # Skip files that can't be read as text or have permission issues
+            # Skip files that could not be read
+            if text is None:
                 continue
 
+            match = pattern.search(text)
+            if match is None:
+                continue
+
+            # Get relative path from search directory
+            try:
+                rel_path = str(file_path.relative_to(directory))
+            except ValueError:
+                # If relative_to fails, use absolute path
+                rel_path = str(file_path)
+
+            # pos is always the start of line line_num
+            pos = 0
+            line_num = 1
+            while match is not None:
+                start = match.start()
+                line_num += text.count('\n', pos, start)
+                line_start = text.rfind('\n', 0, start) + 1
+                line_end = text.find('\n', start)
+                if line_end == -1:
+                    line_end = len(text)
+
+                # Add result with context (the matching line)
+                results.append({
+                    'path': rel_path,
+                    'line_num': line_num,
+                    'context': text[line_start:line_end]
+                })
+
+                # Check if we've hit the limit
+                if len(results) >= max_results:
+                    return results
+
+                # Continue from the next line, so each line is reported once
+                pos = line_end + 1
+                line_num += 1
+                match = pattern.search(text, pos) if pos <= len(text) else None
+
         return results
+
+    def _read_ahead(self, directory: Path) -> Iterator[tuple[Path, str | None]]:
+        """Yield (path, text) for every file under directory, in walk order.
+
+        Up to PREFETCH_DEPTH whole files are read on the shared tool worker
+        pool (see get_tool_executor) ahead of the consumer. File reads release the GIL, so on a cold cache the I/O for later
+        files overlaps with scanning earlier ones. A read that has not started
+        by the time its file is needed is done inline instead, so a search
+        running on a busy pool never waits on its own queued reads. Reads that
+        have not started are cancelled when the generator is closed early.
+        """
+        pool = get_tool_executor()
+        pending: deque[tuple[str, Future]] = deque()
+
+        def take() -> tuple[Path, str | None]:
+            path, future = pending.popleft()
+            text = _read_text_file(path) if future.cancel() else future.result()
+            return Path(path), text
+
+        try:
+            for entry in iter_files(directory):
+                pending.append((entry.path, pool.submit(_read_text_file, entry.path)))
+                if len(pending) >= self.PREFETCH_DEPTH:
+                    yield take()
+            while pending:
+                yield take()
+        finally:
+            for _, future in pending:
+                future.cancel()
@@ -4,6 +4,50 @@ from pathlib import Path
 from agent_skills.exceptions import PathTraversalError, PolicyViolationError
 
 
+def resolve_within(
+    path: str | Path,
+    roots: tuple[Path, ...] | None = None,
+    *,
+    resolve_absolute: bool = True,
+) -> Path:
+    """Resolve a file tool path, rejecting relative paths that escape the roots.
+
+    Relative paths are resolved (following symlinks) and must end up under one
+    of the roots, so "../x" or a symlink pointing outside the working directory
+    is rejected while harmless names such as "foo..bar" are accepted. Absolute
+    paths name their target explicitly and are accepted as long as they have
+    no ".." component.
+
+    Args:
+        path: Absolute or working-directory-relative path
+        roots: Resolved directories relative paths must stay within
+            (default: the working directory at the time of the call)
+        resolve_absolute: If False, accepted absolute paths are returned as
+            given instead of resolved, so callers that may never touch the
+            file skip the realpath walk
+
+    Returns:
+        The resolved absolute Path
+
+    Raises:
+        PathTraversalError: If the path escapes the roots
+    """
+    path = Path(path)
+    if path.is_absolute():
+        # The check is purely lexical, so resolve only for the result
+        if ".." not in path.parts:
+            return path.resolve() if resolve_absolute else path
+    else:
+        if roots is None:
+            roots = (Path.cwd().resolve(),)
+        resolved = path.resolve()
+        if any(resolved.is_relative_to(root) for root in roots):
+            return resolved
+    raise PathTraversalError(
+        f"Invalid path: directory traversal detected ({path} -> {path.resolve()})"
+    )
+
+
 class PathResolver:
     """Validates and resolves paths within skill directory."""
 
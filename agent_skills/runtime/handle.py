@@ -6,7 +6,11 @@ secure access to references and assets, and orchestrates script execution with
 comprehensive audit logging.
 """
 
-import hashlib
+import os
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
@@ -16,16 +20,50 @@ from agent_skills.models import (
     AuditEvent,
     ExecutionPolicy,
     ExecutionResult,
+    ResourceContent,
     ResourcePolicy,
     SkillDescriptor,
 )
 from agent_skills.observability.audit import AuditSink
 from agent_skills.parsing.frontmatter import FrontmatterParser
 from agent_skills.parsing.markdown import SkillMarkdownLoader
-from agent_skills.resources.reader import ResourceReader
+from agent_skills.resources.reader import ResourceReader, utf8_len
 from agent_skills.resources.resolver import PathResolver
 
 
+def _require_file(path: Path, relpath: str, label: str) -> os.stat_result:
+    """Check with a single stat() that path is an existing regular file.
+
+    Args:
+        path: Resolved path to check
+        relpath: Path as given by the caller, for error messages
+        label: Kind of file, e.g. "Reference", for error messages
+
+    Returns:
+        The stat() result for path
+
+    Raises:
+        FileNotFoundError: If nothing exists at path
+        PolicyViolationError: If path exists but is not a regular file
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"{label} file not found: {relpath}") from None
+    if not stat.S_ISREG(st.st_mode):
+        raise PolicyViolationError(f"{label} path is not a file: {relpath}")
+    return st
+
+
+def _unchanged(path: Path, before: os.stat_result) -> bool:
+    """Check that path still has the mtime and size it had in before."""
+    try:
+        after = os.stat(path)
+    except OSError:
+        return False
+    return (after.st_mtime_ns, after.st_size) == (before.st_mtime_ns, before.st_size)
+
+
 class SkillHandle:
     """Lazy-loading interface for individual skill.
 
@@ -62,12 +100,17 @@ class SkillHandle:
         >>> result = handle.run_script("scripts/process.py", args=["--input", "data.csv"])
     """
 
+    # Maximum total UTF-8 size of reference contents kept for reuse by
+    # load_reference()
+    REFERENCE_CACHE_BYTES = 1 << 20
+
     def __init__(
         self,
         descriptor: SkillDescriptor,
         resource_policy: ResourcePolicy,
         execution_policy: ExecutionPolicy,
         audit_sink: AuditSink | None = None,
+        digest: Callable[[Path], str] | None = None,
     ):
         """Initialize SkillHandle with descriptor and policies.
 
@@ -76,16 +119,30 @@ class SkillHandle:
             resource_policy: ResourcePolicy defining file access limits
             execution_policy: ExecutionPolicy defining script execution permissions
             audit_sink: Optional AuditSink for logging operations
+            digest: Optional callable returning a (cached) SHA-256 of a whole
+                   file, such as SkillsRepository.digest, used instead of
+                   hashing untruncated asset reads
         """
         self._descriptor = descriptor
         self._resource_policy = resource_policy
         self._execution_policy = execution_policy
         self._audit_sink = audit_sink
+        self._digest = digest
 
         # Lazy loading state
-        self._instructions_cache: str | None = None
+        self._instructions: ResourceContent | None = None
         self._body_offset: int | None = None
 
+        # Loaded references keyed by (relpath, byte limit), validated by the
+        # file's (mtime_ns, size), least recently used first. Handles are
+        # shared by the adapters' worker threads, so every access holds
+        # _reference_lock.
+        self._reference_cache: OrderedDict[
+            tuple[str, int], tuple[tuple[int, int], ResourceContent]
+        ] = OrderedDict()
+        self._reference_cache_bytes = 0
+        self._reference_lock = threading.Lock()
+
         # Initialize components
         self._path_resolver = PathResolver(descriptor.path)
         self._resource_reader = ResourceReader(resource_policy)
@@ -118,25 +175,36 @@ class SkillHandle:
         Note:
             This method emits an audit event with kind="activate" on first load.
         """
+        return self.load_instructions().content
+
+    def load_instructions(self) -> ResourceContent:
+        """Load the SKILL.md body together with its SHA-256 and size.
+
+        Same as instructions(), but also returns the digest and UTF-8 length
+        computed while loading, so callers need not hash the body again.
+
+        Returns:
+            ResourceContent for the SKILL.md body
+
+        Raises:
+            SkillParseError: If SKILL.md cannot be read or parsed
+        """
         # Return cached instructions if already loaded
-        if self._instructions_cache is not None:
-            return self._instructions_cache
+        if self._instructions is not None:
+            return self._instructions
 
         # Parse frontmatter to get body offset (if not already done)
         if self._body_offset is None:
             parser = FrontmatterParser()
             _, self._body_offset = parser.parse(self._descriptor.path)
 
-        # Load the markdown body
+        # Load the markdown body, hashing and measuring it once
         loader = SkillMarkdownLoader()
         body = loader.load_body(self._descriptor.path, self._body_offset)
+        loaded = ResourceContent.from_content(body)
 
-        # Cache the instructions
-        self._instructions_cache = body
-
-        # Compute SHA256 of the body content
-        body_bytes = body.encode('utf-8')
-        body_sha256 = hashlib.sha256(body_bytes).hexdigest()
+        # Cache the instructions with their digest, in a single assignment
+        self._instructions = loaded
 
         # Emit audit event
         if self._audit_sink:
@@ -145,13 +213,13 @@ class SkillHandle:
                 kind="activate",
                 skill=self._descriptor.name,
                 path="SKILL.md",
-                bytes=len(body_bytes),
-                sha256=body_sha256,
+                bytes=loaded.bytes,
+                sha256=loaded.sha256,
                 detail={"operation": "load_instructions"},
             )
             self._audit_sink.log(event)
 
-        return self._instructions_cache
+        return loaded
 
     def read_reference(
         self,
@@ -187,25 +255,73 @@ class SkillHandle:
             >>> api_docs = handle.read_reference("api-docs.md")
             >>> example = handle.read_reference("examples/basic.json", max_bytes=10000)
         """
+        return self.load_reference(relpath, max_bytes=max_bytes).content
+
+    def load_reference(
+        self,
+        relpath: str,
+        *,
+        max_bytes: int | None = None
+    ) -> ResourceContent:
+        """Read a reference file together with its SHA-256, size and truncation.
+
+        Same as read_reference(), but the digest and size describe exactly the
+        content returned by this call. Results are cached per path and byte
+        limit until the file's mtime or size changes, so repeat reads of an
+        unchanged reference are neither decoded nor hashed again. They still
+        count against the session byte budget. Up to REFERENCE_CACHE_BYTES of
+        content is kept, evicting the least recently used.
+
+        Args:
+            relpath: Relative path to the file within references/ directory
+            max_bytes: Optional override for maximum file size
+
+        Returns:
+            ResourceContent for the (possibly truncated) file content
+
+        Raises:
+            PathTraversalError: If path contains .. or is absolute
+            PolicyViolationError: If path is not within references/ directory
+            ResourceTooLargeError: If session byte limit is exceeded
+            FileNotFoundError: If the file does not exist
+        """
         # Construct full relative path with references/ prefix
         full_relpath = f"references/{relpath}"
 
         # Resolve and validate path
         resolved_path = self._path_resolver.resolve(full_relpath, allowed_dirs=["references"])
 
-        # Check if file exists
-        if not resolved_path.exists():
-            raise FileNotFoundError(f"Reference file not found: {relpath}")
-
-        # Check if it's a file (not a directory)
-        if not resolved_path.is_file():
-            raise PolicyViolationError(f"Reference path is not a file: {relpath}")
-
-        # Read the file with size limits
-        content, truncated = self._resource_reader.read_text(resolved_path, max_bytes)
-
-        # Compute SHA256 of content
-        content_sha256 = self._resource_reader.compute_sha256(content)
+        # Check that it exists and is a file (not a directory)
+        before = _require_file(resolved_path, relpath, "Reference")
+
+        # The limit the read is made with, which with the file's version
+        # decides whether an earlier result can be reused
+        limit = self._resource_reader.effective_max_bytes(
+            self._resource_policy.max_file_bytes if max_bytes is None else max_bytes
+        )
+        key = (relpath, limit)
+        version = (before.st_mtime_ns, before.st_size)
+        with self._reference_lock:
+            cached = self._reference_cache.get(key)
+            if cached is not None and cached[0] == version:
+                self._reference_cache.move_to_end(key)
+                loaded = cached[1]
+            else:
+                loaded = None
+
+        if loaded is not None:
+            truncated = loaded.truncated
+            self._resource_reader.charge(loaded.bytes)
+        else:
+            # Read the file with size limits
+            content, truncated = self._resource_reader.read_text(resolved_path, limit)
+
+            # Compute SHA256 and size of content from a single encoding
+            loaded = ResourceContent.from_content(content, truncated)
+
+            # Only cache content that matches the version it is keyed by
+            if _unchanged(resolved_path, before):
+                self._cache_reference(key, version, loaded)
 
         # Emit audit event
         if self._audit_sink:
@@ -214,8 +330,8 @@ class SkillHandle:
                 kind="read",
                 skill=self._descriptor.name,
                 path=full_relpath,
-                bytes=len(content.encode('utf-8')),
-                sha256=content_sha256,
+                bytes=loaded.bytes,
+                sha256=loaded.sha256,
                 detail={
                     "operation": "read_reference",
                     "truncated": truncated,
@@ -223,14 +339,31 @@ class SkillHandle:
             )
             self._audit_sink.log(event)
 
-        return content
+        return loaded
+
+    def _cache_reference(
+        self, key: tuple[str, int], version: tuple[int, int], loaded: ResourceContent
+    ) -> None:
+        """Store a loaded reference, evicting the least recently used ones."""
+        if loaded.bytes > self.REFERENCE_CACHE_BYTES:
+            return
+        with self._reference_lock:
+            previous = self._reference_cache.pop(key, None)
+            if previous is not None:
+                self._reference_cache_bytes -= previous[1].bytes
+            self._reference_cache[key] = (version, loaded)
+            self._reference_cache_bytes += loaded.bytes
+            while self._reference_cache_bytes > self.REFERENCE_CACHE_BYTES:
+                _, (_, evicted) = self._reference_cache.popitem(last=False)
+                self._reference_cache_bytes -= evicted.bytes
 
     def read_asset(
         self,
         relpath: str,
         *,
-        max_bytes: int | None = None
-    ) -> bytes:
+        max_bytes: int | None = None,
+        stream: bool = False,
+    ) -> bytes | memoryview:
         """Read binary file from assets/ directory.
 
         This method reads a binary file from the skill's assets/ directory,
@@ -241,10 +374,13 @@ class SkillHandle:
                     (e.g., "diagram.png" or "data/sample.csv")
             max_bytes: Optional override for maximum file size
                       (defaults to resource_policy.binary_max_bytes)
+            stream: If True, return a read-only memoryview over a memory map
+                   of the file instead of copying it into bytes
 
         Returns:
-            The file content as bytes. Content may be truncated if it exceeds
-            size limits (check the truncated flag via audit events).
+            The file content as bytes (or a memoryview when stream=True).
+            Content may be truncated if it exceeds size limits (check the
+            truncated flag via audit events).
 
         Raises:
             PathTraversalError: If path contains .. or is absolute
@@ -261,6 +397,36 @@ class SkillHandle:
             >>> image_data = handle.read_asset("diagram.png")
             >>> csv_data = handle.read_asset("data/sample.csv", max_bytes=50000)
         """
+        return self.load_asset(relpath, max_bytes=max_bytes, stream=stream).content
+
+    def load_asset(
+        self,
+        relpath: str,
+        *,
+        max_bytes: int | None = None,
+        stream: bool = False,
+    ) -> ResourceContent:
+        """Read an asset file together with its SHA-256, size and truncation.
+
+        Same as read_asset(), but the digest and size describe exactly the
+        content returned by this call.
+
+        Args:
+            relpath: Relative path to the file within assets/ directory
+            max_bytes: Optional override for maximum file size
+            stream: If True, the content is a read-only memoryview over a
+                   memory map of the file
+
+        Returns:
+            ResourceContent for the (possibly truncated) file content
+
+        Raises:
+            PathTraversalError: If path contains .. or is absolute
+            PolicyViolationError: If path is not within assets/ directory,
+                                 or if binary assets are not allowed
+            ResourceTooLargeError: If session byte limit is exceeded
+            FileNotFoundError: If the file does not exist
+        """
         # Check if binary assets are allowed
         if not self._resource_policy.allow_binary_assets:
             raise PolicyViolationError(
@@ -274,19 +440,28 @@ class SkillHandle:
         # Resolve and validate path
         resolved_path = self._path_resolver.resolve(full_relpath, allowed_dirs=["assets"])
 
-        # Check if file exists
-        if not resolved_path.exists():
-            raise FileNotFoundError(f"Asset file not found: {relpath}")
-
-        # Check if it's a file (not a directory)
-        if not resolved_path.is_file():
-            raise PolicyViolationError(f"Asset path is not a file: {relpath}")
+        # Check that it exists and is a file (not a directory)
+        before = _require_file(resolved_path, relpath, "Asset")
 
         # Read the file with size limits
-        content, truncated = self._resource_reader.read_binary(resolved_path, max_bytes)
-
-        # Compute SHA256 of content
-        content_sha256 = self._resource_reader.compute_sha256(content)
+        if stream:
+            content, truncated = self._resource_reader.map_binary(resolved_path, max_bytes)
+        else:
+            content, truncated = self._resource_reader.read_binary(resolved_path, max_bytes)
+
+        # A whole-file read takes the file's cached digest, but only if the
+        # file kept its mtime and size across the read and the digest lookup.
+        # Otherwise hash the buffer that is returned: the file may have been
+        # rewritten since it was read.
+        loaded = None
+        if self._digest is not None and not truncated and len(content) == before.st_size:
+            sha256 = self._digest(resolved_path)
+            if _unchanged(resolved_path, before):
+                loaded = ResourceContent(
+                    content=content, sha256=sha256, bytes=len(content), truncated=False
+                )
+        if loaded is None:
+            loaded = ResourceContent.from_content(content, truncated)
 
         # Emit audit event
         if self._audit_sink:
@@ -295,8 +470,8 @@ class SkillHandle:
                 kind="read",
                 skill=self._descriptor.name,
                 path=full_relpath,
-                bytes=len(content),
-                sha256=content_sha256,
+                bytes=loaded.bytes,
+                sha256=loaded.sha256,
                 detail={
                     "operation": "read_asset",
                     "truncated": truncated,
@@ -304,7 +479,7 @@ class SkillHandle:
             )
             self._audit_sink.log(event)
 
-        return content
+        return loaded
 
     def run_script(
         self,
@@ -414,8 +589,8 @@ class SkillHandle:
                     "exit_code": result.exit_code,
                     "duration_ms": result.duration_ms,
                     "args": args,
-                    "stdout_bytes": len(result.stdout.encode('utf-8')),
-                    "stderr_bytes": len(result.stderr.encode('utf-8')),
+                    "stdout_bytes": utf8_len(result.stdout),
+                    "stderr_bytes": utf8_len(result.stderr),
                 },
             )
             self._audit_sink.log(event)
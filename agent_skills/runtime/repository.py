@@ -8,12 +8,20 @@ The repository implements a lazy loading pattern where only metadata is loaded d
 scanning, with full skill content loaded on-demand through SkillHandle.
 """
 
+import contextlib
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from agent_skills.discovery.cache import MetadataCache
 from agent_skills.discovery.index import SkillIndexer
 from agent_skills.discovery.scanner import SkillScanner
+from agent_skills.discovery.search import Embedder, ReferenceIndex, SkillSearchIndex
 from agent_skills.exceptions import SkillNotFoundError
 from agent_skills.models import (
     AuditEvent,
@@ -24,8 +32,19 @@ from agent_skills.models import (
 from agent_skills.observability.audit import AuditSink
 from agent_skills.prompt.claude_xml import ClaudeXMLRenderer
 from agent_skills.prompt.json_renderer import JSONRenderer
+from agent_skills.resources.reader import SearchResult
 from agent_skills.runtime.handle import SkillHandle
 
+# Process-wide source of registry snapshot ids, so ids are never reused across
+# repositories or refreshes
+_snapshot_ids = itertools.count(1)
+
+# Handles pinned by SkillsRepository.turn(), keyed by (snapshot id, skill name)
+# so pins never leak across repositories or refreshes. None outside a turn.
+_turn_handles: ContextVar[dict[tuple[int, str], SkillHandle] | None] = ContextVar(
+    "agent_skills_turn_handles", default=None
+)
+
 
 class SkillsRepository:
     """Central registry for skill discovery and access.
@@ -67,6 +86,12 @@ class SkillsRepository:
         >>> instructions = handle.instructions()
     """
 
+    # Maximum number of open skill handles kept for reuse by open()
+    HANDLE_CACHE_SIZE = 128
+
+    # Maximum number of file digests kept for reuse by digest()
+    DIGEST_CACHE_SIZE = 1024
+
     def __init__(
         self,
         roots: list[Path],
@@ -74,6 +99,7 @@ class SkillsRepository:
         resource_policy: ResourcePolicy | None = None,
         execution_policy: ExecutionPolicy | None = None,
         audit_sink: AuditSink | None = None,
+        embedder: Embedder | None = None,
     ):
         """Initialize repository with configuration.
 
@@ -87,6 +113,9 @@ class SkillsRepository:
                             If None, uses default policy (execution disabled).
             audit_sink: Optional AuditSink for logging operations.
                        If None, audit logging is disabled.
+            embedder: Optional function mapping a list of texts to embedding
+                     vectors. If given, search_references() fuses keyword and
+                     semantic rankings; otherwise it is keyword-only.
 
         Example:
             >>> repo = SkillsRepository(
@@ -106,9 +135,29 @@ class SkillsRepository:
         self._scanner = SkillScanner()
         self._indexer = SkillIndexer()
         self._cache = MetadataCache(self._cache_dir) if self._cache_dir else None
+        self._search_index = SkillSearchIndex()
+        self._reference_index = ReferenceIndex(embedder)
 
         # Skill registry (populated by refresh())
         self._skills: dict[str, SkillDescriptor] = {}
+        self._snapshot_id = next(_snapshot_ids)
+
+        # SHA-256 of skill files keyed by path, validated by (mtime_ns, size),
+        # least recently used first. Guarded by _digest_lock like the handle
+        # cache below; the hashing itself runs outside the lock.
+        self._digest_cache: OrderedDict[Path, tuple[int, int, str]] = OrderedDict()
+        self._digest_lock = threading.Lock()
+
+        # Open handles keyed by skill name, validated by SKILL.md's mtime_ns,
+        # least recently opened first. open() runs on the adapters' worker
+        # threads, so every access holds _handle_lock.
+        self._handle_cache: OrderedDict[str, tuple[int, SkillHandle]] = OrderedDict()
+        self._handle_lock = threading.Lock()
+
+        # Objects the framework adapters build for this repository, such as
+        # build_adk_toolset()'s tool specs. They bind the repository, so they
+        # are kept here to be freed with it rather than in a module-level cache.
+        self.adapter_cache: dict[Any, Any] = {}
 
     def refresh(self) -> list[SkillDescriptor]:
         """Scan roots and update skill index.
@@ -178,9 +227,181 @@ class SkillsRepository:
 
         # Update internal registry
         self._skills = {desc.name: desc for desc in descriptors}
+        self._search_index.build(descriptors)
+        with self._handle_lock:
+            self._handle_cache.clear()
+        self._snapshot_id = next(_snapshot_ids)
+
+        # Drop digests for files that no longer belong to a discovered skill
+        skill_dirs = [desc.path for desc in descriptors]
+        with self._digest_lock:
+            self._digest_cache = OrderedDict(
+                (path, entry)
+                for path, entry in self._digest_cache.items()
+                if any(path.is_relative_to(skill_dir) for skill_dir in skill_dirs)
+            )
+        self._reference_index.prune(skill_dirs)
 
         return descriptors
 
+    def digest(self, path: Path) -> str:
+        """Return the SHA-256 hex digest of a skill file.
+
+        The file is hashed in chunks with hashlib.file_digest, without loading
+        it into memory. Digests are cached per path and reused until the
+        file's mtime or size changes. Handles returned by open() take the
+        digest of whole-file asset reads from here, so repeated reads of an
+        unchanged asset are not re-hashed. Up to DIGEST_CACHE_SIZE digests are
+        kept, evicting the least recently used.
+
+        Args:
+            path: Path to the file to hash
+
+        Returns:
+            Hexadecimal SHA-256 digest of the file contents
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+
+        Example:
+            >>> repo.digest(Path("./skills/data-processor/assets/logo.png"))
+            'e3b0c44298fc1c149afbf4c8996fb924...'
+        """
+        stat = path.stat()
+        with self._digest_lock:
+            cached = self._digest_cache.get(path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._digest_cache.move_to_end(path)
+                return cached[2]
+
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:  # Python 3.10
+                hasher = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+                digest = hasher.hexdigest()
+
+        with self._digest_lock:
+            self._digest_cache[path] = (stat.st_mtime_ns, stat.st_size, digest)
+            self._digest_cache.move_to_end(path)
+            if len(self._digest_cache) > self.DIGEST_CACHE_SIZE:
+                self._digest_cache.popitem(last=False)
+        return digest
+
+    @property
+    def snapshot_id(self) -> int:
+        """Identifier of the current skill registry contents.
+
+        Changes on every refresh() and is unique across repositories, so it
+        can key caches derived from list() without risk of serving stale skills.
+        """
+        return self._snapshot_id
+
+    def search(self, query: str, limit: int | None = None) -> list[SkillDescriptor]:
+        """Return skills matching a query, ranked by relevance.
+
+        Names and descriptions are indexed with SQLite FTS5 and ranked with
+        BM25, weighting name matches above description matches. Each query
+        word matches as a prefix. Skills that contain the query as a
+        case-insensitive substring are always included as well, after the
+        ranked hits, so no plain substring match is ever dropped.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results, or None for all matches
+
+        Returns:
+            List of matching SkillDescriptor objects, best match first
+
+        Example:
+            >>> repo.refresh()
+            >>> [s.name for s in repo.search("csv")]
+            ['data-processor']
+        """
+        return self._search_index.search(query, limit)
+
+    def search_references(
+        self,
+        name: str,
+        query: str,
+        max_results: int = 20,
+    ) -> list[SearchResult]:
+        """Search the reference files of a skill.
+
+        The skill's references/ directory is indexed on first use and
+        re-indexed only when its files change, so repeated searches do not
+        re-read every file. See ReferenceIndex for how results are ranked.
+
+        Args:
+            name: Name of the skill whose references/ to search
+            query: Free-text query
+            max_results: Maximum number of results to return (default: 20)
+
+        Returns:
+            List of SearchResult dicts (path, line_num, context), best match first
+
+        Raises:
+            SkillNotFoundError: If the skill name is not in the registry
+
+        Example:
+            >>> repo.search_references("api-client", "authentication")
+            [{'path': 'api-docs.md', 'line_num': 12, 'context': '## Authentication'}]
+        """
+        descriptor = self._skills.get(name)
+        if descriptor is None:
+            raise SkillNotFoundError(
+                f"Skill '{name}' not found in repository. "
+                f"Available skills: {', '.join(self._skills.keys())}"
+            )
+        return self._reference_index.search(
+            descriptor.path / "references", query, max_results
+        )
+
+    def warm_references(self, name: str) -> None:
+        """Build the reference index for a skill before it is first searched.
+
+        Adapters call this in the background when a skill is activated, since
+        agents usually go on to search its references. Unknown skills are
+        ignored.
+
+        Args:
+            name: Name of the skill whose references/ to index
+        """
+        descriptor = self._skills.get(name)
+        if descriptor is not None:
+            self._reference_index.warm(descriptor.path / "references")
+
+    @contextlib.contextmanager
+    def turn(self):
+        """Pin opened skill handles for the duration of one agent turn.
+
+        Within the block, open() hands back the handle it returned earlier for
+        the same skill without re-checking SKILL.md, so an activate/read/run
+        sequence on one skill does the lookup once. The pins live in a
+        ContextVar, so they follow the turn into copied contexts (such as the
+        adapters' async tool executor) and never leak into other threads or
+        tasks. Nested turns share the outermost turn's pins.
+
+        Note:
+            Edits to SKILL.md made during the turn are picked up by the first
+            open() after it ends.
+
+        Example:
+            >>> with repo.turn():
+            ...     for call in tool_calls:
+            ...         execute(call)
+        """
+        if _turn_handles.get() is not None:
+            yield
+            return
+        token = _turn_handles.set({})
+        try:
+            yield
+        finally:
+            _turn_handles.reset(token)
+
     def list(self) -> list[SkillDescriptor]:
         """Return all discovered skill descriptors.
 
@@ -222,6 +443,11 @@ class SkillsRepository:
             The skill must have been discovered by a previous refresh() call.
             The returned handle uses lazy loading - no content is loaded until
             you call methods like instructions(), read_reference(), etc.
+            Handles are cached, so repeated opens return the same handle (and
+            its loaded instructions) until SKILL.md's mtime changes or the
+            repository is refreshed. Up to HANDLE_CACHE_SIZE handles are kept,
+            evicting the least recently opened. Inside turn(), the mtime check
+            is skipped after the first open of each skill.
 
         Example:
             >>> repo = SkillsRepository(roots=[Path("./skills")])
@@ -241,16 +467,44 @@ class SkillsRepository:
                 f"Available skills: {', '.join(self._skills.keys())}"
             )
 
+        # Within a turn(), reuse the handle pinned by an earlier open()
+        pinned = _turn_handles.get()
+        if pinned is not None:
+            handle = pinned.get((self._snapshot_id, name))
+            if handle is not None:
+                return handle
+
         # Get descriptor
         descriptor = self._skills[name]
 
-        # Create and return SkillHandle
-        return SkillHandle(
-            descriptor=descriptor,
-            resource_policy=self._resource_policy,
-            execution_policy=self._execution_policy,
-            audit_sink=self._audit_sink,
-        )
+        # Reuse the cached handle unless SKILL.md changed since it was opened
+        try:
+            mtime_ns = (descriptor.path / "SKILL.md").stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        with self._handle_lock:
+            cached = self._handle_cache.get(name)
+            if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+                self._handle_cache.move_to_end(name)
+                handle = cached[1]
+            else:
+                # Create and cache SkillHandle
+                handle = SkillHandle(
+                    descriptor=descriptor,
+                    resource_policy=self._resource_policy,
+                    execution_policy=self._execution_policy,
+                    audit_sink=self._audit_sink,
+                    digest=self.digest,
+                )
+                if mtime_ns is not None:
+                    self._handle_cache[name] = (mtime_ns, handle)
+                    self._handle_cache.move_to_end(name)
+                    if len(self._handle_cache) > self.HANDLE_CACHE_SIZE:
+                        self._handle_cache.popitem(last=False)
+
+        if pinned is not None:
+            pinned[(self._snapshot_id, name)] = handle
+        return handle
 
     def to_prompt(
         self,
@@ -5,14 +5,22 @@ particularly for ADK integration where sessions need to be maintained
 across multiple tool calls.
 """
 
+import threading
 import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from agent_skills.models import SkillSession, SkillState
 
 if TYPE_CHECKING:
     from agent_skills.runtime.repository import SkillsRepository
 
+# fetch_artifact() dispatch by path prefix: (prefix, SkillHandle loader).
+# Paths with neither prefix are references.
+_RESOURCE_READERS = (
+    ("assets/", "load_asset"),
+    ("references/", "load_reference"),
+)
+
 
 class SkillSessionManager:
     """Manages skill sessions for ADK integration.
@@ -22,20 +30,50 @@ class SkillSessionManager:
     particularly useful for ADK integration where skill interactions span
     multiple tool calls and need to maintain state.
 
+    Sessions touched by a burst of tool calls can be marked dirty with
+    mark_dirty() instead of calling update_session() each time; dirty sessions
+    are written back once per flush interval (or on the next read, flush() or
+    close()), so subclasses that persist in update_session() pay one write per
+    burst rather than one per call. A burst touching max_dirty sessions is
+    flushed right away so pending writes stay bounded.
+
     Attributes:
         repository: The SkillsRepository instance
+        flush_interval_s: Delay before dirty sessions are written back
+        max_dirty: Number of dirty sessions that triggers an immediate flush
         _sessions: Internal dictionary mapping session_id to SkillSession
     """
 
-    def __init__(self, repository: "SkillsRepository"):
+    def __init__(
+        self,
+        repository: "SkillsRepository",
+        flush_interval_s: float = 0.05,
+        max_dirty: int = 64,
+    ):
         """Initialize with repository.
 
         Args:
             repository: The SkillsRepository instance to use for skill access
+            flush_interval_s: Seconds to coalesce mark_dirty() calls before
+                             flushing them (default: 50ms)
+            max_dirty: Flush as soon as this many sessions are pending instead
+                       of waiting for the timer (default: 64)
         """
         self.repository = repository
+        self.flush_interval_s = flush_interval_s
+        self.max_dirty = max_dirty
         self._sessions: dict[str, SkillSession] = {}
 
+        # Sessions awaiting write-back, keyed by session_id
+        self._dirty: dict[str, SkillSession] = {}
+        self._dirty_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+
+        # Objects the framework adapters build for this manager, such as
+        # build_adk_toolset()'s tool specs. They bind the manager, so they are
+        # kept here to be freed with it rather than in a module-level cache.
+        self.adapter_cache: dict[Any, Any] = {}
+
     def create_session(self, skill_name: str) -> SkillSession:
         """Create new session for skill.
 
@@ -78,6 +116,8 @@ class SkillSessionManager:
             >>> if session:
             ...     print(f"Found session for {session.skill_name}")
         """
+        if self._dirty:
+            self.flush()
         return self._sessions.get(session_id)
 
     def update_session(self, session: SkillSession) -> None:
@@ -97,6 +137,118 @@ class SkillSessionManager:
         """
         self._sessions[session.session_id] = session
 
+    def mark_dirty(self, session: SkillSession) -> None:
+        """Schedule a session update, coalescing bursts of tool calls.
+
+        The first call in a burst starts a timer; every session marked before
+        it fires is written back with a single update_session() call each. If
+        max_dirty sessions are pending, they are flushed immediately.
+
+        Args:
+            session: The SkillSession that was modified
+
+        Example:
+            >>> session.add_audit(event)
+            >>> manager.mark_dirty(session)  # flushed within flush_interval_s
+        """
+        with self._dirty_lock:
+            self._dirty[session.session_id] = session
+            full = len(self._dirty) >= self.max_dirty
+            if not full and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval_s, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write back all sessions marked dirty since the last flush."""
+        with self._dirty_lock:
+            dirty = self._dirty
+            self._dirty = {}
+            timer = self._flush_timer
+            self._flush_timer = None
+
+        if timer is not None:
+            timer.cancel()
+
+        for session in dirty.values():
+            self.update_session(session)
+
+    def close(self) -> None:
+        """Flush pending session updates before shutdown."""
+        self.flush()
+
+    def cancel_session(self, session_id: str) -> bool:
+        """Cancel a session so queued tool calls for it are dropped.
+
+        Tool handlers check the flag before doing any work and return a
+        SessionCancelledError response instead. Pending writes are flushed so
+        the cancellation is persisted immediately.
+
+        Args:
+            session_id: The unique identifier of the session to cancel
+
+        Returns:
+            True if the session was found and cancelled, False otherwise
+
+        Example:
+            >>> manager.cancel_session(session.session_id)
+            True
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            return False
+
+        session.cancel()
+        self.update_session(session)
+        return True
+
+    def fetch_artifact(self, session: SkillSession, key: str) -> Any:
+        """Get a session artifact, loading resource references on demand.
+
+        Reads recorded by the ADK adapter are stored as small references
+        ({"type": "resource_ref", "skill", "path", "sha256", "bytes",
+        "max_bytes"}) instead of the file content. This resolves such a
+        reference by re-reading the file through the repository with the same
+        max_bytes, so a truncated read is compared against the same prefix;
+        other artifacts are returned as stored.
+
+        Args:
+            session: The session holding the artifact
+            key: Artifact key, e.g. "read_references/api-docs.md"
+
+        Returns:
+            The artifact value, or the referenced file content (str for
+            references, bytes for assets)
+
+        Raises:
+            KeyError: If the session has no artifact with that key
+            ValueError: If the referenced file changed since it was read
+
+        Example:
+            >>> content = manager.fetch_artifact(session, "read_references/api-docs.md")
+        """
+        artifact = session.artifacts[key]
+        if not (isinstance(artifact, dict) and artifact.get("type") == "resource_ref"):
+            return artifact
+
+        handle = self.repository.open(artifact["skill"])
+        path = artifact["path"]
+        prefix, reader = next(
+            (entry for entry in _RESOURCE_READERS if path.startswith(entry[0])),
+            _RESOURCE_READERS[-1],
+        )
+        loaded = getattr(handle, reader)(
+            path.removeprefix(prefix), max_bytes=artifact.get("max_bytes")
+        )
+
+        if artifact.get("sha256") and loaded.sha256 != artifact["sha256"]:
+            raise ValueError(f"Artifact '{key}' has changed since it was read: {path}")
+
+        return loaded.content
+
     def list_sessions(self) -> list[SkillSession]:
         """List all active sessions.
 
@@ -108,6 +260,8 @@ class SkillSessionManager:
             >>> for session in sessions:
             ...     print(f"{session.skill_name}: {session.state.value}")
         """
+        if self._dirty:
+            self.flush()
         return list(self._sessions.values())
 
     def delete_session(self, session_id: str) -> bool:
@@ -126,6 +280,9 @@ class SkillSessionManager:
             >>> if manager.delete_session("abc-123"):
             ...     print("Session deleted")
         """
+        with self._dirty_lock:
+            self._dirty.pop(session_id, None)
+
         if session_id in self._sessions:
             del self._sessions[session_id]
             return True
@@ -141,4 +298,6 @@ class SkillSessionManager:
             >>> manager.clear_sessions()
             >>> assert len(manager.list_sessions()) == 0
         """
+        with self._dirty_lock:
+            self._dirty.clear()
         self._sessions.clear()
@@ -9,32 +9,37 @@ This module tests the ADK tool specifications and handlers, including:
 
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
+from agent_skills.adapters._files import format_size
 from agent_skills.adapters.adk import (
-    build_adk_toolset,
-    _handle_list,
     _handle_activate,
+    _handle_check_file,
+    _handle_delete_file,
+    _handle_list,
+    _handle_list_files,
     _handle_read,
     _handle_run,
     _handle_search,
-    _handle_check_file,
     _handle_write_file,
-    _handle_delete_file,
-    _handle_list_files,
+    build_adk_toolset,
 )
+from agent_skills.discovery.search import SkillSearchIndex
 from agent_skills.exceptions import SkillNotFoundError
-from agent_skills.models import ExecutionResult, SkillDescriptor, SkillState
+from agent_skills.models import ExecutionResult, ResourceContent, SkillDescriptor, SkillState
 from agent_skills.runtime.repository import SkillsRepository
 from agent_skills.runtime.session import SkillSessionManager
 
+# What a SkillHandle.load_* call returns for the given content
+_loaded = ResourceContent.from_content
+
 
 @pytest.fixture
 def mock_repository():
     """Create a mock repository for testing."""
-    repo = Mock()
+    repo = Mock(adapter_cache={})
 
     # Mock list() to return sample skills
     skill1 = SkillDescriptor(
@@ -49,6 +54,11 @@ def mock_repository():
     )
     repo.list.return_value = [skill1, skill2]
 
+    # Rank with the real skill index
+    index = SkillSearchIndex()
+    index.build([skill1, skill2])
+    repo.search.side_effect = index.search
+
     return repo
 
 
@@ -82,6 +92,14 @@ class TestBuildADKToolset:
             assert tool["input_schema"]["type"] == "object"
             assert "properties" in tool["input_schema"]
 
+    def test_file_tools_document_path_scope(self, mock_repository):
+        """File tool path parameters say absolute paths are unrestricted."""
+        tools = {tool["name"]: tool for tool in build_adk_toolset(mock_repository)}
+
+        for name in ("check_file", "write_file", "delete_file", "list_files"):
+            description = tools[f"skills.{name}"]["input_schema"]["properties"]["path"]["description"]
+            assert "absolute paths are not restricted" in description
+
     def test_tool_names(self, mock_repository):
         """Should create tools with correct names."""
         tools = build_adk_toolset(mock_repository)
@@ -111,10 +129,196 @@ class TestBuildADKToolset:
         # Should not raise an error
         assert len(tools) == 9
 
+    def test_reuses_handlers_for_same_arguments(self, mock_repository, mock_session_manager):
+        """Repeated builds for the same objects should share handlers, not dicts."""
+        first = build_adk_toolset(mock_repository, mock_session_manager)
+        second = build_adk_toolset(mock_repository, mock_session_manager)
+
+        assert all(a["handler"] is b["handler"] for a, b in zip(first, second, strict=True))
+        assert all(a == b and a is not b for a, b in zip(first, second, strict=True))
+        assert list(mock_session_manager.adapter_cache) == [("adk_toolset", mock_repository)]
+        assert mock_repository.adapter_cache == {}
+
+        first[0]["name"] = "changed"
+        first[0]["input_schema"]["properties"]["q"]["type"] = "integer"
+        first[0]["input_schema"]["required"] = ["q"]
+        fresh = build_adk_toolset(mock_repository, mock_session_manager)[0]
+        assert fresh["name"] == "skills.list"
+        assert fresh["input_schema"]["properties"]["q"]["type"] == "string"
+        assert "q" not in fresh["input_schema"].get("required", [])
+
+    def test_does_not_keep_repository_alive(self, tmp_path):
+        """Building tools should not pin the repository once it is dropped."""
+        import gc
+        import weakref
+
+        repository = SkillsRepository(roots=[tmp_path])
+        build_adk_toolset(repository)
+        assert list(repository.adapter_cache) == [("adk_toolset", repository)]
+        ref = weakref.ref(repository)
+
+        del repository
+        gc.collect()
+
+        assert ref() is None
+
+    def test_builds_separate_specs_per_repository(self, mock_repository):
+        """Different repositories should get their own handlers."""
+        other_repository = Mock(adapter_cache={})
+
+        first = build_adk_toolset(mock_repository)
+        second = build_adk_toolset(other_repository)
+
+        assert first[0]["handler"] is not second[0]["handler"]
+
+    def test_handlers_bind_state_with_partial(self, mock_repository, mock_session_manager):
+        """Handlers should be partials of the module-level handlers, not closures."""
+        import functools
+
+        tools = {t["name"]: t for t in build_adk_toolset(mock_repository, mock_session_manager)}
+
+        read = tools["skills.read"]["handler"]
+        assert isinstance(read, functools.partial)
+        assert read.func is _handle_read
+        assert read.args == (mock_repository, mock_session_manager)
+        assert tools["skills.check_file"]["handler"] is _handle_check_file
+
+    def test_copies_schemas_across_repositories(self, mock_repository):
+        """Every caller should get its own copy of the shared input schemas."""
+        first = build_adk_toolset(mock_repository)
+        second = build_adk_toolset(Mock(adapter_cache={}))
+
+        for a, b in zip(first, second, strict=True):
+            assert a["input_schema"] == b["input_schema"]
+            assert a["input_schema"] is not b["input_schema"]
+            assert a["description"] is b["description"]
+
+    def test_tool_metadata_is_json_serializable(self, mock_repository):
+        """Shared schemas must stay plain dicts so hosts can serialize them."""
+        tools = build_adk_toolset(mock_repository)
+
+        metadata = [
+            {key: tool[key] for key in ("name", "description", "input_schema")}
+            for tool in tools
+        ]
+
+        assert json.loads(json.dumps(metadata)) == metadata
+
+    def test_async_handlers_run_concurrently(self, mock_repository):
+        """Async handlers should return the same responses and overlap when gathered."""
+        import asyncio
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        search = mock_repository.search.side_effect
+
+        def list_skills():
+            # Both calls must be in flight at once to get past the barrier
+            barrier.wait()
+            return mock_repository.list.return_value
+
+        def search_skills(query, limit=None):
+            barrier.wait()
+            return search(query, limit)
+
+        mock_repository.list.side_effect = list_skills
+        mock_repository.search.side_effect = search_skills
+        tools = build_adk_toolset(mock_repository)
+        list_tool = next(t for t in tools if t["name"] == "skills.list")
+
+        async def run_both():
+            return await asyncio.gather(
+                list_tool["async_handler"]({}),
+                list_tool["async_handler"]({"q": "another"}),
+            )
+
+        all_skills, filtered = asyncio.run(run_both())
+
+        assert all_skills["ok"] is True
+        assert len(all_skills["content"]) == 2
+        assert [s["name"] for s in filtered["content"]] == ["another-skill"]
+
+
+    def test_async_handlers_use_tool_worker_pool(self, mock_repository):
+        """Async handlers should run on the dedicated tool threads."""
+        import asyncio
+        import threading
+
+        threads = []
+
+        def list_skills():
+            threads.append(threading.current_thread().name)
+            return mock_repository.list.return_value
+
+        mock_repository.list.side_effect = list_skills
+        tools = build_adk_toolset(mock_repository)
+        list_tool = next(t for t in tools if t["name"] == "skills.list")
+
+        result = asyncio.run(list_tool["async_handler"]({}))
+
+        assert result["ok"] is True
+        assert threads[0].startswith("agent-skills-tool")
+
 
 class TestHandleList:
     """Tests for _handle_list handler."""
 
+    def test_caches_filter_per_snapshot(self, mock_repository):
+        """Repeated queries should reuse results until the snapshot changes."""
+        from agent_skills.runtime import repository as repository_module
+
+        mock_repository.snapshot_id = next(repository_module._snapshot_ids)
+
+        first = _handle_list(mock_repository, {"q": "another"})
+        second = _handle_list(mock_repository, {"q": "ANOTHER"})
+        assert mock_repository.search.call_count == 1
+        assert first["content"] == second["content"]
+
+        mock_repository.snapshot_id = next(repository_module._snapshot_ids)
+        _handle_list(mock_repository, {"q": "another"})
+        assert mock_repository.search.call_count == 2
+
+    def test_filter_cache_does_not_keep_repository_alive(self, tmp_path):
+        """Cached filter results should not pin their repository."""
+        import gc
+        import weakref
+
+        repository = SkillsRepository(roots=[tmp_path])
+        repository.refresh()
+        _handle_list(repository, {"q": "data"})
+        ref = weakref.ref(repository)
+
+        del repository
+        gc.collect()
+
+        assert ref() is None
+
+    def test_filter_keeps_mid_word_matches(self, tmp_path):
+        """Skills matching only mid-word should be listed after ranked hits."""
+        for name in ("bigdata-tool", "data-processor"):
+            skill_dir = tmp_path / name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: Tools\n---\n\n# {name}\n"
+            )
+        repository = SkillsRepository(roots=[tmp_path])
+        repository.refresh()
+
+        result = _handle_list(repository, {"q": "data"})
+
+        assert [s["name"] for s in result["content"]] == ["data-processor", "bigdata-tool"]
+
+    def test_blank_query_skips_search(self, mock_repository):
+        """Whitespace-only queries should list everything without searching."""
+        result = _handle_list(mock_repository, {"q": "  "})
+
+        assert len(result["content"]) == 2
+        mock_repository.search.assert_not_called()
+
+        _handle_list(mock_repository, {"q": " Another "})
+        mock_repository.search.assert_called_once_with("another")
+
     def test_returns_all_skills(self, mock_repository):
         """Should return all skills when no query provided."""
         params = {}
@@ -164,7 +368,7 @@ class TestHandleActivate:
         """Should activate skill and create new session."""
         # Mock handle
         mock_handle = Mock()
-        mock_handle.instructions.return_value = "# Test Instructions"
+        mock_handle.load_instructions.return_value = _loaded("# Test Instructions")
         mock_repository.open.return_value = mock_handle
 
         params = {"name": "test-skill"}
@@ -192,7 +396,7 @@ class TestHandleActivate:
 
         # Mock handle
         mock_handle = Mock()
-        mock_handle.instructions.return_value = "# Test Instructions"
+        mock_handle.load_instructions.return_value = _loaded("# Test Instructions")
         mock_repository.open.return_value = mock_handle
 
         params = {"name": "test-skill", "session_id": session.session_id}
@@ -214,6 +418,18 @@ class TestHandleActivate:
         assert result["type"] == "error"
         assert "Session not found" in result["content"]
 
+    def test_drops_calls_for_cancelled_session(self, mock_repository, mock_session_manager):
+        """Should refuse to work on a cancelled session."""
+        session = mock_session_manager.create_session("test-skill")
+        mock_session_manager.cancel_session(session.session_id)
+
+        params = {"name": "test-skill", "session_id": session.session_id}
+        result = _handle_activate(mock_repository, mock_session_manager, params)
+
+        assert result["ok"] is False
+        assert "SessionCancelledError" in result["content"]
+        mock_repository.open.assert_not_called()
+
     def test_handles_skill_not_found(self, mock_repository, mock_session_manager):
         """Should return error when skill not found."""
         mock_repository.open.side_effect = SkillNotFoundError("Skill not found")
@@ -233,7 +449,7 @@ class TestHandleRead:
         """Should read reference file and return content."""
         # Mock handle
         mock_handle = Mock()
-        mock_handle.read_reference.return_value = "Reference content"
+        mock_handle.load_reference.return_value = _loaded("Reference content")
         mock_repository.open.return_value = mock_handle
 
         params = {"name": "test-skill", "path": "api-docs.md"}
@@ -249,7 +465,7 @@ class TestHandleRead:
         """Should read asset file and return binary content."""
         # Mock handle
         mock_handle = Mock()
-        mock_handle.read_asset.return_value = b"Binary content"
+        mock_handle.load_asset.return_value = _loaded(b"Binary content")
         mock_repository.open.return_value = mock_handle
 
         params = {"name": "test-skill", "path": "assets/image.png"}
@@ -262,6 +478,30 @@ class TestHandleRead:
         import base64
         assert result["content"] == base64.b64encode(b"Binary content").decode("utf-8")
 
+    def test_reads_by_explicit_kind(self, mock_repository, mock_session_manager):
+        """Should dispatch on an explicit kind with a path relative to it."""
+        mock_handle = Mock()
+        mock_handle.load_asset.return_value = _loaded(b"Binary content")
+        mock_repository.open.return_value = mock_handle
+
+        params = {"name": "test-skill", "kind": "asset", "path": "image.png"}
+        result = _handle_read(mock_repository, mock_session_manager, params)
+
+        assert result["ok"] is True
+        assert result["type"] == "asset"
+        assert result["path"] == "assets/image.png"
+        mock_handle.load_asset.assert_called_once_with("image.png", max_bytes=None, stream=True)
+
+    def test_rejects_unknown_kind(self, mock_repository, mock_session_manager):
+        """Should return an error for a kind outside the schema enum."""
+        mock_repository.open.return_value = Mock()
+
+        params = {"name": "test-skill", "kind": "script", "path": "run.py"}
+        result = _handle_read(mock_repository, mock_session_manager, params)
+
+        assert result["ok"] is False
+        assert "Invalid kind" in result["content"]
+
     def test_updates_session_state(self, mock_repository, mock_session_manager):
         """Should update session state when session_id provided."""
         # Create session and transition to INSTRUCTIONS_LOADED
@@ -272,7 +512,7 @@ class TestHandleRead:
 
         # Mock handle
         mock_handle = Mock()
-        mock_handle.read_reference.return_value = "Content"
+        mock_handle.load_reference.return_value = _loaded("Content")
         mock_repository.open.return_value = mock_handle
 
         params = {
@@ -290,19 +530,34 @@ class TestHandleRead:
         updated_session = mock_session_manager.get_session(session.session_id)
         assert updated_session.state == SkillState.RESOURCE_NEEDED
         assert len(updated_session.audit) > 0
+        # The audit event and session share a single clock read
+        event = updated_session.audit[-1]
+        assert updated_session.updated_at.timestamp() == pytest.approx(event.ts / 1e9)
+
+    @pytest.mark.parametrize("max_bytes", ["1000", True, 1.5])
+    def test_rejects_mistyped_max_bytes(
+        self, mock_repository, mock_session_manager, max_bytes
+    ):
+        """Should reject a mistyped parameter before opening the skill."""
+        params = {"name": "test-skill", "path": "api-docs.md", "max_bytes": max_bytes}
+        result = _handle_read(mock_repository, mock_session_manager, params)
+
+        assert result["ok"] is False
+        assert "Invalid parameter 'max_bytes'" in result["content"]
+        mock_repository.open.assert_not_called()
 
     def test_handles_max_bytes_parameter(self, mock_repository, mock_session_manager):
         """Should pass max_bytes parameter to read methods."""
         # Mock handle
         mock_handle = Mock()
-        mock_handle.read_reference.return_value = "Content"
+        mock_handle.load_reference.return_value = _loaded("Content")
         mock_repository.open.return_value = mock_handle
 
         params = {"name": "test-skill", "path": "api-docs.md", "max_bytes": 1000}
         result = _handle_read(mock_repository, mock_session_manager, params)
 
         assert result["ok"] is True
-        mock_handle.read_reference.assert_called_once_with("api-docs.md", max_bytes=1000)
+        mock_handle.load_reference.assert_called_once_with("api-docs.md", max_bytes=1000)
 
 
 class TestHandleRun:
@@ -398,6 +653,15 @@ class TestHandleRun:
         assert updated_session.state == SkillState.SCRIPT_NEEDED
         assert "execution_result" in updated_session.artifacts
 
+    def test_rejects_non_list_args(self, mock_repository, mock_session_manager):
+        """Should reject a string where the argument list is expected."""
+        params = {"name": "test-skill", "script_path": "process.py", "args": "--input"}
+        result = _handle_run(mock_repository, mock_session_manager, params)
+
+        assert result["ok"] is False
+        assert "Invalid parameter 'args'" in result["content"]
+        mock_repository.open.assert_not_called()
+
     def test_handles_script_path_prefix(self, mock_repository, mock_session_manager):
         """Should handle scripts/ prefix in path."""
         # Mock handle
@@ -427,23 +691,12 @@ class TestHandleSearch:
 
     def test_searches_references(self, mock_repository):
         """Should search references directory and return results."""
-        # Mock handle and descriptor
-        mock_handle = Mock()
-        mock_descriptor = Mock()
-        mock_descriptor.path = Path("/fake/path/test-skill")
-        mock_handle.descriptor.return_value = mock_descriptor
-        mock_repository.open.return_value = mock_handle
+        mock_repository.search_references.return_value = [
+            {"path": "api-docs.md", "line_num": 10, "context": "authentication"},
+        ]
 
-        # Mock searcher
-        with patch("agent_skills.adapters.adk.FullTextSearcher") as mock_searcher_class:
-            mock_searcher = Mock()
-            mock_searcher.search.return_value = [
-                {"path": "api-docs.md", "line_num": 10, "context": "authentication"},
-            ]
-            mock_searcher_class.return_value = mock_searcher
-
-            params = {"name": "test-skill", "query": "authentication"}
-            result = _handle_search(mock_repository, params)
+        params = {"name": "test-skill", "query": "authentication"}
+        result = _handle_search(mock_repository, params)
 
         assert result["ok"] is True
         assert result["type"] == "search_results"
@@ -451,32 +704,49 @@ class TestHandleSearch:
         assert len(result["content"]) == 1
         assert result["meta"]["query"] == "authentication"
         assert result["meta"]["result_count"] == 1
+        mock_repository.search_references.assert_called_once_with(
+            "test-skill", "authentication", max_results=20
+        )
 
     def test_handles_no_results(self, mock_repository):
         """Should handle case with no search results."""
-        # Mock handle and descriptor
-        mock_handle = Mock()
-        mock_descriptor = Mock()
-        mock_descriptor.path = Path("/fake/path/test-skill")
-        mock_handle.descriptor.return_value = mock_descriptor
-        mock_repository.open.return_value = mock_handle
+        mock_repository.search_references.return_value = []
 
-        # Mock searcher with no results
-        with patch("agent_skills.adapters.adk.FullTextSearcher") as mock_searcher_class:
-            mock_searcher = Mock()
-            mock_searcher.search.return_value = []
-            mock_searcher_class.return_value = mock_searcher
-
-            params = {"name": "test-skill", "query": "nonexistent"}
-            result = _handle_search(mock_repository, params)
+        params = {"name": "test-skill", "query": "nonexistent"}
+        result = _handle_search(mock_repository, params)
 
         assert result["ok"] is True
         assert len(result["content"]) == 0
         assert result["meta"]["result_count"] == 0
 
+    def test_reuses_repository_index_across_calls(self, tmp_path, monkeypatch):
+        """Repeated searches on one repository should not re-read reference files."""
+        skill_dir = tmp_path / "doc-skill"
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: doc-skill\ndescription: Docs\n---\n\n# Docs\n"
+        )
+        (skill_dir / "references" / "api.md").write_text("Authentication uses tokens.\n")
+        repository = SkillsRepository(roots=[tmp_path])
+        repository.refresh()
+
+        params = {"name": "doc-skill", "query": "tokens"}
+        first = _handle_search(repository, params)
+
+        opened = []
+        real_open = open
+        monkeypatch.setattr(
+            "builtins.open", lambda *a, **kw: opened.append(a[0]) or real_open(*a, **kw)
+        )
+        second = _handle_search(repository, params)
+
+        assert first["content"] == second["content"]
+        assert second["meta"]["result_count"] == 1
+        assert opened == []
+
     def test_handles_errors(self, mock_repository):
         """Should return error response on exception."""
-        mock_repository.open.side_effect = Exception("Test error")
+        mock_repository.search_references.side_effect = Exception("Test error")
 
         params = {"name": "test-skill", "query": "test"}
         result = _handle_search(mock_repository, params)
@@ -493,8 +763,8 @@ class TestIntegration:
         """Should support full workflow with session management."""
         # Mock handle
         mock_handle = Mock()
-        mock_handle.instructions.return_value = "# Instructions"
-        mock_handle.read_reference.return_value = "Reference content"
+        mock_handle.load_instructions.return_value = _loaded("# Instructions")
+        mock_handle.load_reference.return_value = _loaded("Reference content")
         exec_result = ExecutionResult(
             exit_code=0,
             stdout="Success",
@@ -561,6 +831,44 @@ class TestHandleCheckFile:
         assert result["ok"] is True
         assert result["content"]["exists"] is False
 
+    def test_resolves_only_existing_absolute_paths(self, tmp_path, monkeypatch):
+        """Should report symlinks resolved, and skip resolve() for missing files."""
+        (tmp_path / "target.txt").write_text("x")
+        (tmp_path / "link.txt").symlink_to(tmp_path / "target.txt")
+
+        result = _handle_check_file({"path": str(tmp_path / "link.txt")})
+        assert result["content"]["path"] == str((tmp_path / "target.txt").resolve())
+
+        monkeypatch.setattr(Path, "resolve", None)
+        result = _handle_check_file({"path": str(tmp_path / "missing.txt")})
+        assert result["content"] == {"exists": False, "path": str(tmp_path / "missing.txt")}
+
+    @pytest.mark.parametrize("data, encoding", [
+        (b"plain text", "utf-8"),
+        (("a" + "é" * 600).encode("utf-8"), "utf-8"),
+        ("\ufeffwith bom".encode("utf-8"), "utf-8-sig"),
+        ("wide text".encode("utf-16"), "utf-16"),
+    ])
+    def test_detects_encoding(self, tmp_path, data, encoding):
+        """Should detect the encoding from the BOM, tolerating a split last character."""
+        test_file = tmp_path / "text.txt"
+        test_file.write_bytes(data)
+
+        result = _handle_check_file({"path": str(test_file)})
+
+        assert result["content"]["readable"] is True
+        assert result["content"]["encoding"] == encoding
+
+    def test_binary_file_not_readable(self, tmp_path):
+        """Should report invalid text as unreadable."""
+        test_file = tmp_path / "blob.bin"
+        test_file.write_bytes(b"\x80\x81\xfe\x00")
+
+        result = _handle_check_file({"path": str(test_file)})
+
+        assert result["content"]["readable"] is False
+        assert "encoding" not in result["content"]
+
     def test_blocks_path_traversal(self):
         """Should block path traversal attempts."""
         result = _handle_check_file({"path": "../../../etc/passwd"})
@@ -587,6 +895,43 @@ class TestHandleWriteFile:
         assert test_file.exists()
         assert test_file.read_text() == "Hello, World!"
 
+    def test_writes_large_unicode_content_in_chunks(self, tmp_path, monkeypatch):
+        """Should write every chunk and report the encoded size."""
+        import agent_skills.adapters._files as files
+
+        monkeypatch.setattr(files, "WRITE_CHUNK_BYTES", 7)
+        test_file = tmp_path / "unicode.txt"
+        content = "héllo wörld " * 10
+
+        result = _handle_write_file({"path": str(test_file), "content": content})
+
+        assert result["ok"] is True
+        assert result["content"]["size"] == len(content.encode("utf-8"))
+        assert test_file.read_text(encoding="utf-8") == content
+
+    @pytest.mark.parametrize("content", ["x" * 11, "é" * 6])
+    def test_rejects_content_over_size_limit(self, tmp_path, monkeypatch, content):
+        """Should count the limit in encoded bytes, not characters."""
+        import agent_skills.adapters._files as files
+
+        monkeypatch.setattr(files, "MAX_WRITE_BYTES", 10)
+        test_file = tmp_path / "big.txt"
+
+        result = _handle_write_file({"path": str(test_file), "content": content})
+
+        assert result["ok"] is False
+        assert "exceeds maximum size" in result["content"]
+        assert not test_file.exists()
+
+    def test_creates_missing_parent_directories(self, tmp_path):
+        """Should create parent directories that do not exist yet."""
+        test_file = tmp_path / "a" / "b" / "output.txt"
+
+        result = _handle_write_file({"path": str(test_file), "content": "nested"})
+
+        assert result["ok"] is True
+        assert test_file.read_text() == "nested"
+
     def test_validates_json_content(self, tmp_path):
         """Should validate JSON content for .json files."""
         test_file = tmp_path / "data.json"
@@ -606,6 +951,28 @@ class TestHandleWriteFile:
         assert result["ok"] is False
         assert "json" in result["content"].lower()
 
+    def test_validates_json_without_orjson(self, tmp_path, monkeypatch):
+        """Should fall back to the stdlib parser when orjson is missing."""
+        monkeypatch.setattr("agent_skills._json.orjson", None)
+
+        result = _handle_write_file({
+            "path": str(tmp_path / "invalid.json"),
+            "content": '{"key": }',
+        })
+        assert result["ok"] is False
+        assert "Invalid JSON content" in result["content"]
+        assert not (tmp_path / "invalid.json").exists()
+
+    def test_rejects_mistyped_parameters(self, tmp_path):
+        """Should validate parameters before touching the filesystem."""
+        test_file = tmp_path / "typed.txt"
+
+        result = _handle_write_file({"path": str(test_file), "content": 123})
+
+        assert result["ok"] is False
+        assert "Invalid parameter 'content'" in result["content"]
+        assert not test_file.exists()
+
     def test_prevents_overwrite_by_default(self, tmp_path):
         """Should not overwrite existing files by default."""
         test_file = tmp_path / "existing.txt"
@@ -634,6 +1001,69 @@ class TestHandleWriteFile:
         assert result["ok"] is True
         assert test_file.read_text() == "new content"
 
+    def test_overwrite_replaces_instead_of_truncating(self, tmp_path):
+        """Should leave open mappings of the old file intact when overwriting."""
+        import mmap
+
+        test_file = tmp_path / "existing.bin"
+        test_file.write_text("original")
+
+        with open(test_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as old:
+            result = _handle_write_file({
+                "path": str(test_file),
+                "content": "new",
+                "overwrite": True,
+            })
+
+            assert result["ok"] is True
+            assert old[:] == b"original"
+        assert test_file.read_text() == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["existing.bin"]
+
+    def test_overwrite_keeps_file_mode(self, tmp_path):
+        """Should keep the permission bits of the file it replaces."""
+        import stat
+
+        script = tmp_path / "run.sh"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o750)
+
+        result = _handle_write_file({
+            "path": str(script),
+            "content": "#!/bin/sh\necho hi\n",
+            "overwrite": True,
+        })
+
+        assert result["ok"] is True
+        assert stat.S_IMODE(script.stat().st_mode) == 0o750
+        assert script.read_text() == "#!/bin/sh\necho hi\n"
+
+    def test_overwrite_writes_through_symlinks(self, tmp_path):
+        """Should replace the file a symlink points to and keep the link."""
+        real = tmp_path / "real.txt"
+        real.write_text("original")
+        link = tmp_path / "link.txt"
+        link.symlink_to(real)
+
+        result = _handle_write_file({"path": str(link), "content": "new", "overwrite": True})
+
+        assert result["ok"] is True
+        assert link.is_symlink()
+        assert real.read_text() == "new"
+
+    def test_overwrite_updates_every_hard_link(self, tmp_path):
+        """Should rewrite a hard-linked file in place so all links see the change."""
+        first = tmp_path / "first.txt"
+        first.write_text("original")
+        second = tmp_path / "second.txt"
+        second.hardlink_to(first)
+
+        result = _handle_write_file({"path": str(first), "content": "new", "overwrite": True})
+
+        assert result["ok"] is True
+        assert first.read_text() == second.read_text() == "new"
+        assert first.stat().st_ino == second.stat().st_ino
+
     def test_blocks_path_traversal(self):
         """Should block path traversal attempts."""
         result = _handle_write_file({
@@ -718,6 +1148,18 @@ class TestHandleDeleteFile:
 class TestHandleListFiles:
     """Tests for _handle_list_files handler."""
 
+    @pytest.mark.parametrize("size, expected", [
+        (0, "0.0B"),
+        (1023, "1023.0B"),
+        (1024, "1.0KB"),
+        (1536, "1.5KB"),
+        (5 * 1024**3, "5.0GB"),
+        (2048 * 1024**4, "2048.0TB"),
+    ])
+    def test_format_size(self, size, expected):
+        """Should pick the largest unit below the size, capped at TB."""
+        assert format_size(size) == expected
+
     def test_lists_directory_tree(self, tmp_path):
         """Should list directory structure in tree format."""
         # Create test structure
@@ -801,6 +1243,25 @@ class TestHandleListFiles:
         # Should contain size information
         assert "B)" in result["content"]["tree"] or "KB)" in result["content"]["tree"]
 
+    def test_renders_nested_tree_in_order(self, tmp_path):
+        """Should render nested directories depth-first with tree connectors."""
+        (tmp_path / "b.txt").write_text("b")
+        (tmp_path / "a" / "inner").mkdir(parents=True)
+        (tmp_path / "a" / "inner" / "deep.txt").write_text("d")
+        (tmp_path / "a" / "x.txt").write_text("x")
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+
+        result = _handle_list_files({"path": str(tmp_path)})
+
+        assert result["content"]["tree"].splitlines()[1:] == [
+            "├── a/",
+            "│   ├── inner/",
+            "│   │   └── deep.txt",
+            "│   └── x.txt",
+            "├── b.txt",
+            "└── link",
+        ]
+
     def test_handles_nonexistent_path(self):
         """Should handle nonexistent path gracefully."""
         result = _handle_list_files({"path": "/nonexistent/path"})
@@ -5,8 +5,9 @@ SkillsRepository and return properly formatted ToolResponse objects.
 """
 
 import json
+from collections import OrderedDict
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -21,21 +22,34 @@ from agent_skills.adapters.langchain import (
     SkillsSearchTool,
     build_langchain_tools,
 )
+from agent_skills.discovery.search import SkillSearchIndex
 from agent_skills.exceptions import SkillNotFoundError
 from agent_skills.models import (
     ExecutionPolicy,
     ExecutionResult,
+    ResourceContent,
     ResourcePolicy,
     SkillDescriptor,
 )
 from agent_skills.runtime.repository import SkillsRepository
 
+# What a SkillHandle.load_* call returns for the given content
+_loaded = ResourceContent.from_content
+
 
 @pytest.fixture
 def mock_repository():
     """Create a mock repository for testing."""
     # Use Mock without spec to avoid Python 3.14 type annotation issues
     repo = Mock()
+
+    # Rank with the real skill index over whatever list() returns
+    def search(query, limit=None):
+        index = SkillSearchIndex()
+        index.build(repo.list())
+        return index.search(query, limit)
+
+    repo.search.side_effect = search
     return repo
 
 
@@ -150,6 +164,78 @@ class TestSkillsListTool:
         assert "RuntimeError" in response["content"]
         assert "Database error" in response["content"]
 
+    def test_list_caches_response_per_snapshot(self, mock_repository, sample_skills):
+        """Test that repeated queries reuse the response until a refresh."""
+        mock_repository.list.return_value = sample_skills
+        mock_repository.snapshot_id = 1
+        tool = SkillsListTool(repository=mock_repository)
+
+        first = tool._run(q="data")
+        assert tool._run(q="data") is first
+        assert mock_repository.list.call_count == 1
+
+        mock_repository.snapshot_id = 2
+        tool._run(q="data")
+        assert mock_repository.list.call_count == 2
+
+    def test_list_padded_query_shares_cache_entry(self, mock_repository, sample_skills):
+        """Test that surrounding whitespace does not create a separate entry."""
+        mock_repository.list.return_value = sample_skills
+        tool = SkillsListTool(repository=mock_repository)
+
+        first = tool._run(q="csv")
+        assert tool._run(q=" csv ") is first
+        assert json.loads(first)["meta"]["query"] == "csv"
+
+    def test_list_cache_is_bounded(self, mock_repository, sample_skills, monkeypatch):
+        """Test that the response cache evicts the least recently used query."""
+        import agent_skills.adapters.langchain as langchain_adapter
+
+        monkeypatch.setattr(langchain_adapter, "_LIST_RESPONSE_CACHE_SIZE", 2)
+        monkeypatch.setattr(langchain_adapter, "_list_response_cache", OrderedDict())
+        mock_repository.list.return_value = sample_skills
+        tool = SkillsListTool(repository=mock_repository)
+
+        for q in ("data", "api", "csv"):
+            tool._run(q=q)
+
+        assert len(langchain_adapter._list_response_cache) == 2
+        assert (mock_repository.snapshot_id, "data") not in langchain_adapter._list_response_cache
+
+    def test_list_cache_does_not_keep_repository_alive(self, tmp_path):
+        """Test that cached responses do not pin their repository."""
+        import gc
+        import weakref
+
+        repository = SkillsRepository(roots=[tmp_path])
+        repository.refresh()
+        SkillsListTool(repository=repository)._run(q="data")
+        ref = weakref.ref(repository)
+
+        del repository
+        gc.collect()
+
+        assert ref() is None
+
+
+    def test_ainvoke_runs_on_tool_worker_pool(self, mock_repository, sample_skills):
+        """Test that async calls return the sync response from a tool thread."""
+        import asyncio
+        import threading
+
+        threads = []
+
+        def list_skills():
+            threads.append(threading.current_thread().name)
+            return sample_skills
+
+        mock_repository.list.side_effect = list_skills
+        tool = SkillsListTool(repository=mock_repository)
+
+        result = asyncio.run(tool.ainvoke({}))
+
+        assert json.loads(result)["meta"]["count"] == 2
+        assert threads[0].startswith("agent-skills-tool")
 
 class TestSkillsActivateTool:
     """Tests for SkillsActivateTool."""
@@ -165,7 +251,9 @@ class TestSkillsActivateTool:
     def test_activate_skill(self, mock_repository):
         """Test activating a skill and loading instructions."""
         mock_handle = Mock()
-        mock_handle.instructions.return_value = "# Data Processor\n\nProcess CSV files."
+        mock_handle.load_instructions.return_value = _loaded(
+            "# Data Processor\n\nProcess CSV files."
+        )
         mock_repository.open.return_value = mock_handle
 
         tool = SkillsActivateTool(repository=mock_repository)
@@ -184,12 +272,12 @@ class TestSkillsActivateTool:
         assert response["truncated"] is False
 
         mock_repository.open.assert_called_once_with("data-processor")
-        mock_handle.instructions.assert_called_once()
+        mock_handle.load_instructions.assert_called_once()
 
     def test_activate_skill_empty_instructions(self, mock_repository):
         """Test activating a skill with empty instructions."""
         mock_handle = Mock()
-        mock_handle.instructions.return_value = ""
+        mock_handle.load_instructions.return_value = _loaded("")
         mock_repository.open.return_value = mock_handle
 
         tool = SkillsActivateTool(repository=mock_repository)
@@ -202,6 +290,42 @@ class TestSkillsActivateTool:
         assert response["content"] == ""
         assert response["bytes"] == 0
 
+    def test_activate_reuses_response_for_same_handle(self, mock_repository):
+        """Test that the serialized response is reused while the handle is unchanged."""
+        mock_handle = Mock()
+        mock_handle.load_instructions.return_value = _loaded("# Data Processor")
+        mock_repository.open.return_value = mock_handle
+        tool = SkillsActivateTool(repository=mock_repository)
+
+        first = tool._run(name="data-processor")
+        assert tool._run(name="data-processor") is first
+        mock_handle.load_instructions.assert_called_once()
+
+        new_handle = Mock()
+        new_handle.load_instructions.return_value = _loaded("# Updated")
+        mock_repository.open.return_value = new_handle
+
+        response = json.loads(tool._run(name="data-processor"))
+        assert response["content"] == "# Updated"
+
+    def test_activate_warms_reference_index(self, mock_repository, monkeypatch):
+        """Test that activation indexes the skill's references in the background."""
+        executor = Mock()
+        monkeypatch.setattr(
+            "agent_skills.adapters.langchain.get_tool_executor", lambda: executor
+        )
+        mock_handle = Mock()
+        mock_handle.load_instructions.return_value = _loaded("# Data Processor")
+        mock_repository.open.return_value = mock_handle
+        tool = SkillsActivateTool(repository=mock_repository)
+
+        tool._run(name="data-processor")
+        tool._run(name="data-processor")
+
+        executor.submit.assert_called_once_with(
+            mock_repository.warm_references, "data-processor"
+        )
+
     def test_activate_nonexistent_skill(self, mock_repository):
         """Test activating a skill that doesn't exist."""
         mock_repository.open.side_effect = SkillNotFoundError("Skill 'nonexistent' not found")
@@ -233,7 +357,7 @@ class TestSkillsReadTool:
     def test_read_reference_file(self, mock_repository):
         """Test reading a reference file."""
         mock_handle = Mock()
-        mock_handle.read_reference.return_value = "# API Documentation\n\nEndpoints..."
+        mock_handle.load_reference.return_value = _loaded("# API Documentation\n\nEndpoints...")
         mock_repository.open.return_value = mock_handle
 
         tool = SkillsReadTool(repository=mock_repository)
@@ -250,12 +374,12 @@ class TestSkillsReadTool:
         assert response["bytes"] > 0
         assert response["sha256"] is not None
 
-        mock_handle.read_reference.assert_called_once_with("api-docs.md", max_bytes=None)
+        mock_handle.load_reference.assert_called_once_with("api-docs.md", max_bytes=None)
 
     def test_read_reference_with_prefix(self, mock_repository):
         """Test reading a reference file with references/ prefix."""
         mock_handle = Mock()
-        mock_handle.read_reference.return_value = "Content"
+        mock_handle.load_reference.return_value = _loaded("Content")
         mock_repository.open.return_value = mock_handle
 
         tool = SkillsReadTool(repository=mock_repository)
@@ -268,12 +392,12 @@ class TestSkillsReadTool:
         assert response["path"] == "references/api-docs.md"
 
         # Should strip the prefix when calling read_reference
-        mock_handle.read_reference.assert_called_once_with("api-docs.md", max_bytes=None)
+        mock_handle.load_reference.assert_called_once_with("api-docs.md", max_bytes=None)
 
     def test_read_asset_file(self, mock_repository):
         """Test reading an asset file."""
         mock_handle = Mock()
-        mock_handle.read_asset.return_value = b"\x89PNG\r\n\x1a\n"
+        mock_handle.load_asset.return_value = _loaded(b"\x89PNG\r\n\x1a\n")
         mock_repository.open.return_value = mock_handle
 
         tool = SkillsReadTool(repository=mock_repository)
@@ -290,12 +414,14 @@ class TestSkillsReadTool:
         assert isinstance(response["content"], str)
         assert response["bytes"] > 0
 
-        mock_handle.read_asset.assert_called_once_with("diagram.png", max_bytes=None)
+        mock_handle.load_asset.assert_called_once_with(
+            "diagram.png", max_bytes=None, stream=True
+        )
 
     def test_read_with_max_bytes(self, mock_repository):
         """Test reading a file with max_bytes limit."""
         mock_handle = Mock()
-        mock_handle.read_reference.return_value = "Content"
+        mock_handle.load_reference.return_value = _loaded("Content")
         mock_repository.open.return_value = mock_handle
 
         tool = SkillsReadTool(repository=mock_repository)
@@ -306,12 +432,12 @@ class TestSkillsReadTool:
 
         assert response["ok"] is True
 
-        mock_handle.read_reference.assert_called_once_with("api-docs.md", max_bytes=1000)
+        mock_handle.load_reference.assert_called_once_with("api-docs.md", max_bytes=1000)
 
     def test_read_nonexistent_file(self, mock_repository):
         """Test reading a file that doesn't exist."""
         mock_handle = Mock()
-        mock_handle.read_reference.side_effect = FileNotFoundError("File not found")
+        mock_handle.load_reference.side_effect = FileNotFoundError("File not found")
         mock_repository.open.return_value = mock_handle
 
         tool = SkillsReadTool(repository=mock_repository)
@@ -521,77 +647,56 @@ class TestSkillsSearchTool:
 
     def test_search_with_results(self, mock_repository):
         """Test searching with results found."""
-        mock_handle = Mock()
-        mock_descriptor = Mock()
-        mock_descriptor.path = Path("/skills/data-processor")
-        mock_handle.descriptor.return_value = mock_descriptor
-        mock_repository.open.return_value = mock_handle
+        mock_repository.search_references.return_value = [
+            {
+                "path": "api-docs.md",
+                "line_num": 42,
+                "context": "...authentication token...",
+            },
+            {
+                "path": "guide.md",
+                "line_num": 15,
+                "context": "...token validation...",
+            },
+        ]
 
-        # Mock the FullTextSearcher
-        with patch("agent_skills.adapters.langchain.FullTextSearcher") as mock_searcher_class:
-            mock_searcher = Mock()
-            mock_searcher.search.return_value = [
-                {
-                    "path": "api-docs.md",
-                    "line_num": 42,
-                    "context": "...authentication token...",
-                },
-                {
-                    "path": "guide.md",
-                    "line_num": 15,
-                    "context": "...token validation...",
-                },
-            ]
-            mock_searcher_class.return_value = mock_searcher
-
-            tool = SkillsSearchTool(repository=mock_repository)
-            result = tool._run(name="data-processor", query="token")
-
-            # Parse JSON response
-            response = json.loads(result)
-
-            assert response["ok"] is True
-            assert response["type"] == "search_results"
-            assert response["skill"] == "data-processor"
-            assert len(response["content"]) == 2
-            assert response["content"][0]["path"] == "api-docs.md"
-            assert response["content"][0]["line_num"] == 42
-            assert response["meta"]["query"] == "token"
-            assert response["meta"]["result_count"] == 2
-
-            # Verify searcher was called correctly
-            mock_searcher.search.assert_called_once_with(
-                directory=Path("/skills/data-processor/references"),
-                query="token",
-                max_results=20,
-            )
+        tool = SkillsSearchTool(repository=mock_repository)
+        result = tool._run(name="data-processor", query="token")
+
+        # Parse JSON response
+        response = json.loads(result)
+
+        assert response["ok"] is True
+        assert response["type"] == "search_results"
+        assert response["skill"] == "data-processor"
+        assert len(response["content"]) == 2
+        assert response["content"][0]["path"] == "api-docs.md"
+        assert response["content"][0]["line_num"] == 42
+        assert response["meta"]["query"] == "token"
+        assert response["meta"]["result_count"] == 2
+
+        # Verify the reference index was queried correctly
+        mock_repository.search_references.assert_called_once_with(
+            "data-processor", "token", max_results=20
+        )
 
     def test_search_no_results(self, mock_repository):
         """Test searching with no results found."""
-        mock_handle = Mock()
-        mock_descriptor = Mock()
-        mock_descriptor.path = Path("/skills/data-processor")
-        mock_handle.descriptor.return_value = mock_descriptor
-        mock_repository.open.return_value = mock_handle
+        mock_repository.search_references.return_value = []
 
-        with patch("agent_skills.adapters.langchain.FullTextSearcher") as mock_searcher_class:
-            mock_searcher = Mock()
-            mock_searcher.search.return_value = []
-            mock_searcher_class.return_value = mock_searcher
-
-            tool = SkillsSearchTool(repository=mock_repository)
-            result = tool._run(name="data-processor", query="nonexistent")
+        tool = SkillsSearchTool(repository=mock_repository)
+        result = tool._run(name="data-processor", query="nonexistent")
 
-            # Parse JSON response
-            response = json.loads(result)
+        # Parse JSON response
+        response = json.loads(result)
 
-            assert response["ok"] is True
-            assert response["content"] == []
-            assert response["meta"]["result_count"] == 0
+        assert response["ok"] is True
+        assert response["content"] == []
+        assert response["meta"]["result_count"] == 0
 
     def test_search_exception(self, mock_repository):
         """Test search with exception."""
-        mock_repository.open.side_effect = SkillNotFoundError("Skill not found")
+        mock_repository.search_references.side_effect = SkillNotFoundError("Skill not found")
 
         tool = SkillsSearchTool(repository=mock_repository)
         result = tool._run(name="nonexistent", query="test")
@@ -651,6 +756,14 @@ class TestBuildLangchainTools:
             assert hasattr(tool, "args_schema")
             assert issubclass(tool.args_schema, BaseModel)
 
+    def test_file_tools_document_path_scope(self, mock_repository):
+        """File tool path parameters say absolute paths are unrestricted."""
+        tools = {tool.name: tool for tool in build_langchain_tools(mock_repository)}
+
+        for name in ("check_file", "write_file", "delete_file", "list_files"):
+            field = tools[f"skills_{name}"].args_schema.model_fields["path"]
+            assert "absolute paths are not restricted" in field.description
+
 
 class TestLangChainIntegration:
     """Integration tests for LangChain adapter."""
@@ -690,3 +803,37 @@ class TestLangChainIntegration:
         response = json.loads(result)
         assert response["ok"] is False
         assert "RuntimeError" in response["content"]
+
+    def test_list_filter_uses_repository_search(self, tmp_path):
+        """Test that list queries are ranked by the repository's search index."""
+        for name, description in (
+            ("csv-tools", "Convert files"),
+            ("data-processor", "Process CSV files"),
+            ("web-fetcher", "Download pages"),
+        ):
+            skill_dir = tmp_path / name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n"
+            )
+        repository = SkillsRepository(roots=[tmp_path])
+        repository.refresh()
+
+        response = json.loads(SkillsListTool(repository=repository)._run(q="CSV"))
+
+        assert [s["name"] for s in response["content"]] == ["csv-tools", "data-processor"]
+
+    def test_list_filter_keeps_mid_word_matches(self, tmp_path):
+        """Test that skills matching only mid-word are listed after ranked hits."""
+        for name in ("bigdata-tool", "data-processor"):
+            skill_dir = tmp_path / name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: Tools\n---\n\n# {name}\n"
+            )
+        repository = SkillsRepository(roots=[tmp_path])
+        repository.refresh()
+
+        response = json.loads(SkillsListTool(repository=repository)._run(q="data"))
+
+        assert [s["name"] for s in response["content"]] == ["data-processor", "bigdata-tool"]
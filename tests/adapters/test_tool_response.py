@@ -1,6 +1,7 @@
 """Unit tests for tool response helper functions."""
 
 import hashlib
+import json
 from pathlib import Path
 
 import pytest
@@ -14,6 +15,9 @@ from agent_skills.adapters.tool_response import (
     build_reference_response,
     build_search_response,
     safe_tool_call,
+    safe_tool_call_async,
+    serialize_error_response,
+    serialize_response,
 )
 from agent_skills.exceptions import (
     PathTraversalError,
@@ -209,6 +213,20 @@ class TestBuildReferenceResponse:
         assert response.meta == {"format": "markdown"}
 
 
+    def test_build_reference_response_precomputed_size(self):
+        """Test that precomputed digest and size are used as given."""
+        response = build_reference_response(
+            "test-skill",
+            "references/guide.md",
+            "héllo",
+            sha256="precomputed",
+            byte_count=6,
+        )
+
+        assert response.sha256 == "precomputed"
+        assert response.bytes == 6
+
+
 class TestBuildAssetResponse:
     """Tests for build_asset_response."""
     
@@ -260,6 +278,19 @@ class TestBuildAssetResponse:
         assert response.bytes == 0
 
 
+    def test_build_asset_response_precomputed_sha256(self):
+        """Test that a precomputed digest is used instead of hashing."""
+        response = build_asset_response(
+            "test-skill",
+            "assets/data.bin",
+            b"content",
+            sha256="precomputed",
+        )
+
+        assert response.sha256 == "precomputed"
+        assert response.bytes == 7
+
+
 class TestBuildExecutionResponse:
     """Tests for build_execution_response."""
     
@@ -414,6 +445,19 @@ class TestBuildErrorResponse:
         assert response.truncated is False
         assert response.meta["error_type"] == "SkillNotFoundError"
     
+    def test_build_error_response_skips_traceback_by_default(self):
+        """Test that tracebacks are not formatted unless requested."""
+        from unittest.mock import patch
+
+        error = ValueError("bad value")
+
+        with patch("traceback.format_exc") as format_exc:
+            response = build_error_response("test-skill", error)
+
+        format_exc.assert_not_called()
+        assert "traceback" not in response.meta
+        assert "error_details" not in response.meta
+
     def test_build_error_response_with_path(self):
         """Test building error response with path."""
         error = PathTraversalError("Path contains '..' component")
@@ -543,6 +587,37 @@ class TestSafeToolCall:
         assert response.meta["custom"] == "value"
 
 
+class TestSafeToolCallAsync:
+    """Tests for safe_tool_call_async wrapper."""
+
+    def test_awaits_coroutine_operation(self):
+        """Test that coroutine functions are awaited."""
+        import asyncio
+
+        async def operation():
+            return build_instructions_response("test-skill", "content", "SKILL.md")
+
+        response = asyncio.run(safe_tool_call_async("test-skill", operation))
+
+        assert response.ok is True
+        assert response.type == "instructions"
+
+    def test_runs_sync_operation_and_converts_errors(self):
+        """Test that sync callables run and exceptions become error responses."""
+        import asyncio
+
+        def operation():
+            raise SkillNotFoundError("Skill not found")
+
+        response = asyncio.run(
+            safe_tool_call_async("test-skill", operation, path="SKILL.md")
+        )
+
+        assert response.ok is False
+        assert response.path == "SKILL.md"
+        assert "SkillNotFoundError" in response.content
+
+
 class TestToolResponseSerialization:
     """Tests for ToolResponse serialization with helper functions."""
     
@@ -615,3 +690,78 @@ class TestToolResponseSerialization:
         assert isinstance(response_dict, dict)
         assert response_dict["ok"] is False
         assert isinstance(response_dict["content"], str)
+
+
+class TestSerializeResponse:
+    """Tests for serialize_response."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        """Run each test with and without orjson."""
+        if request.param == "stdlib":
+            monkeypatch.setattr("agent_skills._json.orjson", None)
+        return request.param
+
+    def test_compact_by_default(self, backend):
+        """Test that output has no indentation or separator spaces."""
+        response = build_instructions_response("test-skill", "# Hé", "SKILL.md")
+
+        text = serialize_response(response)
+
+        assert "\n" not in text
+        assert '"ok":true' in text
+        assert json.loads(text) == response.to_dict()
+
+    def test_pretty(self, backend):
+        """Test that pretty=True indents with two spaces."""
+        response = build_error_response("test-skill", ValueError("bad"))
+
+        text = serialize_response(response, pretty=True)
+
+        assert '\n  "ok": false' in text
+        assert json.loads(text) == response.to_dict()
+
+    def test_matches_to_dict_key_order(self, backend):
+        """Test that responses encode exactly like their to_dict() form."""
+        response = build_error_response("test-skill", ValueError("bad"), path="a.md")
+        response.meta["where"] = Path("/tmp/x")
+
+        assert serialize_response(response) == serialize_response(response.to_dict())
+
+    def test_accepts_dict_and_stringifies_unknown_values(self, backend):
+        """Test that plain dicts are accepted and Paths become strings."""
+        text = serialize_response({"ok": True, "path": Path("/tmp/x")})
+
+        assert json.loads(text) == {"ok": True, "path": "/tmp/x"}
+
+
+class TestSerializeErrorResponse:
+    """Tests for serialize_error_response."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        """Run each test with and without orjson."""
+        if request.param == "stdlib":
+            monkeypatch.setattr("agent_skills._json.orjson", None)
+        return request.param
+
+    @pytest.mark.parametrize("error, path", [
+        (SkillNotFoundError("Skill 'nope' not found"), None),
+        (PathTraversalError('Path "../x" escapes\n the root: é'), "../x"),
+        (ValueError("\x01 control"), "a\tb.md"),
+    ])
+    def test_matches_full_serialization(self, backend, error, path):
+        """Test that the template output is identical to the generic path."""
+        expected = serialize_response(build_error_response("skill", error, path=path))
+
+        assert serialize_error_response("skill", error, path=path) == expected
+
+    def test_falls_back_for_errors_with_details(self, backend):
+        """Test that exception attributes still end up in error_details."""
+        error = ValueError("bad")
+        error.limit = 10
+
+        data = json.loads(serialize_error_response("skill", error))
+
+        assert data["meta"]["error_details"] == {"limit": 10}
+
@@ -136,6 +136,107 @@ def test_open_raises_error_for_unknown_skill(temp_skill_dir):
     assert "not found" in str(exc_info.value).lower()
 
 
+def test_open_reuses_handle_until_skill_changes(temp_skill_dir):
+    """Test that open() caches handles, keyed by SKILL.md's mtime."""
+    import os
+
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    handle = repo.open("test-skill")
+    assert repo.open("test-skill") is handle
+
+    skill_md = temp_skill_dir / "test-skill" / "SKILL.md"
+    st = skill_md.stat()
+    os.utime(skill_md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    changed = repo.open("test-skill")
+    assert changed is not handle
+
+    repo.refresh()
+    assert repo.open("test-skill") is not changed
+
+
+def test_open_evicts_least_recently_used_handle(temp_skill_dir, monkeypatch):
+    """Test that the handle cache is bounded by HANDLE_CACHE_SIZE."""
+    for name in ("skill-a", "skill-b"):
+        skill_dir = temp_skill_dir / name
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {name}\n---\n")
+    monkeypatch.setattr(SkillsRepository, "HANDLE_CACHE_SIZE", 2)
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    first = repo.open("test-skill")
+    second = repo.open("skill-a")
+    assert repo.open("test-skill") is first
+    repo.open("skill-b")
+
+    assert repo.open("test-skill") is first
+    assert repo.open("skill-a") is not second
+
+
+def test_open_is_thread_safe_under_eviction(temp_skill_dir, monkeypatch):
+    """Test that concurrent opens that keep evicting handles never fail."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    names = [f"skill-{i}" for i in range(8)]
+    for name in names:
+        skill_dir = temp_skill_dir / name
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {name}\n---\n")
+    monkeypatch.setattr(SkillsRepository, "HANDLE_CACHE_SIZE", 2)
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        handles = list(pool.map(repo.open, names * 200))
+
+    assert [h.descriptor().name for h in handles] == names * 200
+    assert len(repo._handle_cache) == 2
+
+
+def test_digest_is_thread_safe_under_eviction(temp_skill_dir, monkeypatch):
+    """Test that concurrent digests that keep evicting entries never fail."""
+    import hashlib
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = []
+    for i in range(8):
+        path = temp_skill_dir / "test-skill" / f"file-{i}.txt"
+        path.write_text(f"content {i}")
+        paths.append(path)
+    monkeypatch.setattr(SkillsRepository, "DIGEST_CACHE_SIZE", 2)
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        digests = list(pool.map(repo.digest, paths * 200))
+
+    expected = [hashlib.sha256(p.read_bytes()).hexdigest() for p in paths]
+    assert digests == expected * 200
+    assert len(repo._digest_cache) == 2
+
+
+def test_turn_pins_handles_without_restat(temp_skill_dir, monkeypatch):
+    """Test that open() inside turn() skips the SKILL.md stat after the first open."""
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    with repo.turn():
+        handle = repo.open("test-skill")
+        monkeypatch.setattr(Path, "stat", None)
+        with repo.turn():
+            assert repo.open("test-skill") is handle
+        assert repo.open("test-skill") is handle
+        monkeypatch.undo()
+
+    # A refresh inside a turn is not served stale pins
+    with repo.turn():
+        pinned = repo.open("test-skill")
+        repo.refresh()
+        assert repo.open("test-skill") is not pinned
+
+
 def test_open_before_refresh_raises_error():
     """Test that open() raises error if called before refresh()."""
     repo = SkillsRepository(roots=[Path("./skills")])
@@ -195,6 +296,129 @@ name: invalid-skill
     assert skills[0].name == "test-skill"
 
 
+def test_snapshot_id_changes_on_refresh(temp_skill_dir):
+    """Test that every refresh() and every repository gets a new snapshot id."""
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    other = SkillsRepository(roots=[temp_skill_dir])
+    initial = repo.snapshot_id
+
+    repo.refresh()
+
+    assert repo.snapshot_id != initial
+    assert other.snapshot_id not in (initial, repo.snapshot_id)
+
+
+def test_search_uses_refreshed_skills(temp_skill_dir):
+    """Test that search() only finds skills after refresh() indexes them."""
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    assert repo.search("unit") == []
+
+    repo.refresh()
+
+    assert [s.name for s in repo.search("unit testing")] == ["test-skill"]
+
+
+def test_search_references(temp_skill_dir):
+    """Test that search_references() searches the named skill's references/."""
+    refs = temp_skill_dir / "test-skill" / "references"
+    refs.mkdir()
+    (refs / "notes.md").write_text("Use the staging endpoint for tests.\n")
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    results = repo.search_references("test-skill", "staging")
+
+    assert results == [
+        {"path": "notes.md", "line_num": 1, "context": "Use the staging endpoint for tests."}
+    ]
+    with pytest.raises(SkillNotFoundError):
+        repo.search_references("missing", "staging")
+
+
+def test_digest_is_cached_until_file_changes(temp_skill_dir):
+    """Test that digest() reuses cached hashes and rehashes modified files."""
+    import hashlib
+    from unittest.mock import patch
+
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    asset = temp_skill_dir / "test-skill" / "data.bin"
+    asset.write_bytes(b"first")
+    assert repo.digest(asset) == hashlib.sha256(b"first").hexdigest()
+
+    with patch("builtins.open", side_effect=AssertionError("re-read")):
+        assert repo.digest(asset) == hashlib.sha256(b"first").hexdigest()
+
+    asset.write_bytes(b"second, longer")
+    assert repo.digest(asset) == hashlib.sha256(b"second, longer").hexdigest()
+
+
+def test_repeat_asset_reads_reuse_the_cached_digest(temp_skill_dir, monkeypatch):
+    """Test that handles from open() hash an unchanged asset only once."""
+    import hashlib
+
+    assets = temp_skill_dir / "test-skill" / "assets"
+    assets.mkdir()
+    (assets / "logo.png").write_bytes(b"\x89PNG" * 100)
+    repo = SkillsRepository(
+        roots=[temp_skill_dir],
+        resource_policy=ResourcePolicy(allow_binary_assets=True),
+    )
+    repo.refresh()
+
+    calls = []
+    real_file_digest = hashlib.file_digest
+
+    def counting_file_digest(f, digest):
+        calls.append(f.name)
+        return real_file_digest(f, digest)
+
+    monkeypatch.setattr(hashlib, "file_digest", counting_file_digest)
+
+    expected = hashlib.sha256(b"\x89PNG" * 100).hexdigest()
+    for stream in (False, True, False):
+        assert repo.open("test-skill").load_asset("logo.png", stream=stream).sha256 == expected
+    assert len(calls) == 1
+    assert list(repo._digest_cache) == [assets / "logo.png"]
+
+
+def test_digest_cache_evicts_least_recently_used(temp_skill_dir, monkeypatch):
+    """Test that the digest cache is bounded by DIGEST_CACHE_SIZE."""
+    monkeypatch.setattr(SkillsRepository, "DIGEST_CACHE_SIZE", 2)
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    files = []
+    for name in ("a.bin", "b.bin", "c.bin"):
+        path = temp_skill_dir / "test-skill" / name
+        path.write_bytes(name.encode())
+        files.append(path)
+
+    repo.digest(files[0])
+    repo.digest(files[1])
+    repo.digest(files[0])
+    repo.digest(files[2])
+
+    assert list(repo._digest_cache) == [files[0], files[2]]
+
+
+def test_refresh_prunes_digests_outside_skills(temp_skill_dir):
+    """Test that refresh() forgets digests for files outside discovered skills."""
+    repo = SkillsRepository(roots=[temp_skill_dir])
+    repo.refresh()
+
+    inside = temp_skill_dir / "test-skill" / "SKILL.md"
+    outside = temp_skill_dir / "stray.txt"
+    outside.write_text("stray")
+    repo.digest(inside)
+    repo.digest(outside)
+
+    repo.refresh()
+
+    assert set(repo._digest_cache) == {inside}
+
+
 def test_repository_with_policies(temp_skill_dir):
     """Test that repository passes policies to SkillHandle."""
     resource_policy = ResourcePolicy(max_file_bytes=50_000)
@@ -388,6 +388,27 @@ class TestJSONLAuditSink:
         
         assert logged_event["path"] == "références/文档.md"
         assert logged_event["detail"]["message"] == "Hello 世界 🌍"
+
+    def test_stdlib_fallback_writes_same_events(self, tmp_path, monkeypatch):
+        """Test that lines written without orjson parse to the same events."""
+        event = AuditEvent(
+            ts=datetime(2024, 1, 1, 12, 0, 0),
+            kind="read",
+            skill="unicode-skill",
+            path="références/文档.md",
+            detail={"count": 3},
+        )
+        fast_sink = JSONLAuditSink(tmp_path / "fast.jsonl")
+        fast_sink.log(event)
+        monkeypatch.setattr("agent_skills._json.orjson", None)
+        slow_sink = JSONLAuditSink(tmp_path / "slow.jsonl")
+        slow_sink.log(event)
+
+        fast_lines = (tmp_path / "fast.jsonl").read_text(encoding="utf-8").splitlines()
+        slow_lines = (tmp_path / "slow.jsonl").read_text(encoding="utf-8").splitlines()
+
+        assert len(fast_lines) == len(slow_lines) == 1
+        assert json.loads(fast_lines[0]) == json.loads(slow_lines[0]) == event.to_dict()
     
     def test_error_event_logging(self, tmp_path):
         """Test logging error events with error details."""
@@ -351,6 +351,54 @@ class TestSkillHandleReadReference:
         # Should be truncated
         assert len(content) <= 10
     
+    def test_load_reference_reuses_unchanged_content(
+        self, skill_descriptor, default_resource_policy, mock_audit_sink, monkeypatch
+    ):
+        """Test that repeat reads reuse the loaded content but still charge the budget."""
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=default_resource_policy,
+            execution_policy=ExecutionPolicy(),
+            audit_sink=mock_audit_sink,
+        )
+        first = handle.load_reference("api-docs.md")
+        head = handle.load_reference("api-docs.md", max_bytes=10)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re-read")
+
+        monkeypatch.setattr(handle._resource_reader, "read_text", fail)
+        assert handle.load_reference("api-docs.md") is first
+        assert handle.load_reference("api-docs.md", max_bytes=10) is head
+        assert handle._resource_reader.get_session_bytes_read() == 2 * (first.bytes + head.bytes)
+        assert len(mock_audit_sink.get_events_by_kind("read")) == 4
+
+        monkeypatch.undo()
+        path = skill_descriptor.path / "references" / "api-docs.md"
+        path.write_text("# Rewritten\n", encoding="utf-8")
+        assert handle.load_reference("api-docs.md").content == "# Rewritten\n"
+
+    def test_reference_cache_is_bounded(
+        self, skill_descriptor, default_resource_policy, monkeypatch
+    ):
+        """Test that cached references are evicted beyond REFERENCE_CACHE_BYTES."""
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=default_resource_policy,
+            execution_policy=ExecutionPolicy(),
+        )
+        docs = handle.load_reference("api-docs.md")
+        guide = handle.load_reference("guide.txt")
+        monkeypatch.setattr(SkillHandle, "REFERENCE_CACHE_BYTES", docs.bytes + guide.bytes)
+
+        handle.load_reference("api-docs.md")
+        handle.load_reference("examples/example.json")
+
+        assert [key[0] for key in handle._reference_cache] == [
+            "api-docs.md", "examples/example.json"
+        ]
+        assert handle._reference_cache_bytes <= handle.REFERENCE_CACHE_BYTES
+
     def test_read_reference_nonexistent(
         self, skill_descriptor, default_resource_policy
     ):
@@ -364,6 +412,19 @@ class TestSkillHandleReadReference:
         
         with pytest.raises(FileNotFoundError):
             handle.read_reference("nonexistent.md")
+
+    def test_read_reference_below_a_file(
+        self, skill_descriptor, default_resource_policy
+    ):
+        """Test that a path treating a file as a directory is not found."""
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=default_resource_policy,
+            execution_policy=ExecutionPolicy(),
+        )
+
+        with pytest.raises(FileNotFoundError):
+            handle.read_reference("api-docs.md/section.md")
     
     def test_read_reference_path_traversal(
         self, skill_descriptor, default_resource_policy
@@ -439,6 +500,116 @@ class TestSkillHandleReadAsset:
         assert read_events[0].path == "assets/data.bin"
         assert read_events[0].bytes == 5
     
+    def test_read_asset_stream(self, skill_descriptor, mock_audit_sink):
+        """Test that stream=True returns a memory-mapped view of the asset."""
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=ResourcePolicy(allow_binary_assets=True),
+            execution_policy=ExecutionPolicy(),
+            audit_sink=mock_audit_sink,
+        )
+
+        content = handle.read_asset("data.bin", stream=True)
+
+        assert isinstance(content, memoryview)
+        assert content == b"\x00\x01\x02\x03\x04"
+        assert mock_audit_sink.get_events_by_kind("read")[0].bytes == 5
+
+    def test_load_returns_digest_of_returned_content(self, skill_descriptor):
+        """Test that load_* results carry the digest and size of their own content."""
+        import hashlib
+
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=ResourcePolicy(allow_binary_assets=True),
+            execution_policy=ExecutionPolicy(),
+        )
+
+        asset = handle.load_asset("data.bin")
+        assert (asset.content, asset.sha256, asset.bytes) == (
+            b"\x00\x01\x02\x03\x04", hashlib.sha256(b"\x00\x01\x02\x03\x04").hexdigest(), 5
+        )
+
+        full = handle.load_reference("api-docs.md")
+        head = handle.load_reference("api-docs.md", max_bytes=10)
+        for loaded in (full, head):
+            encoded = loaded.content.encode("utf-8")
+            assert loaded.sha256 == hashlib.sha256(encoded).hexdigest()
+            assert loaded.bytes == len(encoded)
+        assert (full.truncated, head.truncated) == (False, True)
+
+        instructions = handle.load_instructions()
+        assert instructions.content == handle.instructions()
+        assert instructions.sha256 == (
+            hashlib.sha256(instructions.content.encode("utf-8")).hexdigest()
+        )
+
+    def test_concurrent_loads_get_their_own_digests(self, skill_descriptor):
+        """Test that threads sharing a handle never see each other's digests."""
+        import hashlib
+        from concurrent.futures import ThreadPoolExecutor
+
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=ResourcePolicy(),
+            execution_policy=ExecutionPolicy(),
+        )
+
+        def load(max_bytes):
+            loaded = handle.load_reference("api-docs.md", max_bytes=max_bytes)
+            encoded = loaded.content.encode("utf-8")
+            return loaded.sha256 == hashlib.sha256(encoded).hexdigest()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert all(pool.map(load, [5, 10, 15, None] * 50))
+
+    def test_whole_asset_reads_use_the_digest_hook(self, skill_descriptor):
+        """Test that untruncated asset reads take their digest from the hook."""
+        import hashlib
+        from unittest.mock import Mock
+
+        digest = Mock(return_value="cached-digest")
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=ResourcePolicy(allow_binary_assets=True),
+            execution_policy=ExecutionPolicy(),
+            digest=digest,
+        )
+
+        for stream in (False, True):
+            asset = handle.load_asset("data.bin", stream=stream)
+            assert (asset.sha256, asset.bytes, asset.truncated) == ("cached-digest", 5, False)
+        assert digest.call_count == 2
+        digest.assert_called_with(skill_descriptor.path / "assets" / "data.bin")
+
+        head = handle.load_asset("data.bin", max_bytes=2)
+        assert head.sha256 == hashlib.sha256(b"\x00\x01").hexdigest()
+        assert digest.call_count == 2
+
+    def test_asset_digest_matches_returned_bytes(self, skill_descriptor, monkeypatch):
+        """Test that the asset digest is of the returned buffer, not a re-read of the file."""
+        import hashlib
+
+        handle = SkillHandle(
+            descriptor=skill_descriptor,
+            resource_policy=ResourcePolicy(allow_binary_assets=True),
+            execution_policy=ExecutionPolicy(),
+            digest=lambda path: hashlib.sha256(path.read_bytes()).hexdigest(),
+        )
+        asset_path = skill_descriptor.path / "assets" / "data.bin"
+        real_read_binary = handle._resource_reader.read_binary
+
+        def read_then_rewrite(path, max_bytes=None):
+            result = real_read_binary(path, max_bytes)
+            asset_path.write_bytes(b"rewritten")
+            return result
+
+        monkeypatch.setattr(handle._resource_reader, "read_binary", read_then_rewrite)
+
+        asset = handle.load_asset("data.bin")
+
+        assert asset.sha256 == hashlib.sha256(asset.content).hexdigest()
+
     def test_read_asset_disabled(
         self, skill_descriptor, default_resource_policy
     ):
@@ -214,16 +214,16 @@ class TestSkillHandleCompleteWorkflow:
         )
         
         # Instructions should not be loaded yet
-        assert handle._instructions_cache is None
+        assert handle._instructions is None
         assert handle._body_offset is None
         
         # Load instructions
         instructions = handle.instructions()
         
         # Now they should be cached
-        assert handle._instructions_cache is not None
+        assert handle._instructions is not None
         assert handle._body_offset is not None
-        assert instructions == handle._instructions_cache
+        assert instructions == handle._instructions.content
         
         # Second call should return cached value
         instructions2 = handle.instructions()
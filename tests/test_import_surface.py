@@ -0,0 +1,115 @@
+"""Tests for the lazily resolved top-level package exports."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import agent_skills
+
+
+def _run_python(code: str, **env: str) -> str:
+    """Run code in a fresh interpreter and return its stripped stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **env},
+    )
+    return result.stdout.strip()
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy attribute resolution in agent_skills."""
+
+    def test_import_does_not_load_heavy_modules(self):
+        """Plain import should not pull in runtime, agent, or adapters."""
+        output = _run_python(
+            "import sys, agent_skills\n"
+            "print(sorted(m for m in sys.modules if m.startswith('agent_skills.')))"
+        )
+
+        assert "agent_skills.runtime" not in output
+        assert "agent_skills.agent" not in output
+        assert "agent_skills.adapters" not in output
+
+    def test_runtime_import_does_not_load_adapters(self):
+        """The runtime and resources layers should not depend on the adapters."""
+        output = _run_python(
+            "import sys, agent_skills.runtime\n"
+            "print(any(m.startswith('agent_skills.adapters') for m in sys.modules))"
+        )
+
+        assert output == "False"
+
+    def test_accessing_export_loads_only_its_module(self):
+        """Resolving a model should not import the runtime package."""
+        output = _run_python(
+            "import sys, agent_skills\n"
+            "agent_skills.SkillDescriptor\n"
+            "print('agent_skills.models' in sys.modules, 'agent_skills.runtime' in sys.modules)"
+        )
+
+        assert output == "True False"
+
+    def test_eager_import_env_resolves_everything(self):
+        """AGENT_SKILLS_EAGER_IMPORT=1 should resolve all exports at import time."""
+        output = _run_python(
+            "import sys, agent_skills\n"
+            "print(all(n in vars(agent_skills) for n in agent_skills.__all__))",
+            AGENT_SKILLS_EAGER_IMPORT="1",
+        )
+
+        assert output == "True"
+
+    @pytest.mark.parametrize("name", agent_skills.__all__)
+    def test_all_exports_resolve(self, name):
+        """Every name in __all__ should resolve to an object."""
+        assert getattr(agent_skills, name) is not None
+
+    def test_resolved_export_matches_source_module(self):
+        """Lazy export should be the same object as the defining module's."""
+        from agent_skills.runtime.repository import SkillsRepository
+
+        assert agent_skills.SkillsRepository is SkillsRepository
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = agent_skills.does_not_exist
+
+    def test_dir_lists_unresolved_exports(self):
+        """dir() should include exports before they are accessed."""
+        names = dir(agent_skills)
+
+        assert set(agent_skills.__all__) <= set(names)
+        assert "__version__" in names
+
+
+class TestSinglePackageInit:
+    """Guards against duplicated package __init__ bodies."""
+
+    def test_package_docstring_defined_once(self):
+        """Only agent_skills/__init__.py should carry the package docstring."""
+        package_root = Path(agent_skills.__file__).parent
+        marker = '"""Agent Skills Runtime - Lazy loading'
+
+        matches = [
+            path for path in package_root.rglob("*.py")
+            if marker in path.read_text(encoding="utf-8")
+        ]
+
+        assert matches == [package_root / "__init__.py"]
+
+    def test_all_has_no_duplicates(self):
+        """__all__ should list each export exactly once."""
+        assert len(agent_skills.__all__) == len(set(agent_skills.__all__))
+
+    def test_all_includes_agent_and_adapter_exports(self):
+        """__all__ should be the union including agent and adapter helpers."""
+        assert "AutonomousAgent" in agent_skills.__all__
+        assert "build_instructions_response" in agent_skills.__all__
+        assert "safe_tool_call" in agent_skills.__all__
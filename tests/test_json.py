@@ -0,0 +1,54 @@
+"""Tests for the shared JSON encoding helpers."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from agent_skills import _json
+
+
+@dataclass
+class _Point:
+    x: int
+    label: str
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def test_dumps_is_compact_utf8(backend):
+    """Test that output has no separator spaces and keeps non-ASCII text."""
+    assert _json.dumps({"a": [1, "é"], 2: None}) == '{"a":[1,"é"],"2":null}'.encode()
+
+
+def test_dumps_options(backend):
+    """Test the pretty and newline options."""
+    assert _json.dumps({"a": 1}, pretty=True) == b'{\n  "a": 1\n}'
+    assert _json.dumps({"a": 1}, newline=True) == b'{"a":1}\n'
+
+
+def test_dumps_encodes_dataclasses_before_default(backend):
+    """Test that dataclasses encode field by field and other values use default."""
+    encoded = _json.dumps({"p": _Point(1, "x"), "path": Path("/tmp")}, default=str)
+
+    assert encoded == b'{"p":{"x":1,"label":"x"},"path":"/tmp"}'
+
+
+def test_dumps_rejects_unknown_types_without_default(backend):
+    """Test that unsupported values raise TypeError."""
+    with pytest.raises(TypeError):
+        _json.dumps({"path": Path("/tmp")})
+
+
+def test_loads(backend):
+    """Test parsing from bytes and str, and the error type on bad input."""
+    assert _json.loads(b'{"a": [1]}') == {"a": [1]}
+    assert _json.loads('"é"') == "é"
+    with pytest.raises(ValueError):
+        _json.loads(b"{bad")
@@ -1,5 +1,6 @@
 """Unit tests for data models."""
 
+import json
 from datetime import datetime
 from pathlib import Path
 
@@ -65,7 +66,7 @@ class TestSkillDescriptor:
         assert descriptor.allowed_tools == ["skills.read"]
         assert descriptor.hash == "abc123"
         assert descriptor.mtime == 1234567890.0
-    
+
     def test_round_trip(self):
         """Test serialization round-trip."""
         original = SkillDescriptor(
@@ -180,7 +181,20 @@ class TestAuditEvent:
         assert data["bytes"] == 1234
         assert data["sha256"] == "abc123"
         assert data["detail"] == {"user": "test"}
-    
+
+    def test_to_dict_with_nanosecond_timestamp(self):
+        """Test integer time_ns timestamps serialize like datetimes."""
+        ts = datetime(2024, 1, 1, 12, 0, 0)
+        event = AuditEvent(
+            ts=int(ts.timestamp()) * 1_000_000_000,
+            kind="read",
+            skill="test-skill",
+        )
+
+        assert event.ts_iso == "2024-01-01T12:00:00"
+        assert event.to_dict()["ts"] == "2024-01-01T12:00:00"
+        assert AuditEvent.from_dict(event.to_dict()).ts == ts
+
     def test_from_dict(self):
         """Test deserialization from dict."""
         data = {
@@ -250,6 +264,35 @@ class TestSkillSession:
         assert "result" in session.artifacts
         assert session.artifacts["result"] == {"data": "value"}
     
+
+    def test_updates_use_given_timestamp(self):
+        """Test that an explicit now is used for updated_at."""
+        session = SkillSession(
+            session_id="test-123",
+            skill_name="test-skill",
+            state=SkillState.DISCOVERED,
+        )
+        now = datetime(2024, 1, 1, 12, 0, 0)
+
+        session.transition(SkillState.SELECTED, now)
+        assert session.updated_at == now
+
+        session.add_artifact("result", {}, now)
+        session.add_audit(AuditEvent(ts=now, kind="activate", skill="test-skill"), now)
+        assert session.updated_at == now
+
+    def test_artifact_bytes_retained(self):
+        """Test that only raw text/binary artifacts count as retained bytes."""
+        session = SkillSession(
+            session_id="test-123",
+            skill_name="test-skill",
+            state=SkillState.DISCOVERED,
+        )
+        session.add_artifact("text", "abc")
+        session.add_artifact("blob", b"\x00\x01")
+        session.add_artifact("ref", {"type": "resource_ref", "bytes": 1000})
+
+        assert session.artifact_bytes_retained == 5
     def test_add_audit(self):
         """Test adding audit events."""
         session = SkillSession(
@@ -308,6 +351,21 @@ class TestSkillSession:
         assert session.skill_name == "test-skill"
         assert session.state == SkillState.INSTRUCTIONS_LOADED
         assert session.artifacts == {"key": "value"}
+        assert session.cancel_requested is False
+
+    def test_cancel_round_trip(self):
+        """Test that a cancelled session stays cancelled after serialization."""
+        session = SkillSession(
+            session_id="test-123",
+            skill_name="test-skill",
+            state=SkillState.SELECTED,
+        )
+        session.cancel()
+
+        restored = SkillSession.from_dict(session.to_dict())
+
+        assert restored.cancel_requested is True
+        assert restored == session
 
 
 class TestToolResponse:
@@ -349,6 +407,57 @@ class TestToolResponse:
         assert isinstance(data["content"], str)
         assert data["type"] == "asset"
     
+    def test_to_dict_memoryview_content(self):
+        """Test that memoryview content is base64 encoded like bytes."""
+        import base64
+
+        response = ToolResponse(
+            ok=True,
+            type="asset",
+            skill="test-skill",
+            path="assets/data.bin",
+            content=memoryview(b"binary data"),
+            bytes=11,
+        )
+
+        data = response.to_dict()
+
+        assert data["content"] == base64.b64encode(b"binary data").decode("ascii")
+
+    def test_to_dict_encodes_the_content_not_the_digest(self):
+        """Test that responses sharing a sha256 still serialize their own content."""
+        import base64
+
+        def to_dict(content):
+            return ToolResponse(
+                ok=True, type="asset", skill="s", content=memoryview(content), sha256="same"
+            ).to_dict()
+
+        assert to_dict(b"first")["content"] == base64.b64encode(b"first").decode("ascii")
+        assert to_dict(b"second")["content"] == base64.b64encode(b"second").decode("ascii")
+
+    def test_to_json_bytes(self, monkeypatch):
+        """Test wire serialization with and without orjson."""
+        import json
+
+        from agent_skills import _json
+
+        response = ToolResponse(
+            ok=True,
+            type="asset",
+            skill="test-skill",
+            path="assets/data.bin",
+            content=b"binary data",
+            bytes=11,
+            meta={"note": "héllo"},
+        )
+
+        encoded = response.to_json_bytes()
+        assert json.loads(encoded) == response.to_dict()
+
+        monkeypatch.setattr(_json, "orjson", None)
+        assert json.loads(response.to_json_bytes()) == response.to_dict()
+
     def test_to_dict_dict_content(self):
         """Test serialization with dict content."""
         response = ToolResponse(
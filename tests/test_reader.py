@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from agent_skills.resources.reader import ResourceReader
+from agent_skills.resources.reader import ResourceReader, iter_files, utf8_len
 from agent_skills.models import ResourcePolicy
 from agent_skills.exceptions import ResourceTooLargeError
 
@@ -87,6 +87,29 @@ class TestResourceReaderTextFiles:
         assert len(content) <= 5
         assert truncated is True
     
+    def test_read_text_limit_counts_utf8_bytes(self, tmp_path, default_policy):
+        """Test that max_bytes limits encoded bytes and never splits a character."""
+        file_path = tmp_path / "unicode.txt"
+        file_path.write_text("日本語テキスト", encoding='utf-8')
+        reader = ResourceReader(default_policy)
+
+        content, truncated = reader.read_text(file_path, max_bytes=8)
+
+        assert content == "日本"
+        assert truncated is True
+        assert reader.get_session_bytes_read() == 6
+
+    def test_read_text_translates_newlines(self, tmp_path, default_policy):
+        """Test that CRLF and CR line endings read as LF, as in text mode."""
+        file_path = tmp_path / "crlf.txt"
+        file_path.write_bytes(b"one\r\ntwo\rthree\n")
+        reader = ResourceReader(default_policy)
+
+        content, truncated = reader.read_text(file_path)
+
+        assert content == "one\ntwo\nthree\n"
+        assert truncated is False
+
     def test_read_text_file_tracks_session_bytes(self, temp_text_file, default_policy):
         """Test that reading multiple files tracks total session bytes."""
         file_path, content_str = temp_text_file
@@ -145,6 +168,19 @@ class TestResourceReaderTextFiles:
         assert reader.get_session_bytes_read() == 0
 
 
+    def test_charge_counts_against_session_limit(self, strict_policy):
+        """Test that charge() adds to the session counter and enforces the limit."""
+        reader = ResourceReader(strict_policy)
+
+        assert reader.effective_max_bytes(10_000) == 500
+        reader.charge(400)
+        assert reader.get_session_bytes_read() == 400
+        assert reader.effective_max_bytes(10_000) == 100
+
+        with pytest.raises(ResourceTooLargeError):
+            reader.charge(101)
+
+
 class TestResourceReaderBinaryFiles:
     """Tests for reading binary files."""
     
@@ -209,6 +245,79 @@ class TestResourceReaderBinaryFiles:
                 reader.read_binary(file_path)
 
 
+class TestResourceReaderMappedBinaryFiles:
+    """Tests for memory-mapped binary reads."""
+
+    def test_map_binary_file(self, temp_binary_file, default_policy):
+        """Test that map_binary returns a view matching the file contents."""
+        file_path, expected_content = temp_binary_file
+        reader = ResourceReader(default_policy)
+
+        content, truncated = reader.map_binary(file_path)
+
+        assert isinstance(content, memoryview)
+        assert content.readonly
+        assert content == expected_content
+        assert truncated is False
+        assert reader.get_session_bytes_read() == len(expected_content)
+
+    def test_map_binary_file_with_custom_max_bytes(self, temp_binary_file, default_policy):
+        """Test that map_binary truncates to max_bytes like read_binary."""
+        file_path, full_content = temp_binary_file
+        reader = ResourceReader(default_policy)
+
+        content, truncated = reader.map_binary(file_path, max_bytes=3)
+
+        assert content == full_content[:3]
+        assert truncated is True
+        assert reader.get_session_bytes_read() == 3
+
+    def test_map_empty_binary_file(self, default_policy, tmp_path):
+        """Test that empty files map to an empty view."""
+        file_path = tmp_path / "empty.bin"
+        file_path.write_bytes(b"")
+        reader = ResourceReader(default_policy)
+
+        content, truncated = reader.map_binary(file_path)
+
+        assert content == b""
+        assert truncated is False
+
+    def test_map_binary_copies_small_files(self, temp_binary_file, default_policy):
+        """Test that small files are read into memory rather than mapped."""
+        file_path, _ = temp_binary_file
+        reader = ResourceReader(default_policy)
+
+        content, _ = reader.map_binary(file_path)
+
+        assert isinstance(content.obj, bytes)
+
+    def test_map_binary_maps_large_files(self, tmp_path):
+        """Test that files of 1 MiB and more are memory-mapped."""
+        import mmap
+
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(b"\x01" * (1 << 20))
+        reader = ResourceReader(
+            ResourcePolicy(binary_max_bytes=2 << 20, max_total_bytes_per_session=2 << 20)
+        )
+
+        content, truncated = reader.map_binary(file_path)
+
+        assert isinstance(content.obj, mmap.mmap)
+        assert len(content) == 1 << 20
+        assert truncated is False
+
+    def test_map_binary_file_exceeds_session_limit(self, temp_binary_file, strict_policy):
+        """Test that mapped reads count against the session byte limit."""
+        file_path, _ = temp_binary_file
+        reader = ResourceReader(strict_policy)
+
+        with pytest.raises(ResourceTooLargeError):
+            for _ in range(100):
+                reader.map_binary(file_path)
+
+
 class TestResourceReaderMixedReads:
     """Tests for mixed text and binary reads."""
     
@@ -231,6 +340,33 @@ class TestResourceReaderMixedReads:
         assert bytes_after_binary == expected_total
         assert bytes_after_binary > bytes_after_text
 
+    def test_reads_reuse_pooled_buffer(self, tmp_path, default_policy, monkeypatch):
+        """Test that successive text reads on a thread share one buffer, with exact results."""
+        from agent_skills.resources import reader as reader_module
+
+        allocated = []
+        real_pooled_buffer = reader_module._pooled_buffer
+
+        def pooled_buffer(size):
+            pool = getattr(reader_module._buffer_pool, "buffers", [])
+            allocated.append(not pool or len(pool[-1]) < size)
+            return real_pooled_buffer(size)
+
+        monkeypatch.setattr(reader_module, "_pooled_buffer", pooled_buffer)
+        big = tmp_path / "big.txt"
+        big.write_text("x" * 4096)
+        small = tmp_path / "small.bin"
+        small.write_bytes(b"\x00\x01")
+        reader = ResourceReader(default_policy)
+
+        assert reader.read_text(big) == ("x" * 4096, False)
+        assert reader.read_binary(small) == (b"\x00\x01", False)
+        assert reader.read_text(big, max_bytes=10) == ("x" * 10, True)
+
+        # read_binary() reads straight into its result, without a pooled buffer
+        assert len(allocated) == 2
+        assert allocated[1:] == [False]
+
 
 class TestResourceReaderSHA256:
     """Tests for SHA256 hash computation."""
@@ -268,6 +404,58 @@ class TestResourceReaderSHA256:
         assert hash_value == expected_hash
 
 
+class TestUtf8Len:
+    """Test UTF-8 length helper."""
+
+    @pytest.mark.parametrize("text", ["", "plain ascii", "café", "日本語", "emoji 🎉"])
+    def test_matches_encoded_length(self, text):
+        """Test that utf8_len agrees with len(text.encode())."""
+        assert utf8_len(text) == len(text.encode("utf-8"))
+
+    def test_session_counter_uses_encoded_length(self, tmp_path):
+        """Test that non-ASCII reads count bytes, not characters."""
+        file_path = tmp_path / "unicode.txt"
+        file_path.write_text("日本語", encoding="utf-8")
+        reader = ResourceReader(ResourcePolicy())
+
+        reader.read_text(file_path)
+
+        assert reader.session_bytes_read == 9
+
+
+class TestIterFiles:
+    """Test the scandir-based file walker."""
+
+    def test_matches_rglob_order(self, tmp_path):
+        """Test that files come out in Path.rglob pre-order."""
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "c").mkdir()
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b" / "b.txt").write_text("b")
+        (tmp_path / "b" / "c" / "c.txt").write_text("c")
+        (tmp_path / "d").mkdir()
+        (tmp_path / "d" / "d.txt").write_text("d")
+
+        expected = [str(p) for p in tmp_path.rglob("*") if p.is_file()]
+
+        assert [entry.path for entry in iter_files(tmp_path)] == expected
+
+    def test_skips_symlinked_directories(self, tmp_path):
+        """Test that file symlinks are yielded but directory symlinks are not entered."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "file.txt").write_text("x")
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+        (tmp_path / "alias.txt").symlink_to(tmp_path / "real" / "file.txt")
+
+        names = sorted(entry.name for entry in iter_files(tmp_path))
+
+        assert names == ["alias.txt", "file.txt"]
+
+    def test_missing_root_yields_nothing(self, tmp_path):
+        """Test that an unreadable root is skipped rather than raising."""
+        assert list(iter_files(tmp_path / "missing")) == []
+
+
 class TestResourceReaderEdgeCases:
     """Tests for edge cases."""
     
@@ -592,3 +780,167 @@ class TestFullTextSearcher:
         assert len(results) == 1
         assert results[0]['context'] == "test line"
         assert not results[0]['context'].endswith('\n')
+
+    def test_search_counts_crlf_and_cr_lines(self, tmp_path):
+        """Test that line numbers follow universal newlines."""
+        from agent_skills.resources.reader import FullTextSearcher
+
+        test_dir = tmp_path / "test"
+        test_dir.mkdir()
+        (test_dir / "test.txt").write_bytes(b"one\r\ntwo\rthree match\r\n")
+        (test_dir / "other.txt").write_text("nothing here\n", encoding='utf-8')
+
+        searcher = FullTextSearcher(use_ripgrep=False)
+        results = searcher.search(test_dir, "MATCH")
+
+        assert results == [{'path': "test.txt", 'line_num': 3, 'context': "three match"}]
+
+    def test_search_reads_ahead_in_walk_order(self, tmp_path, monkeypatch):
+        """Test that prefetched files are scanned in walk order and stop early."""
+        from agent_skills.resources import reader as reader_module
+        from agent_skills.resources.reader import FullTextSearcher
+
+        test_dir = tmp_path / "test"
+        test_dir.mkdir()
+        for i in range(40):
+            (test_dir / f"f{i:02}.txt").write_text(f"match {i}\n", encoding='utf-8')
+        read = []
+        real_read = reader_module._read_text_file
+        monkeypatch.setattr(
+            reader_module,
+            "_read_text_file",
+            lambda path: read.append(path) or real_read(path),
+        )
+
+        searcher = FullTextSearcher(use_ripgrep=False)
+        results = searcher.search(test_dir, "match", max_results=3)
+
+        walk_order = [str(p.relative_to(test_dir)) for p in test_dir.rglob("*")]
+        assert [r['path'] for r in results] == walk_order[:3]
+        assert len(read) < 40
+
+    def test_search_scans_whole_files(self, tmp_path):
+        """Test that the Python scan finds matches past the pooled buffer size."""
+        from agent_skills.resources.reader import FullTextSearcher
+
+        test_dir = tmp_path / "test"
+        test_dir.mkdir()
+        filler = ("x" * 99 + "\n") * 20_000  # 2 MB
+        (test_dir / "big.txt").write_text("early\n" + filler + "late\n", encoding='utf-8')
+
+        searcher = FullTextSearcher(use_ripgrep=False)
+
+        assert [r['line_num'] for r in searcher.search(test_dir, "early")] == [1]
+        assert [r['line_num'] for r in searcher.search(test_dir, "late")] == [20_002]
+
+    def test_search_from_a_saturated_pool_does_not_deadlock(self, tmp_path, monkeypatch):
+        """Test that a search running on the only pool worker reads its files inline."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from agent_skills.resources import reader as reader_module
+        from agent_skills.resources.reader import FullTextSearcher
+
+        test_dir = tmp_path / "test"
+        test_dir.mkdir()
+        for i in range(20):
+            (test_dir / f"f{i:02}.txt").write_text(f"line {i}\n", encoding='utf-8')
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            monkeypatch.setattr(reader_module, "get_tool_executor", lambda: pool)
+            searcher = FullTextSearcher(use_ripgrep=False)
+            future = pool.submit(searcher.search, test_dir, "line 19")
+
+            assert [r['path'] for r in future.result(timeout=10)] == ["f19.txt"]
+
+    def test_search_reports_each_line_once_and_escapes_query(self, tmp_path):
+        """Test that repeated hits on a line yield one result and queries are literal."""
+        from agent_skills.resources.reader import FullTextSearcher
+
+        test_dir = tmp_path / "test"
+        test_dir.mkdir()
+        (test_dir / "test.txt").write_text("a.b a.b\naxb\n\nlast a.B", encoding='utf-8')
+
+        searcher = FullTextSearcher(use_ripgrep=False)
+        results = searcher.search(test_dir, "a.b")
+
+        assert [(r['line_num'], r['context']) for r in results] == [
+            (1, "a.b a.b"),
+            (4, "last a.B"),
+        ]
+
+
+class TestFullTextSearcherRipgrep:
+    """Tests for the ripgrep-backed FullTextSearcher path."""
+
+    @staticmethod
+    def _rg_output(directory, matches):
+        """Build ripgrep --json output for (relative path, line, text) tuples."""
+        import json
+
+        lines = [json.dumps({"type": "begin", "data": {}})]
+        for rel_path, line_num, text in matches:
+            lines.append(json.dumps({
+                "type": "match",
+                "data": {
+                    "path": {"text": str(directory / rel_path)},
+                    "lines": {"text": text + "\n"},
+                    "line_number": line_num,
+                },
+            }))
+        lines.append(json.dumps({"type": "summary", "data": {}}))
+        return "\n".join(lines).encode("utf-8")
+
+    def _searcher(self):
+        from agent_skills.resources.reader import FullTextSearcher
+
+        searcher = FullTextSearcher()
+        searcher._rg = "/usr/bin/rg"
+        return searcher
+
+    def test_parses_ripgrep_matches(self, tmp_path):
+        """Test that ripgrep JSON matches become SearchResult dicts."""
+        import subprocess
+        from unittest.mock import patch
+
+        stdout = self._rg_output(tmp_path, [
+            ("a.md", 2, "Auth flow"),
+            ("sub/b.txt", 7, "more auth"),
+        ])
+        completed = subprocess.CompletedProcess([], 0, stdout=stdout, stderr=b"")
+
+        with patch("subprocess.run", return_value=completed) as run:
+            results = self._searcher().search(tmp_path, "auth")
+
+        assert results == [
+            {"path": "a.md", "line_num": 2, "context": "Auth flow"},
+            {"path": str(Path("sub") / "b.txt"), "line_num": 7, "context": "more auth"},
+        ]
+        cmd = run.call_args.args[0]
+        assert "--fixed-strings" in cmd and "--ignore-case" in cmd
+        assert cmd[-2:] == ["auth", str(tmp_path)]
+
+    def test_caps_results_across_files(self, tmp_path):
+        """Test that max_results applies to the total, not per file."""
+        import subprocess
+        from unittest.mock import patch
+
+        stdout = self._rg_output(
+            tmp_path, [(f"f{i}.md", 1, "match") for i in range(5)]
+        )
+        completed = subprocess.CompletedProcess([], 0, stdout=stdout, stderr=b"")
+
+        with patch("subprocess.run", return_value=completed):
+            results = self._searcher().search(tmp_path, "match", max_results=3)
+
+        assert len(results) == 3
+
+    def test_falls_back_when_ripgrep_fails(self, tmp_path):
+        """Test that the Python scan is used if ripgrep cannot run."""
+        from unittest.mock import patch
+
+        (tmp_path / "doc.md").write_text("needle here\n", encoding="utf-8")
+
+        with patch("subprocess.run", side_effect=OSError("no rg")):
+            results = self._searcher().search(tmp_path, "NEEDLE")
+
+        assert results == [{"path": "doc.md", "line_num": 1, "context": "needle here"}]
@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 from agent_skills.resources import PathResolver
+from agent_skills.resources.resolver import resolve_within
 from agent_skills.exceptions import PathTraversalError, PolicyViolationError
 
 
@@ -256,3 +257,58 @@ class TestPathResolver:
         
         # Should still work correctly
         assert resolved.is_relative_to(skill_root)
+
+
+class TestResolveWithin:
+    """Test resolve_within() for the file tools."""
+
+    def test_relative_path_inside_root(self, tmp_path, monkeypatch):
+        """Relative paths under the root resolve, even with dots in names."""
+        monkeypatch.chdir(tmp_path)
+        resolved = resolve_within("foo..bar/out.txt", roots=(tmp_path.resolve(),))
+        assert resolved.parent.name == "foo..bar"
+
+    def test_relative_path_escaping_root(self, tmp_path):
+        """Relative paths that climb out of every root are rejected."""
+        with pytest.raises(PathTraversalError):
+            resolve_within("../../../etc/passwd", roots=(tmp_path,))
+
+    def test_symlink_escaping_root(self, tmp_path, monkeypatch):
+        """A symlink pointing outside the root is rejected."""
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "link").symlink_to(tmp_path)
+        monkeypatch.chdir(root)
+
+        with pytest.raises(PathTraversalError):
+            resolve_within("link/secret.txt", roots=(root,))
+
+    def test_absolute_path(self, tmp_path):
+        """Absolute paths are accepted unless they contain '..'."""
+        assert resolve_within(tmp_path / "a.txt", roots=()) == tmp_path.resolve() / "a.txt"
+        with pytest.raises(PathTraversalError):
+            resolve_within(f"{tmp_path}/../etc", roots=())
+
+    def test_absolute_path_left_unresolved(self, tmp_path):
+        """resolve_absolute=False returns absolute paths as given, still checking '..'."""
+        (tmp_path / "link").symlink_to(tmp_path)
+
+        path = tmp_path / "link" / "a.txt"
+        assert resolve_within(path, roots=(), resolve_absolute=False) == path
+        with pytest.raises(PathTraversalError):
+            resolve_within(f"{tmp_path}/../etc", roots=(), resolve_absolute=False)
+
+    def test_default_root_follows_working_directory(self, tmp_path, monkeypatch):
+        """Without explicit roots, the working directory at call time is the root."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        assert resolve_within("out.txt") == first.resolve() / "out.txt"
+
+        monkeypatch.chdir(second)
+        assert resolve_within("out.txt") == second.resolve() / "out.txt"
+        with pytest.raises(PathTraversalError):
+            resolve_within("../first/out.txt")
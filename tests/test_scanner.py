@@ -193,3 +193,37 @@ def test_scanner_does_not_find_skill_md_in_subdirectories_as_separate_skills(tem
     assert len(skills) == 2
     assert parent_skill in skills
     assert nested_skill in skills
+
+
+def test_scanner_skips_skill_resource_directories(temp_dir: Path):
+    """Test that references/, assets/ and scripts/ of a skill are not scanned."""
+    skill_dir = temp_dir / "skill"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("---\nname: skill\ndescription: Test\n---\n")
+    # A stray SKILL.md inside a resource directory is content, not a skill
+    (skill_dir / "references" / "SKILL.md").write_text("Reference copy")
+
+    # Directories named like resource dirs outside a skill are still scanned
+    other = temp_dir / "assets" / "other-skill"
+    other.mkdir(parents=True)
+    (other / "SKILL.md").write_text("---\nname: other-skill\ndescription: Test\n---\n")
+
+    scanner = SkillScanner()
+    skills = scanner.scan([temp_dir])
+
+    assert sorted(skills) == sorted([skill_dir, other])
+
+
+def test_scanner_preserves_root_order(temp_dir: Path):
+    """Test that skills from multiple roots are returned in root order."""
+    roots = []
+    for name in ["c", "a", "b"]:
+        skill_dir = temp_dir / name / "skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: Test\n---\n")
+        roots.append(temp_dir / name)
+
+    scanner = SkillScanner()
+    skills = scanner.scan(roots)
+
+    assert skills == [root / "skill" for root in roots]
@@ -0,0 +1,273 @@
+"""Unit tests for SkillSearchIndex."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.discovery import search as search_module
+from agent_skills.discovery.search import ReferenceIndex, SkillSearchIndex
+from agent_skills.models import SkillDescriptor
+
+
+def _descriptor(name: str, description: str) -> SkillDescriptor:
+    return SkillDescriptor(name=name, description=description, path=Path(f"/skills/{name}"))
+
+
+@pytest.fixture
+def descriptors():
+    return [
+        _descriptor("pdf-tools", "Convert CSV reports into PDF documents"),
+        _descriptor("csv-processor", "Clean and transform tabular data"),
+        _descriptor("web-fetcher", "Download pages over HTTP"),
+    ]
+
+
+def test_search_ranks_name_matches_first(descriptors):
+    """Test that a hit in the name outranks a hit in the description."""
+    index = SkillSearchIndex()
+    index.build(descriptors)
+
+    results = index.search("csv")
+
+    assert [d.name for d in results] == ["csv-processor", "pdf-tools"]
+
+
+def test_search_matches_token_prefixes(descriptors):
+    """Test that each query word matches as a prefix, case-insensitively."""
+    index = SkillSearchIndex()
+    index.build(descriptors)
+
+    assert [d.name for d in index.search("DOWNLOAD pag")] == ["web-fetcher"]
+
+
+def test_search_falls_back_to_substring(descriptors):
+    """Test that mid-word matches are still found when the index has no hit."""
+    index = SkillSearchIndex()
+    index.build(descriptors)
+
+    assert [d.name for d in index.search("etch")] == ["web-fetcher"]
+    assert index.search("nothing-like-this") == []
+
+
+def test_search_keeps_substring_matches_alongside_index_hits():
+    """Test that mid-word matches are kept even when the index has hits."""
+    index = SkillSearchIndex()
+    index.build([
+        _descriptor("bigdata-tool", "Crunch numbers"),
+        _descriptor("data-processor", "Process files"),
+    ])
+
+    assert [d.name for d in index.search("data")] == ["data-processor", "bigdata-tool"]
+    assert [d.name for d in index.search("data", limit=1)] == ["data-processor"]
+
+
+def test_substring_fallback_casefolds_and_stays_within_fields():
+    """Test that the fallback uses casefold and never matches across fields."""
+    index = SkillSearchIndex()
+    index.build([
+        _descriptor("strasse-maps", "Street maps"),
+        _descriptor("ab", "cd"),
+        _descriptor("gross", "Handles Größe conversions"),
+    ])
+
+    assert [d.name for d in index.search("ÖSSE")] == ["gross"]
+    assert [d.name for d in index.search("TRAẞ")] == ["strasse-maps"]
+    assert index.search("bc") == []
+
+
+def test_search_respects_limit(descriptors):
+    """Test that limit caps the number of results."""
+    index = SkillSearchIndex()
+    index.build(descriptors)
+
+    assert len(index.search("csv", limit=1)) == 1
+
+
+def test_build_replaces_previous_contents(descriptors):
+    """Test that rebuilding drops skills that are gone."""
+    index = SkillSearchIndex()
+    index.build(descriptors)
+    index.build(descriptors[:1])
+
+    assert index.search("csv-processor") == []
+
+
+def test_search_without_fts5(descriptors, monkeypatch):
+    """Test that the substring scan is used when FTS5 is unavailable."""
+    monkeypatch.setattr(search_module, "FTS5_AVAILABLE", False)
+    index = SkillSearchIndex()
+    index.build(descriptors)
+
+    assert [d.name for d in index.search("csv")] == ["pdf-tools", "csv-processor"]
+
+
+@pytest.fixture
+def references(temp_dir: Path) -> Path:
+    refs = temp_dir / "references"
+    refs.mkdir()
+    (refs / "api.md").write_text(
+        "# API\n\nAuthentication uses a bearer token.\nRate limits apply per token.\n"
+    )
+    (refs / "guide.md").write_text("Getting started\nRefresh the token daily.\n")
+    return refs
+
+
+def test_reference_index_ranks_lines(references):
+    """Test that keyword search returns matching lines in SearchResult form."""
+    index = ReferenceIndex()
+
+    results = index.search(references, "authentication token")
+
+    assert results == [
+        {"path": "api.md", "line_num": 3, "context": "Authentication uses a bearer token."}
+    ]
+    assert {r["path"] for r in index.search(references, "token")} == {"api.md", "guide.md"}
+
+
+def test_reference_index_reuses_index_until_files_change(references, monkeypatch):
+    """Test that unchanged directories are not re-read and changed ones are."""
+    index = ReferenceIndex()
+    index.search(references, "token")
+
+    opened = []
+    real_open = open
+    monkeypatch.setattr(
+        "builtins.open", lambda *a, **kw: opened.append(a[0]) or real_open(*a, **kw)
+    )
+    index.search(references, "limits")
+    assert opened == []
+
+    (references / "new.md").write_text("Webhooks are signed.\n")
+    assert index.search(references, "webhooks")[0]["path"] == "new.md"
+
+
+def test_reference_index_memoizes_results_until_files_change(references, monkeypatch):
+    """Test that repeated queries skip ranking and the substring fallback."""
+    index = ReferenceIndex()
+    first = index.search(references, "thentic")
+
+    monkeypatch.setattr(index, "_keyword_ranking", None)
+    monkeypatch.setattr(index._searcher, "search", None)
+    assert index.search(references, "thentic") == first
+    monkeypatch.undo()
+
+    (references / "api.md").write_text("Nothing relevant.\n")
+    assert index.search(references, "thentic") == []
+
+
+def test_reference_index_memo_is_not_shared_with_callers(references):
+    """Test that mutating returned results does not corrupt the memo."""
+    index = ReferenceIndex()
+    first = index.search(references, "token")
+    expected = [dict(r) for r in first]
+
+    first[0]["context"] = "changed"
+    first.clear()
+
+    assert index.search(references, "token") == expected
+
+
+def test_reference_index_memo_evicts_least_recently_used(references, monkeypatch):
+    """Test that a full memo drops its oldest entry rather than everything."""
+    monkeypatch.setattr(ReferenceIndex, "RESULT_CACHE_SIZE", 2)
+    index = ReferenceIndex()
+    index.search(references, "token")
+    index.search(references, "limits")
+    index.search(references, "token")
+    index.search(references, "daily")
+
+    monkeypatch.setattr(index, "_keyword_ranking", None)
+    assert index.search(references, "token")
+    with pytest.raises(TypeError):
+        index.search(references, "limits")
+
+
+def test_reference_index_warm_indexes_ahead_of_search(references, monkeypatch):
+    """Test that warm() builds the index so the first search reads no files."""
+    index = ReferenceIndex()
+    index.warm(references)
+    index.warm(references.parent / "missing")
+
+    opened = []
+    real_open = open
+    monkeypatch.setattr(
+        "builtins.open", lambda *a, **kw: opened.append(a[0]) or real_open(*a, **kw)
+    )
+    assert index.search(references, "limits")[0]["path"] == "api.md"
+    assert opened == []
+
+def test_reference_index_falls_back_to_substring(references):
+    """Test that mid-word queries still match via the substring scan."""
+    index = ReferenceIndex()
+
+    assert index.search(references, "thentic")[0]["line_num"] == 3
+
+
+def test_reference_index_keeps_substring_matches_alongside_ranked_hits(references):
+    """Test that mid-word matches follow the ranked hits instead of being dropped."""
+    (references / "headers.md").write_text("Send it as a bearertoken header.\n")
+    index = ReferenceIndex()
+
+    results = index.search(references, "token")
+
+    keys = [(r["path"], r["line_num"]) for r in results]
+    assert keys[-1] == ("headers.md", 1)
+    assert len(keys) == len(set(keys)) == 4
+
+
+def test_reference_index_searches_directories_concurrently(temp_dir):
+    """Test that indexing one directory does not block searches of another."""
+    import threading
+
+    slow, fast = temp_dir / "slow", temp_dir / "fast"
+    for directory, text in ((slow, "slow line\n"), (fast, "fast line\n")):
+        directory.mkdir()
+        (directory / "notes.md").write_text(text)
+
+    started, release = threading.Event(), threading.Event()
+
+    def embed(texts):
+        if any("slow" in t for t in texts):
+            started.set()
+            release.wait(5)
+        return [[1.0] for _ in texts]
+
+    index = ReferenceIndex(embedder=embed)
+    warming = threading.Thread(target=index.warm, args=(slow,))
+    warming.start()
+    try:
+        assert started.wait(5)
+        assert index.search(fast, "fast")[0]["path"] == "notes.md"
+        assert warming.is_alive()
+    finally:
+        release.set()
+        warming.join()
+    assert index.search(slow, "slow")[0]["context"] == "slow line"
+
+
+def test_reference_index_fuses_semantic_ranking(references):
+    """Test that an embedder's ranking is fused with the keyword ranking."""
+    def embed(texts):
+        # One dimension per keyword; "daily" and "schedule" are synonyms
+        return [
+            [float("daily" in t.lower() or "schedule" in t.lower()), float("limit" in t.lower())]
+            for t in texts
+        ]
+
+    index = ReferenceIndex(embedder=embed)
+
+    results = index.search(references, "token schedule")
+
+    assert results[0] == {
+        "path": "guide.md", "line_num": 2, "context": "Refresh the token daily."
+    }
+
+
+def test_reference_index_prune(references, temp_dir):
+    """Test that prune() drops directories outside the kept paths."""
+    index = ReferenceIndex()
+    index.search(references, "token")
+
+    index.prune([temp_dir / "elsewhere"])
+
+    assert index._directories == {}
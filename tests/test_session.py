@@ -5,7 +5,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from agent_skills.models import AuditEvent, SkillSession, SkillState
+from agent_skills.models import AuditEvent, ResourceContent, SkillSession, SkillState
 from agent_skills.runtime.session import SkillSessionManager
 
 
@@ -254,8 +254,203 @@ class TestSkillSessionManager:
         assert "key2" in retrieved2.artifacts
         assert "key2" not in retrieved1.artifacts
     
+    def test_cancel_session(self, manager):
+        """Test that cancelling a session flags it for later tool calls."""
+        session = manager.create_session("test-skill")
+
+        assert manager.cancel_session(session.session_id) is True
+        assert manager.get_session(session.session_id).cancel_requested is True
+        assert manager.cancel_session("nonexistent-id") is False
+
     def test_repository_reference(self, mock_repository):
         """Test that manager maintains reference to repository."""
         manager = SkillSessionManager(mock_repository)
         
         assert manager.repository is mock_repository
+
+
+class TestSessionWriteBatching:
+    """Tests for coalesced session write-back via mark_dirty()."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a manager with a long flush interval so tests flush explicitly."""
+        manager = SkillSessionManager(Mock(), flush_interval_s=60)
+        yield manager
+        manager.close()
+
+    def test_mark_dirty_defers_update(self, manager):
+        """Test that mark_dirty does not write back immediately."""
+        session = manager.create_session("test-skill")
+        manager.update_session = Mock(wraps=manager.update_session)
+
+        manager.mark_dirty(session)
+        manager.mark_dirty(session)
+
+        manager.update_session.assert_not_called()
+        manager.flush()
+        manager.update_session.assert_called_once_with(session)
+
+    def test_get_session_flushes_pending(self, manager):
+        """Test that reads observe sessions marked dirty."""
+        session = SkillSession(
+            session_id="pending",
+            skill_name="test-skill",
+            state=SkillState.SELECTED,
+        )
+
+        manager.mark_dirty(session)
+
+        assert manager.get_session("pending") is session
+        assert manager._dirty == {}
+
+    def test_close_flushes_pending(self, manager):
+        """Test that close writes back pending sessions."""
+        session = manager.create_session("test-skill")
+        manager.update_session = Mock()
+
+        manager.mark_dirty(session)
+        manager.close()
+
+        manager.update_session.assert_called_once_with(session)
+
+    def test_delete_discards_pending(self, manager):
+        """Test that a deleted session is not resurrected by a later flush."""
+        session = manager.create_session("test-skill")
+
+        manager.mark_dirty(session)
+        manager.delete_session(session.session_id)
+        manager.flush()
+
+        assert manager.get_session(session.session_id) is None
+
+    def test_timer_flushes_after_interval(self):
+        """Test that the background timer writes back dirty sessions."""
+        manager = SkillSessionManager(Mock(), flush_interval_s=0.01)
+        session = manager.create_session("test-skill")
+        manager.update_session = Mock()
+
+        manager.mark_dirty(session)
+        manager._flush_timer.join(timeout=1)
+
+        manager.update_session.assert_called_once_with(session)
+
+    def test_flushes_when_max_dirty_reached(self):
+        """Test that reaching max_dirty flushes without waiting for the timer."""
+        manager = SkillSessionManager(Mock(), flush_interval_s=60, max_dirty=2)
+        first = manager.create_session("first")
+        second = manager.create_session("second")
+        manager.update_session = Mock()
+
+        manager.mark_dirty(first)
+        manager.update_session.assert_not_called()
+        manager.mark_dirty(second)
+
+        assert manager.update_session.call_count == 2
+        assert manager._dirty == {}
+        assert manager._flush_timer is None
+
+
+class TestFetchArtifact:
+    """Tests for resolving resource-reference artifacts."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """Create a repository with one skill that has a reference file."""
+        from agent_skills.runtime.repository import SkillsRepository
+
+        skill_dir = tmp_path / "doc-skill"
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: doc-skill\ndescription: Docs\n---\n\n# Docs\n"
+        )
+        (skill_dir / "references" / "guide.md").write_text("Guide text\n")
+
+        repository = SkillsRepository(roots=[tmp_path])
+        repository.refresh()
+        return repository
+
+    def test_read_artifact_is_reference(self, repository):
+        """Test that ADK reads store a reference and resolve it on fetch."""
+        from agent_skills.adapters.adk import _handle_activate, _handle_read
+
+        manager = SkillSessionManager(repository)
+        activated = _handle_activate(repository, manager, {"name": "doc-skill"})
+        session_id = activated["meta"]["session_id"]
+
+        _handle_read(repository, manager, {
+            "name": "doc-skill",
+            "path": "guide.md",
+            "session_id": session_id,
+        })
+        session = manager.get_session(session_id)
+
+        artifact = session.artifacts["read_guide.md"]
+        assert artifact["type"] == "resource_ref"
+        assert artifact["path"] == "references/guide.md"
+        assert artifact["bytes"] == len("Guide text\n")
+        assert session.artifact_bytes_retained == 0
+        assert manager.fetch_artifact(session, "read_guide.md") == "Guide text\n"
+
+    def test_fetch_truncated_read(self, repository, tmp_path):
+        """Test that a truncated read is re-read with the same limit on fetch."""
+        from agent_skills.adapters.adk import _handle_activate, _handle_read
+
+        (tmp_path / "doc-skill" / "references" / "big.md").write_text("x" * 5000)
+        manager = SkillSessionManager(repository)
+        session_id = _handle_activate(
+            repository, manager, {"name": "doc-skill"}
+        )["meta"]["session_id"]
+        _handle_read(repository, manager, {
+            "name": "doc-skill",
+            "path": "references/big.md",
+            "max_bytes": 100,
+            "session_id": session_id,
+        })
+        session = manager.get_session(session_id)
+
+        assert manager.fetch_artifact(session, "read_references/big.md") == "x" * 100
+
+    def test_fetch_detects_changed_file(self, repository, tmp_path):
+        """Test that a reference to a since-modified file is rejected."""
+        from agent_skills.adapters.adk import _handle_activate, _handle_read
+
+        manager = SkillSessionManager(repository)
+        session_id = _handle_activate(
+            repository, manager, {"name": "doc-skill"}
+        )["meta"]["session_id"]
+        _handle_read(repository, manager, {
+            "name": "doc-skill",
+            "path": "references/guide.md",
+            "session_id": session_id,
+        })
+        session = manager.get_session(session_id)
+
+        (tmp_path / "doc-skill" / "references" / "guide.md").write_text("Changed\n")
+
+        with pytest.raises(ValueError, match="changed"):
+            manager.fetch_artifact(session, "read_references/guide.md")
+
+    def test_fetch_dispatches_on_path_prefix(self):
+        """Test that asset paths go to read_asset and others to read_reference."""
+        repository = Mock()
+        handle = repository.open.return_value
+        handle.load_asset.return_value = ResourceContent.from_content(b"PNG")
+        handle.load_reference.return_value = ResourceContent.from_content("Guide")
+        manager = SkillSessionManager(repository)
+        session = manager.create_session("test-skill")
+        for key, path in (("a", "assets/logo.png"), ("r", "references/guide.md")):
+            session.add_artifact(key, {"type": "resource_ref", "skill": "s", "path": path})
+
+        assert manager.fetch_artifact(session, "a") == b"PNG"
+        assert manager.fetch_artifact(session, "r") == "Guide"
+        handle.load_asset.assert_called_once_with("logo.png", max_bytes=None)
+        handle.load_reference.assert_called_once_with("guide.md", max_bytes=None)
+
+    def test_fetch_plain_artifact(self):
+        """Test that non-reference artifacts are returned unchanged."""
+        manager = SkillSessionManager(Mock())
+        session = manager.create_session("test-skill")
+        session.add_artifact("result", {"data": 1})
+
+        assert manager.fetch_artifact(session, "result") == {"data": 1}